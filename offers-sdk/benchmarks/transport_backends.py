@@ -0,0 +1,107 @@
+"""
+Compares the throughput and client CPU cost of the HTTP transport backends.
+
+A minimal keep-alive HTTP server runs in a separate process, so the client
+process's CPU time reflects only the transport under test. Each backend sends
+the same number of GET requests with the same concurrency.
+
+    cd offers-sdk && python -m benchmarks.transport_backends --requests 20000 --concurrency 64 [--uvloop]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import time
+import uuid
+
+from offers_sdk_applift.http import HTTP_BACKENDS, create_http_client, install_uvloop
+
+OFFERS_BODY = json.dumps(
+    [{"id": str(uuid.uuid4()), "price": 100 + i, "items_in_stock": i} for i in range(5)]
+).encode()
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: "
+    + str(len(OFFERS_BODY)).encode()
+    + b"\r\n\r\n"
+    + OFFERS_BODY
+)
+
+
+async def _serve_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    await reader.readexactly(int(line.split(b":")[1]))
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def _run_server(sock: socket.socket) -> None:
+    async def main():
+        server = await asyncio.start_server(_serve_connection, sock=sock)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def _bench(backend: str, base_url: str, requests: int, concurrency: int) -> dict:
+    client = create_http_client(backend, base_url, max_connections=concurrency)
+    product_id = uuid.uuid4()
+    # Open the connections before measuring.
+    await asyncio.gather(*(client.get(f"/products/{product_id}/offers") for _ in range(concurrency)))
+
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            response = await client.get(f"/products/{product_id}/offers", headers={"Bearer": "token"})
+            response.json()
+
+    wall_started, cpu_started = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall, cpu = time.perf_counter() - wall_started, time.process_time() - cpu_started
+    await client.aclose()
+    return {
+        "backend": backend,
+        "requests_per_second": requests / wall,
+        "cpu_us_per_request": cpu / requests * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--uvloop", action="store_true", help="Run the client on uvloop (if installed).")
+    args = parser.parse_args()
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(1024)
+    base_url = f"http://127.0.0.1:{sock.getsockname()[1]}/api/v1"
+    server = multiprocessing.Process(target=_run_server, args=(sock,), daemon=True)
+    server.start()
+
+    loop_name = "uvloop" if args.uvloop and install_uvloop() else "asyncio"
+    try:
+        print(f"{args.requests} requests, concurrency {args.concurrency}, {loop_name} event loop")
+        print(f"{'backend':<10}{'req/s':>12}{'CPU µs/req':>14}")
+        for backend in HTTP_BACKENDS:
+            result = asyncio.run(_bench(backend, base_url, args.requests, args.concurrency))
+            print(f"{result['backend']:<10}{result['requests_per_second']:>12.0f}{result['cpu_us_per_request']:>14.1f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
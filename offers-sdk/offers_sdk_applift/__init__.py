@@ -23,9 +23,25 @@ from .exceptions import (
     APIError,
     ProductNotFoundError,
     ProductAlreadyFoundError,
+    DeadlineExceededError,
+)
+
+from .scheduling import (
+    Priority,
+    Deadline,
+    RequestScheduler,
+)
+
+from .journal import WriteBehindRegistrar
+
+from .aggregation import (
+    TopOffersAggregator,
+    RankedOffer,
 )
 
 __all__ = ['ProductAlreadyFoundError', 'ProductNotFoundError', 'BaseOffersSDKError', 'AuthenticationError', 
            'APIError', 'AuthenticationError', 'BaseOffersSDKError', 'HttpxOffersClient', 'SyncOffersClient',
            'Product', 'Offer', 'AsyncHttpClientInterface', 'OffersClientInterface', 'SyncOffersClientInterface', 
-           'TokenManagerInterface', 'get_settings']
+           'TokenManagerInterface', 'get_settings', 'DeadlineExceededError', 'Priority', 'Deadline',
+           'RequestScheduler', 'TopOffersAggregator', 'RankedOffer',
+           'WriteBehindRegistrar']
@@ -0,0 +1,4 @@
+from .top_offers_aggregator import TopOffersAggregator, RankedOffer
+
+
+__all__ = ['TopOffersAggregator', 'RankedOffer']
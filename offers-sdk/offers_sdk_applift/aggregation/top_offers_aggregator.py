@@ -0,0 +1,181 @@
+import heapq
+import itertools
+import uuid
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from offers_sdk_applift.exceptions import DeadlineExceededError, ProductNotFoundError
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.models import Offer
+from offers_sdk_applift.scheduling import Deadline, Priority
+
+
+# (price, product_id, offer_id, offer): ordered by price, ties broken deterministically.
+_Entry = Tuple[int, uuid.UUID, uuid.UUID, Offer]
+
+
+class RankedOffer(NamedTuple):
+    """An offer together with the product it belongs to."""
+    product_id: uuid.UUID
+    offer: Offer
+
+
+class TopOffersAggregator:
+    """
+    Maintains the K cheapest offers across many products as offers arrive.
+
+    Each product keeps only its own cheapest `per_product_k` offers that pass
+    the filters, so memory is bounded by products x `per_product_k`. The global
+    top K is updated in O(K) when a refresh only adds or improves offers, also
+    for products already in the ranking; a full merge over the per-product
+    lists is needed only when a ranked offer disappears or gets more expensive
+    and offers from outside the ranking may take its place.
+    """
+
+    def __init__(
+        self,
+        k: int = 10,
+        per_product_k: Optional[int] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        in_stock_only: bool = True,
+    ):
+        """
+        Args:
+            k: The number of offers in the global ranking.
+            per_product_k: The number of offers kept per product; this also caps
+                how many offers of one product can appear in the global ranking.
+                Defaults to `k`.
+            min_price: Ignore offers cheaper than this.
+            max_price: Ignore offers more expensive than this.
+            in_stock_only: Ignore offers with no items in stock.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        self._k = k
+        self._per_product_k = per_product_k or k
+        self._min_price = min_price
+        self._max_price = max_price
+        self._in_stock_only = in_stock_only
+        self._per_product: Dict[uuid.UUID, List[_Entry]] = {}
+        self._top: Optional[List[_Entry]] = []
+
+    def update(self, product_id: uuid.UUID, offers: Iterable[Offer]) -> bool:
+        """
+        Replaces the offers known for a product.
+
+        Returns:
+            True if the global top K changed.
+        """
+        new = heapq.nsmallest(
+            self._per_product_k,
+            ((offer.price, product_id, offer.id, offer) for offer in offers if self._accepts(offer)),
+        )
+        old = self._per_product.pop(product_id, [])
+        if new:
+            self._per_product[product_id] = new
+        if old == new:
+            return False
+
+        if self._top is None:
+            return True
+        if any(entry[1] == product_id for entry in self._top):
+            # Swap our ranked offers for the new ones. Everything outside the
+            # ranking sorts after its last entry, so the merge is exact unless
+            # it comes up short or its last entry sorts after the old one.
+            merged = heapq.nsmallest(
+                self._k, itertools.chain((entry for entry in self._top if entry[1] != product_id), new)
+            )
+            if len(self._top) < self._k or (len(merged) == self._k and merged[-1] <= self._top[-1]):
+                changed = merged != self._top
+                self._top = merged
+                return changed
+            # Offers from outside the ranking may move in: rebuild lazily.
+            self._top = None
+            return True
+        if not new or (len(self._top) == self._k and new[0] >= self._top[-1]):
+            return False
+        self._top = heapq.nsmallest(self._k, itertools.chain(self._top, new))
+        return True
+
+    def remove(self, product_id: uuid.UUID) -> bool:
+        """Forgets a product. Returns True if the global top K changed."""
+        return self.update(product_id, ())
+
+    def top(self) -> List[RankedOffer]:
+        """The K cheapest offers across all products, cheapest first."""
+        if self._top is None:
+            self._top = heapq.nsmallest(self._k, itertools.chain.from_iterable(self._per_product.values()))
+        return [RankedOffer(product_id, offer) for _, product_id, _, offer in self._top]
+
+    def top_for_product(self, product_id: uuid.UUID) -> List[Offer]:
+        """The cheapest offers of one product, cheapest first."""
+        return [offer for *_, offer in self._per_product.get(product_id, [])]
+
+    async def consume(
+        self, results: AsyncIterable[Tuple[uuid.UUID, Union[List[Offer], Exception]]]
+    ) -> AsyncIterator[List[RankedOffer]]:
+        """
+        Applies results as they arrive, yielding the new ranking after each change.
+
+        Products reported as not found are removed; other errors leave the
+        product's previous offers in place.
+        """
+        async for product_id, result in results:
+            if isinstance(result, ProductNotFoundError):
+                changed = self.remove(product_id)
+            elif isinstance(result, Exception):
+                continue
+            else:
+                changed = self.update(product_id, result)
+            if changed:
+                yield self.top()
+
+    async def refresh(
+        self,
+        client: HttpxOffersClient,
+        product_ids: Iterable[uuid.UUID],
+        *,
+        concurrency: int = 10,
+        priority: Priority = Priority.NORMAL,
+        timeout: Optional[float] = None,
+    ) -> List[RankedOffer]:
+        """
+        Fetches offers for `product_ids` and folds them into the ranking.
+
+        If `timeout` expires first, the ranking as of that moment is returned
+        and the remaining fetches are cancelled, so one slow product never
+        holds up the answer.
+
+        Args:
+            client: The client to fetch offers with.
+            product_ids: The products to (re)fetch.
+            concurrency: The maximum number of requests in flight.
+            priority: Admission priority of every request.
+            timeout: Seconds to wait for results, or None to wait for all of them.
+        """
+        deadline = Deadline.after(timeout)
+
+        async def ids() -> AsyncIterator[uuid.UUID]:
+            for product_id in product_ids:
+                yield product_id
+
+        stream = client.stream_offers(ids(), concurrency=concurrency, priority=priority)
+        updates = self.consume(stream)
+        try:
+            while True:
+                await deadline.wait_for(updates.__anext__(), "while waiting for offers")
+        except (StopAsyncIteration, DeadlineExceededError):
+            pass
+        finally:
+            await updates.aclose()
+            await stream.aclose()
+        return self.top()
+
+    def _accepts(self, offer: Offer) -> bool:
+        if self._in_stock_only and offer.items_in_stock <= 0:
+            return False
+        if self._min_price is not None and offer.price < self._min_price:
+            return False
+        if self._max_price is not None and offer.price > self._max_price:
+            return False
+        return True
@@ -23,6 +23,7 @@ class TokenManager(TokenManagerInterface):
         http_client: httpx.AsyncClient,
         expiration_seconds: int = 300,  
         buffer_seconds: int = 30,
+        cache_name: str = "token_cache",
         ):
         self._refresh_token = refresh_token
         self._http_client = http_client
@@ -34,7 +35,8 @@ class TokenManager(TokenManagerInterface):
         
         cache_dir = user_cache_dir("offers_sdk", "OffersSDK")
         os.makedirs(cache_dir, exist_ok=True)
-        self._cache_file_path = os.path.join(cache_dir, "token_cache.json")
+        # Separate cache names keep tokens of different (e.g. regional) endpoints apart
+        self._cache_file_path = os.path.join(cache_dir, f"{cache_name}.json")
         # Lock file to prevent inter-process race conditions
         self._file_lock = FileLock(f"{self._cache_file_path}.lock")
     
@@ -0,0 +1,4 @@
+from .shared_offers_cache import SharedOffersCache
+
+
+__all__ = ['SharedOffersCache']
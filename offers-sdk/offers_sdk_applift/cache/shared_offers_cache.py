@@ -0,0 +1,357 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import struct
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+from offers_sdk_applift.models import Offer
+from offers_sdk_applift.scheduling import Deadline
+
+
+class _LeaderCancelled(Exception):
+    """Handed to tasks waiting on a refresh whose fetching task was cancelled."""
+
+
+class SharedOffersCache:
+    """
+    A host-wide offers cache shared by processes (e.g. forked web workers) through a memory-mapped file.
+
+    The file is a fixed table of `slots` slots of `slot_size` bytes, grouped
+    into buckets of `WAYS` slots; a product ID hashes to one bucket, so the
+    cache never grows beyond the file. Each slot holds a product ID, an expiry
+    time and the offers in a compact binary form (28 bytes per offer).
+
+    Reads take no locks: every slot starts with a sequence number that a
+    writer makes odd while it rewrites the slot and even again afterwards
+    (a seqlock), and a reader retries if the number was odd or changed while
+    it copied the slot. Writers take a non-blocking `fcntl` lock on the
+    bucket's byte range just long enough to rewrite a slot, never across an
+    await. Refreshes are single-flight: a worker that misses writes a claim
+    into the product's slot, fetches without any lock held and then publishes
+    the offers over the claim; other workers see the claim and poll for the
+    result instead of calling the API themselves.
+
+    Put the file on a memory-backed filesystem such as /dev/shm. The cache
+    assumes one event loop per process (the usual forked-worker model).
+    """
+
+    MAGIC = b"OSDKOFC1"
+    HEADER = struct.Struct("<8sII")
+    SLOT_HEADER = struct.Struct("<I16sdH")
+    OFFER = struct.Struct("<16sqi")
+    WAYS = 4
+    PENDING = 0xFFFF
+    READ_RETRIES = 8
+
+    def __init__(
+        self,
+        path: str,
+        slots: int = 16384,
+        slot_size: int = 1024,
+        ttl: float = 30.0,
+        lock_poll_interval: float = 0.005,
+        lock_timeout: float = 10.0,
+    ):
+        """
+        Args:
+            path: The shared file; created if missing. Every process must use the same geometry.
+            slots: The number of slots; rounded up to a multiple of `WAYS`.
+            slot_size: Bytes per slot; bounds the offers a product may have to be cached.
+            ttl: Seconds a cached entry stays fresh.
+            lock_poll_interval: Seconds between checks while another process refreshes.
+            lock_timeout: Seconds a refresh claim stays valid, and so how long to wait for
+                another process's refresh before fetching anyway.
+        """
+        if fcntl is None:
+            raise RuntimeError("SharedOffersCache requires fcntl (a Unix platform)")
+        self._slots = -(-slots // self.WAYS) * self.WAYS
+        self._slot_size = slot_size
+        self._capacity = (slot_size - self.SLOT_HEADER.size) // self.OFFER.size
+        if self._capacity < 1:
+            raise ValueError("slot_size is too small to hold a single offer")
+        self._ttl = ttl
+        self._lock_poll_interval = lock_poll_interval
+        self._lock_timeout = lock_timeout
+        self._buckets = self._slots // self.WAYS
+        self._size = self.HEADER.size + self._slots * slot_size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._initialize(path)
+        self._map = mmap.mmap(self._fd, self._size)
+        self._inflight: Dict[uuid.UUID, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+
+    def get(self, product_id: uuid.UUID) -> Optional[List[Offer]]:
+        """Returns the cached offers for a product, or None if absent or expired. Never blocks."""
+        offers = self._lookup(product_id)
+        if offers is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return offers
+
+    def put(self, product_id: uuid.UUID, offers: List[Offer]) -> bool:
+        """
+        Stores offers for a product. Never blocks.
+
+        Returns:
+            False if the offers do not fit in a slot or another process is
+            writing the same bucket right now (they are then not cached).
+        """
+        bucket = self._bucket(product_id.bytes)
+        if not self._lock(bucket):
+            return False
+        try:
+            return self._write(bucket, product_id.bytes, offers)
+        finally:
+            self._unlock(bucket)
+
+    async def get_or_fetch(
+        self,
+        product_id: uuid.UUID,
+        fetch: Callable[[], Awaitable[List[Offer]]],
+        deadline: Optional[Deadline] = None,
+    ) -> List[Offer]:
+        """
+        Returns cached offers, or fetches and caches them with at most one fetch per key host-wide.
+
+        Args:
+            product_id: The product to look up.
+            fetch: Fetches the offers from the API on a miss.
+            deadline: Bounds the wait for a refresh made by another task or process.
+
+        Raises:
+            DeadlineExceededError: If `deadline` passes while waiting for another refresh.
+        """
+        deadline = deadline or Deadline()
+        while True:
+            offers = self.get(product_id)
+            if offers is not None:
+                return offers
+            inflight = self._inflight.get(product_id)
+            if inflight is None:
+                break
+            try:
+                return await deadline.wait_for(asyncio.shield(inflight), "while waiting for a cached offers refresh")
+            except _LeaderCancelled:
+                # The task refreshing for us was cancelled; look again and take over if needed.
+                continue
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[product_id] = future
+        try:
+            offers = await self._refresh(product_id, fetch, deadline)
+            future.set_result(offers)
+            return offers
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters get the exception; don't warn if there were none.
+            future.exception()
+            raise
+        finally:
+            del self._inflight[product_id]
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    async def _refresh(
+        self, product_id: uuid.UUID, fetch: Callable[[], Awaitable[List[Offer]]], deadline: Deadline
+    ) -> List[Offer]:
+        key = product_id.bytes
+        bucket = self._bucket(key)
+        give_up_at = time.monotonic() + self._lock_timeout
+        while True:
+            claim = self._claim(bucket, key)
+            if claim is True:
+                break
+            if claim is not False:
+                return claim
+            # Another process is refreshing this product (or writing its bucket).
+            if time.monotonic() >= give_up_at:
+                break
+            deadline.check("while waiting for another process's cached offers refresh")
+            pause = min(self._lock_poll_interval, give_up_at - time.monotonic())
+            remaining = deadline.remaining()
+            await asyncio.sleep(pause if remaining is None else min(pause, remaining))
+        self.fetches += 1
+        try:
+            offers = await fetch()
+        except BaseException:
+            if claim is True:
+                self._release_claim(bucket, key)
+            raise
+        await self._publish(bucket, key, offers, deadline)
+        return offers
+
+    def _claim(self, bucket: int, key: bytes):
+        """
+        Claims the refresh of a product under a brief bucket lock.
+
+        Returns:
+            The fresh offers if they are cached already, True if the claim is
+            ours, or False if another process holds a live claim or the lock.
+        """
+        if not self._lock(bucket):
+            return False
+        try:
+            now = time.time()
+            for slot in self._bucket_slots(bucket):
+                _, slot_key, expires_at, count = self.SLOT_HEADER.unpack_from(self._map, self._slot_offset(slot))
+                if slot_key == key and expires_at > now:
+                    if count == self.PENDING:
+                        return False
+                    entry = self._read_slot(slot, key)
+                    if entry is not None:
+                        return entry[2]
+            self._write_slot(bucket, key, now + self._lock_timeout, self.PENDING, b"")
+            return True
+        finally:
+            self._unlock(bucket)
+
+    def _release_claim(self, bucket: int, key: bytes) -> None:
+        # Best effort: if the bucket is busy the claim just expires after lock_timeout.
+        if not self._lock(bucket):
+            return
+        try:
+            for slot in self._bucket_slots(bucket):
+                _, slot_key, _, count = self.SLOT_HEADER.unpack_from(self._map, self._slot_offset(slot))
+                if slot_key == key and count == self.PENDING:
+                    self._write_slot(bucket, key, 0.0, self.PENDING, b"")
+        finally:
+            self._unlock(bucket)
+
+    async def _publish(self, bucket: int, key: bytes, offers: List[Offer], deadline: Deadline) -> None:
+        # Bucket locks are held for microseconds, so this rarely polls; if it cannot
+        # publish in time the offers are still returned and the claim expires.
+        give_up_at = time.monotonic() + self._lock_timeout
+        while not self._lock(bucket):
+            if deadline.expired or time.monotonic() >= give_up_at:
+                return
+            await asyncio.sleep(self._lock_poll_interval)
+        try:
+            if not self._write(bucket, key, offers):
+                # Too large to cache: drop our claim so others don't wait for it.
+                self._write_slot(bucket, key, 0.0, self.PENDING, b"")
+        finally:
+            self._unlock(bucket)
+
+    def _lookup(self, product_id: uuid.UUID) -> Optional[List[Offer]]:
+        key = product_id.bytes
+        now = time.time()
+        for slot in self._bucket_slots(self._bucket(key)):
+            entry = self._read_slot(slot, key)
+            if entry is not None and entry[0] == key and entry[1] > now and entry[2] is not None:
+                return entry[2]
+        return None
+
+    def _initialize(self, path: str) -> None:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.HEADER.size, 0)
+        try:
+            header = self.HEADER.pack(self.MAGIC, self._slots, self._slot_size)
+            existing = os.pread(self._fd, self.HEADER.size, 0)
+            if not existing:
+                os.ftruncate(self._fd, self._size)
+                os.pwrite(self._fd, header, 0)
+            elif existing != header or os.fstat(self._fd).st_size != self._size:
+                raise ValueError(f"{path} holds a cache with a different layout")
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.HEADER.size, 0)
+
+    def _bucket(self, key: bytes) -> int:
+        digest = hashlib.blake2b(key, digest_size=8).digest()
+        return int.from_bytes(digest, "little") % self._buckets
+
+    def _bucket_slots(self, bucket: int) -> range:
+        return range(bucket * self.WAYS, (bucket + 1) * self.WAYS)
+
+    def _slot_offset(self, slot: int) -> int:
+        return self.HEADER.size + slot * self._slot_size
+
+    def _read_slot(self, slot: int, key: bytes):
+        offset = self._slot_offset(slot)
+        for _ in range(self.READ_RETRIES):
+            seq = struct.unpack_from("<I", self._map, offset)[0]
+            if seq % 2:
+                continue
+            if self._map[offset + 4:offset + 20] != key:
+                # Cheap check before copying the slot; a torn key just reads as a miss.
+                return None
+            data = self._map[offset:offset + self._slot_size]
+            if struct.unpack_from("<I", self._map, offset)[0] != seq:
+                continue
+            _, stored_key, expires_at, count = self.SLOT_HEADER.unpack_from(data)
+            if count == self.PENDING:
+                # A refresh claim: the key is known but holds no offers yet.
+                return stored_key, expires_at, None
+            if count > self._capacity:
+                return None
+            offers = [
+                Offer.model_construct(id=uuid.UUID(bytes=offer_id), price=price, items_in_stock=items_in_stock)
+                for offer_id, price, items_in_stock in self.OFFER.iter_unpack(
+                    data[self.SLOT_HEADER.size:self.SLOT_HEADER.size + count * self.OFFER.size]
+                )
+            ]
+            return stored_key, expires_at, offers
+        # Too busy to get a consistent copy; treat it as a miss.
+        return None
+
+    def _write(self, bucket: int, key: bytes, offers: List[Offer]) -> bool:
+        if len(offers) > self._capacity:
+            return False
+        try:
+            payload = b"".join(self.OFFER.pack(offer.id.bytes, offer.price, offer.items_in_stock) for offer in offers)
+        except struct.error:
+            return False
+        self._write_slot(bucket, key, time.time() + self._ttl, len(offers), payload)
+        return True
+
+    def _write_slot(self, bucket: int, key: bytes, expires_at: float, count: int, payload: bytes) -> None:
+        # Callers hold the bucket lock.
+        slot = self._choose_slot(bucket, key)
+        offset = self._slot_offset(slot)
+        seq = struct.unpack_from("<I", self._map, offset)[0]
+        struct.pack_into("<I", self._map, offset, (seq + 1) & 0xFFFFFFFF)
+        self._map[offset + 4:offset + self.SLOT_HEADER.size] = self.SLOT_HEADER.pack(
+            0, key, expires_at, count
+        )[4:]
+        self._map[offset + self.SLOT_HEADER.size:offset + self.SLOT_HEADER.size + len(payload)] = payload
+        struct.pack_into("<I", self._map, offset, (seq + 2) & 0xFFFFFFFF)
+
+    def _choose_slot(self, bucket: int, key: bytes) -> int:
+        # The key's own slot, else an empty or expired one, else the entry expiring first.
+        # A live refresh claim is evicted only if every slot holds one: others are waiting on it.
+        now = time.time()
+        candidates = []
+        for slot in self._bucket_slots(bucket):
+            _, slot_key, expires_at, count = self.SLOT_HEADER.unpack_from(self._map, self._slot_offset(slot))
+            if slot_key == key:
+                return slot
+            live = expires_at > now
+            candidates.append((live, live and count == self.PENDING, expires_at, slot))
+        return min(candidates)[3]
+
+    def _lock(self, bucket: int) -> bool:
+        # Never blocks: the lock is only held for a slot rewrite, never across an await.
+        length = self.WAYS * self._slot_size
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, length, self._slot_offset(bucket * self.WAYS))
+        except (BlockingIOError, PermissionError):
+            return False
+        return True
+
+    def _unlock(self, bucket: int) -> None:
+        length = self.WAYS * self._slot_size
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, length, self._slot_offset(bucket * self.WAYS))
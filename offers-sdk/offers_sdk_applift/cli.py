@@ -1,16 +1,21 @@
 import asyncio
 import uuid
+from pathlib import Path
 from typing import Optional
 
 import typer
 from pydantic import ValidationError
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeRemainingColumn
 from rich.table import Table
 
 from .clients import HttpxOffersClient
 from .interfaces import OffersClientInterface
 from .config import get_settings
+from .crawl import CrawlProgress, OfferCrawler, ProductIdFile
 from .exceptions import APIError, ProductNotFoundError
+from .http import ReplayHttpClient, install_uvloop, recording_paths
+from .recording import TrafficReplayer
 
 
 app = typer.Typer(
@@ -87,9 +92,99 @@ async def _get_offers_async(product_id: uuid.UUID):
         raise typer.Exit(code=1)
 
 
+async def _replay_async(path: Path, speed: float, latency_speed: float):
+    settings = get_settings()
+    client = HttpxOffersClient.from_credentials(
+        refresh_token=settings.OFFERS_SDK_REFRESH_TOKEN,
+        http_client=ReplayHttpClient(str(path), speed=latency_speed),
+    )
+    async with client:
+        with console.status(f"[bold green]Replaying {path}...[/bold green]"):
+            report = await TrafficReplayer(client, str(path), speed=speed).run()
+
+    table = Table(title=f"Replay of [cyan]{path}[/cyan]")
+    table.add_column("Metric", style="magenta")
+    table.add_column("Value", justify="right", style="green")
+    table.add_row("Requests", str(report.requests))
+    table.add_row("Errors", str(report.errors))
+    table.add_row("Elapsed (s)", f"{report.elapsed_seconds:.3f}")
+    table.add_row("Throughput (req/s)", f"{report.requests_per_second:.1f}")
+    table.add_row("p50 latency (ms)", f"{report.p50_latency_seconds * 1000:.1f}")
+    table.add_row("p90 latency (ms)", f"{report.p90_latency_seconds * 1000:.1f}")
+    table.add_row("p99 latency (ms)", f"{report.p99_latency_seconds * 1000:.1f}")
+    console.print(table)
+
+
+async def _crawl_async(
+    ids_path: Path, output: Path, concurrency: int, rotate_mb: int, timeout: Optional[float]
+):
+    output.mkdir(parents=True, exist_ok=True)
+    binary_path = ids_path
+    if ids_path.suffix != ".bin":
+        # Parse the text file once; the binary copy is reused when resuming.
+        binary_path = output / "product_ids.bin"
+        if not binary_path.exists():
+            with console.status(f"[bold green]Converting {ids_path} to binary IDs...[/bold green]"):
+                count = ProductIdFile.convert(str(ids_path), str(binary_path))
+            console.print(f"Converted [cyan]{count}[/cyan] product IDs to [cyan]{binary_path}[/cyan]")
+
+    product_ids = ProductIdFile(str(binary_path))
+    client = get_client()
+    columns = (
+        TextColumn("[bold green]Crawling"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("{task.fields[rate]:>8.1f}/s  errors: {task.fields[errors]}"),
+        TimeRemainingColumn(),
+    )
+    try:
+        async with client:
+            with Progress(*columns, console=console) as progress:
+                task = progress.add_task("crawl", total=len(product_ids), rate=0.0, errors=0)
+
+                def report(snapshot: CrawlProgress):
+                    progress.update(
+                        task, completed=snapshot.completed, rate=snapshot.items_per_second, errors=snapshot.errors
+                    )
+
+                crawler = OfferCrawler(
+                    client,
+                    product_ids,
+                    str(output),
+                    concurrency=concurrency,
+                    rotate_bytes=rotate_mb << 20,
+                    timeout=timeout,
+                    on_progress=report,
+                )
+                report(crawler.progress())
+                result = await crawler.run()
+    finally:
+        product_ids.close()
+    console.print(
+        f"[bold green]✓ Done![/bold green] {result.completed} products "
+        f"({result.errors} errors) at {result.items_per_second:.1f}/s; output in [cyan]{output}[/cyan]"
+    )
+    if result.retry_pending:
+        console.print(
+            f"[yellow]{result.retry_pending} lookups failed transiently; "
+            f"run the same command again to retry them.[/yellow]"
+        )
+
+
 # --- Synchronous CLI Commands ---
 # These are the functions Typer will call. They are synchronous.
 
+def _run(coroutine):
+    """Runs a command's coroutine, on uvloop if `USE_UVLOOP` is set."""
+    try:
+        use_uvloop = get_settings().USE_UVLOOP
+    except ValidationError:
+        use_uvloop = False  # get_client() reports the configuration error.
+    if use_uvloop and not install_uvloop():
+        console.print("[yellow]USE_UVLOOP is set but uvloop is not installed; using asyncio.[/yellow]")
+    return asyncio.run(coroutine)
+
+
 @app.command()
 def register(
     name: str = typer.Option(..., "--name", "-n", help="The name of the product to register."),
@@ -98,7 +193,7 @@ def register(
 ):
     """Register a new product with the Offers service."""
     # The sync function's only job is to run the async version.
-    asyncio.run(_register_async(name, description, product_id))
+    _run(_register_async(name, description, product_id))
 
 
 @app.command()
@@ -106,4 +201,45 @@ def get_offers(
     product_id: uuid.UUID = typer.Argument(..., help="The UUID of the product to retrieve offers for.")
 ):
     """Get all available offers for a given product ID."""
-    asyncio.run(_get_offers_async(product_id))
\ No newline at end of file
+    _run(_get_offers_async(product_id))
+
+
+@app.command()
+def replay(
+    path: Path = typer.Argument(
+        ...,
+        help="A traffic recording (see TRAFFIC_RECORD_PATH); the base path of a per-endpoint recording "
+        "or a glob pattern replays all of its files merged.",
+    ),
+    speed: float = typer.Option(
+        1.0, "--speed", "-s", help="Arrival-rate speed factor; 0 starts every call at once."
+    ),
+    latency_speed: float = typer.Option(
+        1.0, "--latency-speed", "-l", help="Response-latency speed factor; 0 serves responses without delay."
+    ),
+):
+    """Replay recorded traffic offline, with its original arrival pattern and latencies."""
+    try:
+        recording_paths(str(path))
+    except FileNotFoundError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+    _run(_replay_async(path, speed, latency_speed))
+
+
+@app.command()
+def crawl(
+    ids: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="Product IDs, one UUID per line, or a converted .bin file."
+    ),
+    output: Path = typer.Option(Path("crawl-output"), "--output", "-o", help="Directory for results and the checkpoint."),
+    concurrency: int = typer.Option(50, "--concurrency", "-c", help="Maximum requests in flight."),
+    rotate_mb: int = typer.Option(256, "--rotate-mb", help="Start a new output file after this many MB."),
+    timeout: Optional[float] = typer.Option(30.0, "--timeout", help="Seconds each offer lookup may take."),
+):
+    """Fetch offers for every product in a file; re-run with the same output to resume."""
+    try:
+        _run(_crawl_async(ids, output, concurrency, rotate_mb, timeout))
+    except KeyboardInterrupt:
+        console.print(f"[yellow]Interrupted; progress saved. Re-run with --output {output} to resume.[/yellow]")
+        raise typer.Exit(code=130)
@@ -1,14 +1,26 @@
+import asyncio
+import hashlib
+import time
 import uuid
 import httpx
-from typing import List
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
 
 from offers_sdk_applift.config import get_settings
 from offers_sdk_applift.interfaces import OffersClientInterface, AsyncHttpClientInterface, TokenManagerInterface
 from offers_sdk_applift.auth import TokenManager
-from offers_sdk_applift.models import RegisterProductRequest, Product, Offer
-from offers_sdk_applift.exceptions import request_exception_handler
+from offers_sdk_applift.models import RegisterProductRequest, Product, Offer, EndpointWarmup, WarmupReport
+from offers_sdk_applift.exceptions import (
+    request_exception_handler, is_transient, DeadlineExceededError, ProductAlreadyFoundError
+)
+from offers_sdk_applift.scheduling import (
+    AdaptiveConcurrencyLimiter, Deadline, Priority, RequestHedger, RequestScheduler, PollScheduler
+)
 
-from offers_sdk_applift.http import HttpxClient
+from offers_sdk_applift.cache import SharedOffersCache
+from offers_sdk_applift.index import IndexInUseError, KnownProductsIndex
+from offers_sdk_applift.http import (
+    Endpoint, EndpointRouter, RecordingHttpClient, ReplayHttpClient, create_http_client
+)
 
 
 class HttpxOffersClient(OffersClientInterface):
@@ -21,6 +33,14 @@ class HttpxOffersClient(OffersClientInterface):
         self,
         http_client: AsyncHttpClientInterface,
         token_manager: TokenManagerInterface,
+        scheduler: Optional[RequestScheduler] = None,
+        poll_scheduler: Optional[PollScheduler] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        router: Optional[EndpointRouter] = None,
+        hedger: Optional[RequestHedger] = None,
+        known_products: Optional[KnownProductsIndex] = None,
+        offers_cache: Optional[SharedOffersCache] = None,
+        warmup_connections: int = 0,
     ):
         """
         Initializes the client with its dependencies.
@@ -32,75 +52,680 @@ class HttpxOffersClient(OffersClientInterface):
         Args:
             http_client: An object that conforms to the AsyncHttpClient protocol.
             token_manager: An object that conforms to the TokenManagerProtocol.
+            scheduler: Admits requests by priority within the concurrency limit.
+                Defaults to a `RequestScheduler` with 100 slots.
+            poll_scheduler: Drives the offer polling of `register_and_get_offers`
+                for all pipelines of this client. Defaults to a `PollScheduler`.
+            concurrency_limiter: If given, continuously resizes the scheduler's
+                limit from observed latency and errors. Off by default.
+            router: If given, spreads requests across several endpoints, each with
+                its own transport (and optionally its own token manager).
+                `http_client` and `token_manager` then serve as the defaults.
+            hedger: If given, slow offer lookups are hedged with a second
+                request within its budget. Off by default.
+            known_products: If given, registrations of products it already
+                contains are answered locally, and it is filled from successful
+                registrations and 409s.
+            offers_cache: If given, `get_offers` is served from this cache,
+                which may be shared with other processes on the host.
+            warmup_connections: If positive, entering the async context manager
+                runs `warmup()` with this many connections per endpoint.
         """
         self._http_client = http_client
         self._token_manager = token_manager
+        self._scheduler = scheduler or RequestScheduler()
+        self._poll_scheduler = poll_scheduler or PollScheduler()
+        self._concurrency_limiter = concurrency_limiter
+        self._router = router
+        self._hedger = hedger
+        self._known_products = known_products
+        self._offers_cache = offers_cache
+        self._warmup_connections = warmup_connections
+        self._warmup_report: Optional[WarmupReport] = None
+        if concurrency_limiter is not None:
+            self._scheduler.set_limit(concurrency_limiter.limit)
 
     @classmethod
     def from_credentials(
         cls,
         refresh_token: str,
-        base_url: str = "https://api.example.com/api/v1",
+        base_url: Optional[str] = None,
+        http_client: Optional[AsyncHttpClientInterface] = None,
+        base_urls: Optional[List[str]] = None,
+        http_backend: Optional[str] = None,
     ) -> "HttpxOffersClient":
         """
         A convenient factory to create a client from a refresh token.
 
         This is the recommended way for most users to instantiate the client.
-        It creates and wires up the default dependencies (`HttpxClient`, `TokenManager`).
+        It creates and wires up the default dependencies (the transport selected by
+        `HTTP_BACKEND`, `HttpxClient` by default, and `TokenManager`).
+        The transport is replaced by a `ReplayHttpClient` when `TRAFFIC_REPLAY_PATH`
+        is set (its tokens are cached apart from real ones), and wrapped in a `RecordingHttpClient` when `TRAFFIC_RECORD_PATH` is set
+        (one recording per endpoint, suffixed with its index, when routing).
 
         Args:
             refresh_token: The long-lived refresh token.
-            base_url: The base URL for the API.
+            base_url: The base URL for the API. Defaults to `OFFERS_API_BASE_URL`.
+            http_client: A transport to use instead of the one built from settings.
+            base_urls: Several (e.g. regional) base URLs to route across. Defaults to
+                `OFFERS_API_BASE_URLS` unless `base_url` is given; with fewer than two,
+                `base_url` is used alone.
+            http_backend: The transport backend ("httpx" or "h11"). Defaults to `HTTP_BACKEND`.
 
         Returns:
             A new instance of the HttpxOffersClient.
         """
         settings = get_settings()
-        
-        http_client = HttpxClient(base_url=base_url or settings.OFFERS_API_BASE_URL)
-        token_manager = TokenManager(
-            refresh_token=refresh_token, 
+        if not base_urls and base_url is None:
+            base_urls = settings.OFFERS_API_BASE_URLS
+        base_urls = base_urls or []
+        http_backend = http_backend or settings.HTTP_BACKEND
+
+        router = None
+        if http_client is None and settings.TRAFFIC_REPLAY_PATH:
+            http_client = ReplayHttpClient(settings.TRAFFIC_REPLAY_PATH, speed=settings.TRAFFIC_REPLAY_SPEED)
+        elif http_client is None and len(base_urls) > 1:
+            router = cls._build_router(refresh_token, base_urls, settings, http_backend)
+            http_client = router.endpoints[0].http_client
+        elif http_client is None:
+            http_client = create_http_client(
+                http_backend,
+                base_url=base_url or settings.OFFERS_API_BASE_URL,
+                max_connections=settings.MAX_CONCURRENT_REQUESTS,
+            )
+        # A replayed /auth returns a redacted token; keep it out of the real token cache.
+        cache_name = "token_cache_replay" if isinstance(http_client, ReplayHttpClient) else "token_cache"
+        if settings.TRAFFIC_RECORD_PATH and router is None:
+            http_client = RecordingHttpClient(http_client, settings.TRAFFIC_RECORD_PATH)
+        token_manager = cls._build_token_manager(refresh_token, http_client, settings, cache_name=cache_name)
+        scheduler = RequestScheduler(max_concurrency=settings.MAX_CONCURRENT_REQUESTS)
+        concurrency_limiter = None
+        if settings.ADAPTIVE_CONCURRENCY:
+            concurrency_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=min(20, settings.MAX_CONCURRENT_REQUESTS),
+                max_limit=settings.MAX_CONCURRENT_REQUESTS,
+            )
+        hedger = None
+        if settings.HEDGE_REQUESTS:
+            hedger = RequestHedger(percentile=settings.HEDGE_PERCENTILE, budget=settings.HEDGE_BUDGET)
+        known_products = None
+        if settings.KNOWN_PRODUCTS_INDEX_PATH:
+            try:
+                known_products = KnownProductsIndex(settings.KNOWN_PRODUCTS_INDEX_PATH)
+            except IndexInUseError:
+                # Another worker owns the index; this one registers without it.
+                pass
+        offers_cache = None
+        if settings.OFFERS_CACHE_PATH:
+            offers_cache = SharedOffersCache(
+                settings.OFFERS_CACHE_PATH, slots=settings.OFFERS_CACHE_SLOTS, ttl=settings.OFFERS_CACHE_TTL
+            )
+        return cls(
+            http_client=http_client,
+            token_manager=token_manager,
+            scheduler=scheduler,
+            concurrency_limiter=concurrency_limiter,
+            router=router,
+            hedger=hedger,
+            known_products=known_products,
+            offers_cache=offers_cache,
+            warmup_connections=settings.WARMUP_CONNECTIONS,
+        )
+
+    @classmethod
+    def _build_router(
+        cls, refresh_token: str, base_urls: List[str], settings, http_backend: str
+    ) -> EndpointRouter:
+        endpoints = []
+        for index, url in enumerate(base_urls):
+            endpoint_client = create_http_client(
+                http_backend, base_url=url, max_connections=settings.MAX_CONCURRENT_REQUESTS
+            )
+            if settings.TRAFFIC_RECORD_PATH:
+                endpoint_client = RecordingHttpClient(endpoint_client, f"{settings.TRAFFIC_RECORD_PATH}.{index}")
+            endpoint_token_manager = None
+            if settings.REGION_SCOPED_TOKENS:
+                endpoint_token_manager = cls._build_token_manager(
+                    refresh_token,
+                    endpoint_client,
+                    settings,
+                    cache_name=f"token_cache_{hashlib.sha1(url.encode()).hexdigest()[:12]}",
+                )
+            endpoints.append(Endpoint(url, endpoint_client, endpoint_token_manager))
+        return EndpointRouter(endpoints)
+
+    @staticmethod
+    def _build_token_manager(
+        refresh_token: str, http_client: AsyncHttpClientInterface, settings, cache_name: str = "token_cache"
+    ) -> TokenManager:
+        return TokenManager(
+            refresh_token=refresh_token,
             http_client=http_client,
             expiration_seconds=settings.TOKEN_EXPIRATION_SECONDS,
             buffer_seconds=settings.TOKEN_EXPIRATION_BUFFER_SECONDS,
+            cache_name=cache_name,
         )
-        return cls(http_client=http_client, token_manager=token_manager)
 
-    @request_exception_handler
-    async def _make_request(self, method: str, url: str, **kwargs) -> httpx.Response:
-        """A private helper to orchestrate token retrieval and request execution."""
-        access_token = await self._token_manager.get_access_token()
-        headers = {
-            "Bearer": f"{access_token}",
-            **(kwargs.pop("headers", {})),
-        }
-
-        response = await self._http_client.request(
-                method, url, headers=headers, **kwargs
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """The scheduler that admits this client's requests."""
+        return self._scheduler
+
+    @property
+    def router(self) -> Optional[EndpointRouter]:
+        """The endpoint router, exposing per-endpoint latency and error rates."""
+        return self._router
+
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """The adaptive limiter, exposing the current limit and latency estimates."""
+        return self._concurrency_limiter
+
+    @property
+    def known_products(self) -> Optional[KnownProductsIndex]:
+        """The index of products known to be registered."""
+        return self._known_products
+
+    @property
+    def offers_cache(self) -> Optional[SharedOffersCache]:
+        """The shared offers cache, exposing hit, miss and fetch counts."""
+        return self._offers_cache
+
+    @property
+    def hedger(self) -> Optional[RequestHedger]:
+        """The request hedger, exposing hedge win/loss statistics."""
+        return self._hedger
+
+    @property
+    def warmup_report(self) -> Optional[WarmupReport]:
+        """The report of the last `warmup()`, or None if the client was not warmed up."""
+        return self._warmup_report
+
+    async def warmup(self, connections: Optional[int] = None) -> WarmupReport:
+        """
+        Prefetches the access token and opens pooled connections before traffic arrives.
+
+        For every endpoint (each regional endpoint when routing), the token
+        fetch and `connections` concurrent requests run in parallel, so DNS,
+        TCP/TLS setup and the `/auth` round trip are paid up front. The
+        connection requests are `HEAD /`; any HTTP response, whatever its
+        status, means the connection was established.
+
+        Args:
+            connections: Connections to open per endpoint; 0 only prefetches the
+                token. Defaults to the client's `warmup_connections`, or 10 if
+                that is not set.
+
+        Returns:
+            A WarmupReport with per-phase timings, usable to gate readiness.
+
+        Raises:
+            AuthenticationError: If the access token cannot be obtained.
+        """
+        if connections is None:
+            connections = self._warmup_connections if self._warmup_connections > 0 else 10
+        if self._router is not None:
+            targets = [
+                (endpoint.base_url, endpoint.http_client, endpoint.token_manager or self._token_manager)
+                for endpoint in self._router.endpoints
+            ]
+        else:
+            targets = [(None, self._http_client, self._token_manager)]
+        started = time.monotonic()
+        endpoints = await asyncio.gather(
+            *(
+                self._warmup_endpoint(base_url, http_client, token_manager, connections)
+                for base_url, http_client, token_manager in targets
             )
+        )
+        self._warmup_report = WarmupReport(total_seconds=time.monotonic() - started, endpoints=endpoints)
+        return self._warmup_report
+
+    @staticmethod
+    async def _warmup_endpoint(
+        base_url: Optional[str],
+        http_client: AsyncHttpClientInterface,
+        token_manager: TokenManagerInterface,
+        connections: int,
+    ) -> EndpointWarmup:
+        async def fetch_token() -> float:
+            started = time.monotonic()
+            await token_manager.get_access_token()
+            return time.monotonic() - started
+
+        async def open_connections() -> Tuple[float, List[Union[httpx.Response, BaseException]]]:
+            started = time.monotonic()
+            results = await asyncio.gather(
+                *(http_client.request("HEAD", "/") for _ in range(connections)), return_exceptions=True
+            )
+            return time.monotonic() - started, results
+
+        token_seconds, (connect_seconds, results) = await asyncio.gather(fetch_token(), open_connections())
+        failed = sum(isinstance(result, BaseException) for result in results)
+        return EndpointWarmup(
+            base_url=base_url,
+            token_seconds=token_seconds,
+            connect_seconds=connect_seconds,
+            connections_opened=connections - failed,
+            connections_failed=failed,
+        )
+
+    @request_exception_handler
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        priority: Priority = Priority.NORMAL,
+        deadline: Optional[Deadline] = None,
+        routing_key: Optional[uuid.UUID] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        A private helper to orchestrate admission, token retrieval and request execution.
+
+        The deadline bounds every stage: the wait for a slot, the wait for the
+        token (including the token manager's own retries) and the HTTP exchange.
+        A request whose deadline has passed once it is admitted is never sent.
+        With a router, the routing key (the product ID) selects the endpoint.
+        """
+        deadline = deadline or Deadline()
+        async with self._scheduler.slot(priority, deadline):
+            endpoint = self._router.pick(routing_key) if self._router is not None else None
+            probe = endpoint is not None and endpoint.probing
+            try:
+                http_client = endpoint.http_client if endpoint is not None else self._http_client
+                token_manager = (endpoint.token_manager if endpoint is not None else None) or self._token_manager
+                access_token = await deadline.wait_for(
+                    token_manager.get_access_token(), "while waiting for the access token"
+                )
+                headers = {
+                    "Bearer": f"{access_token}",
+                    **(kwargs.pop("headers", {})),
+                }
+
+                deadline.check("before the request was sent")
+                if deadline.is_bounded:
+                    # Transport timeouts apply per phase; wait_for below bounds the exchange as a whole.
+                    kwargs["timeout"] = deadline.remaining()
+                in_flight = self._scheduler.in_flight
+                started = time.monotonic()
+                try:
+                    response = await deadline.wait_for(
+                        http_client.request(method, url, headers=headers, **kwargs), f"during {method} {url}"
+                    )
+                except DeadlineExceededError:
+                    self._observe_latency(started, in_flight, dropped=True, endpoint=endpoint)
+                    raise
+                except httpx.TimeoutException as e:
+                    self._observe_latency(started, in_flight, dropped=True, endpoint=endpoint)
+                    if deadline.expired:
+                        raise DeadlineExceededError(f"Deadline exceeded during {method} {url}.") from e
+                    raise
+                except httpx.TransportError:
+                    self._observe_latency(started, in_flight, dropped=True, endpoint=endpoint)
+                    raise
+                self._observe_latency(
+                    started,
+                    in_flight,
+                    dropped=response.status_code == 429 or response.status_code >= 500,
+                    endpoint=endpoint,
+                )
+            finally:
+                if probe and endpoint.probing:
+                    # The probe ended without an outcome, e.g. it was cancelled.
+                    self._router.abandon(endpoint)
         return response
 
+    def _observe_latency(
+        self, started: float, in_flight: int, dropped: bool, endpoint: Optional[Endpoint] = None
+    ) -> None:
+        rtt = time.monotonic() - started
+        if endpoint is not None:
+            self._router.observe(endpoint, rtt, dropped)
+        if self._concurrency_limiter is not None:
+            limit = self._concurrency_limiter.on_sample(rtt, in_flight, dropped)
+            self._scheduler.set_limit(limit)
+
     async def register_product(
-        self, product_id: uuid.UUID, name: str, description: str
+        self,
+        product_id: uuid.UUID,
+        name: str,
+        description: str,
+        *,
+        priority: Priority = Priority.NORMAL,
+        timeout: Optional[float] = None,
+        authoritative: bool = False,
     ) -> Product:
+        """
+        Registers a new product with the service.
+
+        Args:
+            product_id: The ID of the product to register.
+            name: The product name.
+            description: The product description.
+            priority: Admission priority of the request.
+            timeout: Seconds the whole call may take, or None for no deadline.
+            authoritative: Always call the API, even if the product is known
+                to be registered already.
+
+        Raises:
+            ProductAlreadyFoundError: If the product is already registered,
+                possibly without a call when the known-products index has it.
+        """
         request_model = RegisterProductRequest(
             id=product_id, name=name, description=description
         )
-        response = await self._make_request(
-            "POST", "/products/register", json=request_model.model_dump(mode="json")
+        return await self._register(request_model, priority, Deadline.after(timeout), authoritative)
+
+    async def get_offers(
+        self,
+        product_id: uuid.UUID,
+        *,
+        priority: Priority = Priority.NORMAL,
+        timeout: Optional[float] = None,
+    ) -> List[Offer]:
+        """
+        Retrieves all available offers for a specific product.
+
+        With an offers cache, fresh cached offers are returned without a call,
+        and on a miss only one caller across all processes sharing the cache
+        fetches them.
+
+        Args:
+            product_id: The ID of the product.
+            priority: Admission priority of the request.
+            timeout: Seconds the whole call may take, or None for no deadline.
+        """
+        return await self._get_offers(product_id, priority, Deadline.after(timeout))
+
+    async def register_products_bulk(
+        self,
+        products: Iterable[RegisterProductRequest],
+        *,
+        priority: Priority = Priority.NORMAL,
+        timeout: Optional[float] = None,
+        authoritative: bool = False,
+    ) -> Dict[uuid.UUID, Union[Product, Exception]]:
+        """
+        Registers many products concurrently under a single shared deadline.
+
+        Products in the known-products index get a `ProductAlreadyFoundError`
+        without a call, unless `authoritative` is set.
+
+        Returns:
+            A mapping of product ID to the registered Product, or to the
+            exception raised for that product.
+        """
+        deadline = Deadline.after(timeout)
+        requests = {product.id: product for product in products}
+        results = await asyncio.gather(
+            *(self._register(product, priority, deadline, authoritative) for product in requests.values()),
+            return_exceptions=True,
         )
-        return Product.model_validate(response.json())
+        return dict(zip(requests.keys(), results))
+
+    async def get_offers_bulk(
+        self,
+        product_ids: Iterable[uuid.UUID],
+        *,
+        priority: Priority = Priority.NORMAL,
+        timeout: Optional[float] = None,
+    ) -> Dict[uuid.UUID, Union[List[Offer], Exception]]:
+        """
+        Retrieves offers for many products concurrently under a single shared deadline.
+
+        Like `get_offers`, this is served from the offers cache when there is one.
+
+        Returns:
+            A mapping of product ID to its offers, or to the exception raised
+            for that product.
+        """
+        deadline = Deadline.after(timeout)
+        unique_ids = list(dict.fromkeys(product_ids))
+        results = await asyncio.gather(
+            *(self._get_offers(product_id, priority, deadline) for product_id in unique_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(unique_ids, results))
+
+    async def stream_offers(
+        self,
+        product_ids: AsyncIterable[uuid.UUID],
+        concurrency: int = 10,
+        ordered: bool = False,
+        *,
+        reorder_buffer: Optional[int] = None,
+        priority: Priority = Priority.NORMAL,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[uuid.UUID, Union[List[Offer], Exception]]]:
+        """
+        Fetches offers for a stream of product IDs with bounded concurrency.
+
+        IDs are pulled from `product_ids` only when a slot frees up, so memory
+        stays constant however long the stream is. Closing or cancelling the
+        consumer cancels every request still in flight. Like `get_offers`, this
+        is served from the offers cache when there is one.
+
+        Args:
+            product_ids: An async iterable of product IDs.
+            concurrency: The maximum number of requests in flight.
+            ordered: Yield results in input order instead of completion order.
+            reorder_buffer: With `ordered`, the maximum number of completed results
+                held back behind a slow one. Defaults to `concurrency`.
+            priority: Admission priority of every request.
+            timeout: Seconds each individual fetch may take, or None for no deadline.
+
+        Yields:
+            `(product_id, offers)` tuples, with the exception in place of the
+            offers if the fetch for that product failed.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        window = concurrency + (concurrency if reorder_buffer is None else reorder_buffer)
+        source = product_ids.__aiter__()
+        pull: Optional[asyncio.Future] = None
+        exhausted = False
+        in_flight: Dict[asyncio.Task, int] = {}
+        completed: Dict[int, Tuple[uuid.UUID, Union[List[Offer], Exception]]] = {}
+        next_seq = next_to_yield = 0
+
+        try:
+            while True:
+                if (
+                    pull is None
+                    and not exhausted
+                    and len(in_flight) < concurrency
+                    and (not ordered or next_seq - next_to_yield < window)
+                ):
+                    pull = asyncio.ensure_future(source.__anext__())
+                waiting = {*in_flight, *((pull,) if pull else ())}
+                if not waiting:
+                    break
+
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if pull in done:
+                    try:
+                        product_id = pull.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        task = asyncio.create_task(
+                            self._fetch_offers_result(product_id, priority, Deadline.after(timeout))
+                        )
+                        in_flight[task] = next_seq
+                        next_seq += 1
+                    pull = None
+
+                for task in done:
+                    seq = in_flight.pop(task, None)
+                    if seq is None:
+                        continue
+                    if ordered:
+                        completed[seq] = task.result()
+                    else:
+                        yield task.result()
+                while next_to_yield in completed:
+                    yield completed.pop(next_to_yield)
+                    next_to_yield += 1
+        finally:
+            pending = [*in_flight, *((pull,) if pull else ())]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def register_and_get_offers(
+        self,
+        product_id: uuid.UUID,
+        name: str,
+        description: str,
+        *,
+        priority: Priority = Priority.NORMAL,
+        timeout: float = 30.0,
+    ) -> List[Offer]:
+        """
+        Registers a product and waits until offers for it appear.
+
+        A 409 from registration is treated as "already registered". Offers are
+        then polled on the client's shared `PollScheduler` with adaptive
+        backoff until they are non-empty or the timeout expires.
 
-    async def get_offers(self, product_id: uuid.UUID) -> List[Offer]:
-        response = await self._make_request("GET", f"/products/{product_id}/offers")
+        Args:
+            product_id: The ID of the product to register.
+            name: The product name.
+            description: The product description.
+            priority: Admission priority of every request in the pipeline.
+            timeout: Seconds the whole pipeline may take.
+
+        Returns:
+            The first non-empty list of offers, or an empty list on timeout.
+        """
+        request_model = RegisterProductRequest(
+            id=product_id, name=name, description=description
+        )
+        return await self._register_and_poll(request_model, priority, Deadline.after(timeout))
+
+    async def register_and_get_offers_bulk(
+        self,
+        products: Iterable[RegisterProductRequest],
+        *,
+        priority: Priority = Priority.NORMAL,
+        timeout: float = 30.0,
+    ) -> Dict[uuid.UUID, Union[List[Offer], Exception]]:
+        """
+        Runs `register_and_get_offers` for many products under a single shared deadline.
+
+        Returns:
+            A mapping of product ID to its offers (empty on timeout), or to the
+            exception raised for that product.
+        """
+        deadline = Deadline.after(timeout)
+        requests = {product.id: product for product in products}
+        results = await asyncio.gather(
+            *(self._register_and_poll(product, priority, deadline) for product in requests.values()),
+            return_exceptions=True,
+        )
+        return dict(zip(requests.keys(), results))
+
+    async def _register(
+        self,
+        request_model: RegisterProductRequest,
+        priority: Priority,
+        deadline: Deadline,
+        authoritative: bool = False,
+    ) -> Product:
+        known_products = self._known_products
+        if known_products is not None and not authoritative and request_model.id in known_products:
+            raise ProductAlreadyFoundError(409, f"Product {request_model.id} is already registered (known locally).")
+        try:
+            response = await self._make_request(
+                "POST",
+                "/products/register",
+                priority=priority,
+                deadline=deadline,
+                routing_key=request_model.id,
+                json=request_model.model_dump(mode="json"),
+            )
+        except ProductAlreadyFoundError:
+            if known_products is not None:
+                known_products.add(request_model.id)
+            raise
+        product = Product.model_validate(response.json())
+        if known_products is not None:
+            known_products.add(request_model.id)
+        return product
+
+    async def _register_and_poll(
+        self, request_model: RegisterProductRequest, priority: Priority, deadline: Deadline
+    ) -> List[Offer]:
+        try:
+            await self._register(request_model, priority, deadline)
+        except ProductAlreadyFoundError:
+            pass
+        return await self._poll_scheduler.poll_until_non_empty(
+            lambda: self._fetch_offers(request_model.id, priority, deadline), deadline
+        )
+
+    async def _get_offers(
+        self, product_id: uuid.UUID, priority: Priority, deadline: Deadline
+    ) -> List[Offer]:
+        if self._offers_cache is not None:
+            return await self._offers_cache.get_or_fetch(
+                product_id, lambda: self._fetch_offers(product_id, priority, deadline), deadline
+            )
+        return await self._fetch_offers(product_id, priority, deadline)
+
+    async def _fetch_offers(
+        self, product_id: uuid.UUID, priority: Priority, deadline: Deadline
+    ) -> List[Offer]:
+        if self._hedger is not None:
+            # The lookup is idempotent, so a slow one can safely be raced by a second request.
+            return await self._hedger.run(
+                lambda: self._fetch_offers_once(product_id, priority, deadline), retryable=is_transient
+            )
+        return await self._fetch_offers_once(product_id, priority, deadline)
+
+    async def _fetch_offers_once(
+        self, product_id: uuid.UUID, priority: Priority, deadline: Deadline
+    ) -> List[Offer]:
+        response = await self._make_request(
+            "GET",
+            f"/products/{product_id}/offers",
+            priority=priority,
+            deadline=deadline,
+            routing_key=product_id,
+        )
         return [Offer.model_validate(item) for item in response.json()]
 
+    async def _fetch_offers_result(
+        self, product_id: uuid.UUID, priority: Priority, deadline: Deadline
+    ) -> Tuple[uuid.UUID, Union[List[Offer], Exception]]:
+        try:
+            return product_id, await self._get_offers(product_id, priority, deadline)
+        except Exception as e:
+            return product_id, e
+
     async def close(self) -> None:
-        """Closes the underlying HTTP client."""
-        await self._http_client.aclose()
+        """Stops pending offer polls and closes the underlying HTTP client(s) and index."""
+        await self._poll_scheduler.aclose()
+        if self._known_products is not None:
+            await self._known_products.aclose()
+        if self._offers_cache is not None:
+            self._offers_cache.close()
+        if self._router is not None:
+            await self._router.aclose()
+        else:
+            await self._http_client.aclose()
 
     async def __aenter__(self):
-        """Enters the async runtime context."""
+        """Enters the async runtime context, warming up first if configured."""
+        if self._warmup_connections > 0:
+            try:
+                await self.warmup()
+            except BaseException:
+                # __aexit__ does not run when __aenter__ fails.
+                await self.close()
+                raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -1,11 +1,11 @@
 import asyncio
-from typing import List
+from typing import List, Optional
 import uuid
 
 from offers_sdk_applift.config import get_settings
 from offers_sdk_applift.interfaces import SyncOffersClientInterface, OffersClientInterface
 from .httpx_offers_client import HttpxOffersClient
-from offers_sdk_applift.models import Product, Offer
+from offers_sdk_applift.models import Product, Offer, WarmupReport
 
 settings = get_settings()
 
@@ -15,7 +15,9 @@ class SyncOffersClient(SyncOffersClientInterface): # Implements the sync interfa
     A synchronous implementation of the SyncOffersAPI protocol.
 
     This class wraps an asynchronous client that conforms to the OffersAPI
-    protocol and exposes its methods as blocking, synchronous calls.
+    protocol and exposes its methods as blocking, synchronous calls. Every call
+    runs on the same private event loop, so pooled connections (e.g. those
+    opened by `warmup`) stay usable between calls until `close`.
     """
 
     def __init__(self, async_client: OffersClientInterface):
@@ -27,12 +29,13 @@ class SyncOffersClient(SyncOffersClientInterface): # Implements the sync interfa
                 asynchronous OffersClientInterface protocol.
         """
         self._async_client = async_client
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     @classmethod
     def from_credentials(
         cls,
         refresh_token: str,
-        base_url: str = "https://api.example.com/api/v1",
+        base_url: Optional[str] = None,
     ) -> "SyncOffersClientInterface":
         """
         A convenient factory method to create a client from a refresh token.
@@ -42,7 +45,7 @@ class SyncOffersClient(SyncOffersClientInterface): # Implements the sync interfa
 
         Args:
             refresh_token (str): The long-lived refresh token.
-            base_url (str): The base URL for the API.
+            base_url (Optional[str]): The base URL for the API. Defaults to `OFFERS_API_BASE_URL`.
 
         Returns:
             SyncOffersAPI: A new instance of the synchronous client.
@@ -53,18 +56,31 @@ class SyncOffersClient(SyncOffersClientInterface): # Implements the sync interfa
     def register_product(
         self, product_id: uuid.UUID, name: str, description: str
     ) -> Product:
-        return asyncio.run(self._async_client.register_product(
+        return self._run(self._async_client.register_product(
             product_id=product_id, name=name, description=description
         ))
 
     def get_offers(self, product_id: uuid.UUID) -> List[Offer]:
-        return asyncio.run(self._async_client.get_offers(product_id=product_id))
+        return self._run(self._async_client.get_offers(product_id=product_id))
+
+    def warmup(self, connections: Optional[int] = None) -> WarmupReport:
+        """Prefetches the access token and opens pooled connections. See `HttpxOffersClient.warmup`."""
+        return self._run(self._async_client.warmup(connections=connections))
 
     def close(self):
-        asyncio.run(self._async_client.close())
+        try:
+            self._run(self._async_client.close())
+        finally:
+            self._loop.close()
+            self._loop = None
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+    def _run(self, coroutine):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coroutine)
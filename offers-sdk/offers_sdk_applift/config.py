@@ -1,5 +1,6 @@
 
 import functools
+from typing import List, Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -10,9 +11,40 @@ class Settings(BaseSettings):
     OFFERS_SDK_REFRESH_TOKEN: str
     
     OFFERS_API_BASE_URL: str
+    # Regional base URLs to route between; used instead of OFFERS_API_BASE_URL when set.
+    OFFERS_API_BASE_URLS: List[str] = []
+    # Obtain a separate access token per regional endpoint.
+    REGION_SCOPED_TOKENS: bool = False
 
     TOKEN_EXPIRATION_SECONDS: int
     TOKEN_EXPIRATION_BUFFER_SECONDS: int
+
+    # Transport backend: "httpx" (default) or "h11", a leaner keep-alive pool on raw asyncio.
+    HTTP_BACKEND: Literal["httpx", "h11"] = "httpx"
+    # Run the CLI on uvloop, if installed.
+    USE_UVLOOP: bool = False
+
+    # Upper bound on requests in flight; also sizes the connection pool.
+    MAX_CONCURRENT_REQUESTS: int = 100
+    # Tune the in-flight limit (up to MAX_CONCURRENT_REQUESTS) from observed latency.
+    ADAPTIVE_CONCURRENCY: bool = False
+    # Hedge offer lookups slower than this latency percentile, within a budget (fraction of requests).
+    HEDGE_REQUESTS: bool = False
+    HEDGE_PERCENTILE: float = 0.95
+    HEDGE_BUDGET: float = 0.05
+    # Directory of the index of product IDs known to be registered; unset disables it.
+    KNOWN_PRODUCTS_INDEX_PATH: Optional[str] = None
+    # Host-wide offers cache shared by worker processes (e.g. a file under /dev/shm); unset disables it.
+    OFFERS_CACHE_PATH: Optional[str] = None
+    OFFERS_CACHE_TTL: float = 30.0
+    OFFERS_CACHE_SLOTS: int = 16384
+    # Connections per endpoint to open when the async client is entered; 0 disables warmup.
+    WARMUP_CONNECTIONS: int = 0
+
+    # Record all traffic to this file, or serve responses from a recording.
+    TRAFFIC_RECORD_PATH: Optional[str] = None
+    TRAFFIC_REPLAY_PATH: Optional[str] = None
+    TRAFFIC_REPLAY_SPEED: float = 1.0
     
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding='utf-8')
 
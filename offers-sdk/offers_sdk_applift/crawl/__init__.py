@@ -0,0 +1,5 @@
+from .product_id_file import ProductIdFile
+from .offer_crawler import OfferCrawler, CrawlProgress
+
+
+__all__ = ['ProductIdFile', 'OfferCrawler', 'CrawlProgress']
@@ -0,0 +1,246 @@
+import collections
+import contextlib
+import itertools
+import json
+import os
+import re
+import time
+import uuid
+from typing import Callable, Deque, Dict, List, Optional, Set, Union
+
+from pydantic import BaseModel
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.exceptions import is_transient
+from offers_sdk_applift.models import Offer
+from .product_id_file import ProductIdFile
+
+
+class CrawlProgress(BaseModel):
+    """A snapshot of crawl progress."""
+    completed: int
+    total: int
+    errors: int
+    retry_pending: int = 0
+    elapsed_seconds: float
+    items_per_second: float
+    eta_seconds: Optional[float] = None
+
+
+class OfferCrawler:
+    """
+    Fetches offers for every product in a `ProductIdFile`, resumably.
+
+    Results are appended as JSON lines to numbered output files that rotate
+    after `rotate_bytes`. Every `checkpoint_interval` seconds the output is
+    fsynced and a checkpoint is replaced atomically; it holds a low watermark
+    (every ID below it is done), the completed ranges above it, the IDs to
+    retry, and the current output file and byte offset. On restart, output written after the
+    last checkpoint is truncated and exactly the IDs not covered by it are
+    fetched again, so each product appears in the output once.
+
+    Only permanent failures (e.g. unknown products) are written as error
+    records. Transient ones (timeouts, 5xx, 408, 429) are not written; their
+    IDs count as done for the watermark but are kept in the checkpoint's
+    retry list, which the next run fetches first.
+
+    Memory stays constant: IDs are read from the memory-mapped file on
+    demand, at most `concurrency` requests are in flight, and only
+    completions above the watermark and transient failures are tracked.
+    """
+
+    CHECKPOINT_FILE = "checkpoint.json"
+    OUTPUT_FILE = "offers-{:05d}.jsonl"
+    _OUTPUT_PATTERN = re.compile(r"^offers-(\d{5})\.jsonl$")
+
+    def __init__(
+        self,
+        client: HttpxOffersClient,
+        product_ids: ProductIdFile,
+        output_dir: str,
+        concurrency: int = 50,
+        rotate_bytes: int = 256 << 20,
+        checkpoint_interval: float = 1.0,
+        timeout: Optional[float] = None,
+        on_progress: Optional[Callable[[CrawlProgress], None]] = None,
+    ):
+        """
+        Args:
+            client: The client to fetch offers with.
+            product_ids: The products to crawl.
+            output_dir: Where output files and the checkpoint are written.
+            concurrency: The maximum number of requests in flight.
+            rotate_bytes: Start a new output file once the current one is this large.
+            checkpoint_interval: Seconds between checkpoints (and progress reports).
+            timeout: Seconds each fetch may take, or None for no deadline.
+            on_progress: Called with a `CrawlProgress` after every checkpoint.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        self._client = client
+        self._product_ids = product_ids
+        self._output_dir = output_dir
+        self._concurrency = concurrency
+        self._rotate_bytes = rotate_bytes
+        self._checkpoint_interval = checkpoint_interval
+        self._timeout = timeout
+        self._on_progress = on_progress
+        self._checkpoint_path = os.path.join(output_dir, self.CHECKPOINT_FILE)
+        self._watermark = 0
+        self._done: Set[int] = set()
+        self._errors = 0
+        self._retry: Set[int] = set()
+        self._output_index = 0
+        self._in_flight: Dict[uuid.UUID, Deque[int]] = {}
+        self._restore()
+        self._output = open(self._output_path(self._output_index), "ab")
+        self._started = time.monotonic()
+        self._completed_at_start = self.completed
+
+    @property
+    def completed(self) -> int:
+        return self._watermark + len(self._done) - len(self._retry)
+
+    def progress(self) -> CrawlProgress:
+        """Returns the current progress, with throughput and ETA measured over this run."""
+        elapsed = time.monotonic() - self._started
+        rate = (self.completed - self._completed_at_start) / elapsed if elapsed > 0 else 0.0
+        remaining = len(self._product_ids) - self.completed - len(self._retry)
+        return CrawlProgress(
+            completed=self.completed,
+            total=len(self._product_ids),
+            errors=self._errors,
+            retry_pending=len(self._retry),
+            elapsed_seconds=elapsed,
+            items_per_second=rate,
+            eta_seconds=remaining / rate if rate > 0 else None,
+        )
+
+    async def run(self) -> CrawlProgress:
+        """
+        Crawls every product not yet covered by the checkpoint.
+
+        Cancelling the crawl (e.g. on Ctrl+C) writes a final checkpoint, so the
+        next run resumes where this one stopped.
+
+        Returns:
+            The final progress.
+        """
+        self._started = last_checkpoint = time.monotonic()
+        self._completed_at_start = self.completed
+        retrying = sorted(self._retry)
+        results = self._client.stream_offers(
+            self._pending_ids(retrying), concurrency=self._concurrency, timeout=self._timeout
+        )
+        try:
+            async with contextlib.aclosing(results):
+                async for product_id, result in results:
+                    indices = self._in_flight[product_id]
+                    index = indices.popleft()
+                    if not indices:
+                        del self._in_flight[product_id]
+                    if isinstance(result, Exception) and is_transient(result):
+                        # Done as far as the watermark goes, but fetched again by the next run.
+                        self._retry.add(index)
+                    else:
+                        self._write(product_id, result)
+                        self._retry.discard(index)
+                    self._mark_done(index)
+                    if time.monotonic() - last_checkpoint >= self._checkpoint_interval:
+                        self._checkpoint()
+                        last_checkpoint = time.monotonic()
+        finally:
+            self._checkpoint()
+            self._output.close()
+        return self.progress()
+
+    async def _pending_ids(self, retrying: List[int]):
+        pending = itertools.chain(
+            retrying, (index for index in range(self._watermark, len(self._product_ids)) if index not in self._done)
+        )
+        for index in pending:
+            product_id = self._product_ids[index]
+            self._in_flight.setdefault(product_id, collections.deque()).append(index)
+            yield product_id
+
+    def _write(self, product_id: uuid.UUID, result: Union[List[Offer], Exception]) -> None:
+        if isinstance(result, Exception):
+            self._errors += 1
+            record = {"product_id": str(product_id), "error": str(result)}
+        else:
+            record = {"product_id": str(product_id), "offers": [offer.model_dump(mode="json") for offer in result]}
+        self._output.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+        if self._output.tell() >= self._rotate_bytes:
+            self._output.flush()
+            os.fsync(self._output.fileno())
+            self._output.close()
+            self._output_index += 1
+            self._output = open(self._output_path(self._output_index), "ab")
+
+    def _mark_done(self, index: int) -> None:
+        if index < self._watermark:
+            return
+        self._done.add(index)
+        while self._watermark in self._done:
+            self._done.discard(self._watermark)
+            self._watermark += 1
+
+    def _checkpoint(self) -> None:
+        self._output.flush()
+        os.fsync(self._output.fileno())
+        state = {
+            "total": len(self._product_ids),
+            "watermark": self._watermark,
+            "done": self._ranges(self._done),
+            "retry": sorted(self._retry),
+            "errors": self._errors,
+            "output_index": self._output_index,
+            "output_offset": self._output.tell(),
+        }
+        tmp_path = f"{self._checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._checkpoint_path)
+        if self._on_progress is not None:
+            self._on_progress(self.progress())
+
+    def _restore(self) -> None:
+        try:
+            with open(self._checkpoint_path, "r") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            state = None
+        if state is not None:
+            if state["total"] != len(self._product_ids):
+                raise ValueError(
+                    f"The checkpoint in {self._output_dir} is for {state['total']} products, "
+                    f"not {len(self._product_ids)}; use a new output directory."
+                )
+            self._watermark = state["watermark"]
+            self._done = {index for start, end in state["done"] for index in range(start, end)}
+            self._retry = set(state.get("retry", ()))
+            self._errors = state["errors"]
+            self._output_index = state["output_index"]
+        # Drop output written after the last checkpoint; those products are fetched again.
+        for name in os.listdir(self._output_dir):
+            match = self._OUTPUT_PATTERN.match(name)
+            if match and int(match.group(1)) > self._output_index:
+                os.remove(os.path.join(self._output_dir, name))
+        current = self._output_path(self._output_index)
+        if os.path.exists(current):
+            with open(current, "r+b") as f:
+                f.truncate(state["output_offset"] if state is not None else 0)
+
+    def _output_path(self, index: int) -> str:
+        return os.path.join(self._output_dir, self.OUTPUT_FILE.format(index))
+
+    @staticmethod
+    def _ranges(indices: Set[int]) -> List[List[int]]:
+        ranges: List[List[int]] = []
+        for index in sorted(indices):
+            if ranges and ranges[-1][1] == index:
+                ranges[-1][1] += 1
+            else:
+                ranges.append([index, index + 1])
+        return ranges
@@ -0,0 +1,67 @@
+import mmap
+import os
+import uuid
+from typing import Iterator
+
+
+class ProductIdFile:
+    """
+    A read-only, memory-mapped array of product IDs stored as raw 16-byte UUIDs.
+
+    Random access by position costs no parsing and the OS pages the file in on
+    demand, so even hundreds of millions of IDs use constant process memory.
+    """
+
+    ID_SIZE = 16
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: A file written by `ProductIdFile.convert`.
+        """
+        size = os.path.getsize(path)
+        if size % self.ID_SIZE:
+            raise ValueError(f"{path} is not a binary product ID file (size {size} is not a multiple of 16)")
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._count = size // self.ID_SIZE
+
+    @classmethod
+    def convert(cls, text_path: str, binary_path: str) -> int:
+        """
+        Converts a text file with one UUID per line into the binary format.
+
+        Blank lines are skipped. The binary file is written under a temporary
+        name and renamed, so an interrupted conversion never leaves a partial file.
+
+        Returns:
+            The number of IDs written.
+        """
+        count = 0
+        tmp_path = f"{binary_path}.tmp"
+        with open(text_path, "r") as source, open(tmp_path, "wb") as target:
+            for line in source:
+                line = line.strip()
+                if line:
+                    target.write(uuid.UUID(line).bytes)
+                    count += 1
+        os.replace(tmp_path, binary_path)
+        return count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> uuid.UUID:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start = index * self.ID_SIZE
+        return uuid.UUID(bytes=self._map[start:start + self.ID_SIZE])
+
+    def __iter__(self) -> Iterator[uuid.UUID]:
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
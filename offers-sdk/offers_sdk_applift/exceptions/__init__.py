@@ -3,7 +3,9 @@ from .api_error import APIError
 from .authentication_error import AuthenticationError
 from .product_already_found_error import ProductAlreadyFoundError
 from .product_not_found_error import ProductNotFoundError
+from .deadline_exceeded_error import DeadlineExceededError
 from .exception_handler import request_exception_handler
+from .transient import is_transient
 
 
 __all__ = [
@@ -12,5 +14,7 @@ __all__ = [
     "AuthenticationError",
     "ProductNotFoundError",
     "ProductAlreadyFoundError",
+    "DeadlineExceededError",
     "request_exception_handler",
+    "is_transient",
 ]
@@ -0,0 +1,7 @@
+from .api_error import APIError
+
+
+class DeadlineExceededError(APIError):
+    """Raised when a request cannot complete before its deadline (504)."""
+    def __init__(self, message: str, status_code: int = 504):
+        super().__init__(status_code, message)
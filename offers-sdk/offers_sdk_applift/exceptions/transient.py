@@ -0,0 +1,18 @@
+from .api_error import APIError
+from .authentication_error import AuthenticationError
+
+
+TRANSIENT_STATUS_CODES = frozenset({408, 429})
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Tells whether a failed request may succeed if it is simply tried again.
+
+    Server errors (5xx, which include timeouts and network failures wrapped by
+    the client), 408 and 429 are transient. Other 4xx responses, rejected
+    tokens and errors that are not API errors are not.
+    """
+    if not isinstance(error, APIError) or isinstance(error.__cause__, AuthenticationError):
+        return False
+    return error.status_code >= 500 or error.status_code in TRANSIENT_STATUS_CODES
@@ -1,3 +1,12 @@
 from .httpx_client import HttpxClient
+from .h11_client import H11Client
+from .backends import HTTP_BACKENDS, create_http_client
+from .event_loop import install_uvloop
+from .recorded_exchange import RecordedExchange, read_exchanges, read_recording, recording_paths
+from .recording_http_client import RecordingHttpClient
+from .replay_http_client import ReplayHttpClient
+from .endpoint_router import Endpoint, EndpointRouter
 
-__all__ = ['HttpxClient']
+__all__ = ['HttpxClient', 'H11Client', 'HTTP_BACKENDS', 'create_http_client', 'install_uvloop',
+           'RecordedExchange', 'read_exchanges', 'read_recording', 'recording_paths', 'RecordingHttpClient',
+           'ReplayHttpClient', 'Endpoint', 'EndpointRouter']
@@ -0,0 +1,26 @@
+from typing import Dict, Type
+
+from offers_sdk_applift.interfaces import AsyncHttpClientInterface
+
+from .h11_client import H11Client
+from .httpx_client import HttpxClient
+
+
+HTTP_BACKENDS: Dict[str, Type[AsyncHttpClientInterface]] = {
+    "httpx": HttpxClient,
+    "h11": H11Client,
+}
+
+
+def create_http_client(backend: str, base_url: str, max_connections: int = 100) -> AsyncHttpClientInterface:
+    """
+    Creates the transport for a backend name, as used by the `HTTP_BACKEND` setting.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    try:
+        backend_class = HTTP_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown HTTP backend {backend!r}; choose one of {', '.join(HTTP_BACKENDS)}") from None
+    return backend_class(base_url=base_url, max_connections=max_connections)
@@ -0,0 +1,162 @@
+import bisect
+import hashlib
+import time
+import uuid
+from typing import Iterator, List, Optional, Sequence
+
+from offers_sdk_applift.interfaces import AsyncHttpClientInterface, TokenManagerInterface
+
+
+class Endpoint:
+    """One regional API endpoint with its own connection pool and health statistics."""
+
+    def __init__(
+        self,
+        base_url: str,
+        http_client: AsyncHttpClientInterface,
+        token_manager: Optional[TokenManagerInterface] = None,
+    ):
+        """
+        Args:
+            base_url: The endpoint's base URL.
+            http_client: The transport (and connection pool) for this endpoint.
+            token_manager: A token manager for this endpoint, if tokens are
+                region-scoped. None means the client's shared token manager is used.
+        """
+        self.base_url = base_url
+        self.http_client = http_client
+        self.token_manager = token_manager
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.last_observed = 0.0
+        self.probing = False
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.base_url!r}, latency={self.latency}, error_rate={self.error_rate:.2f})"
+
+
+class EndpointRouter:
+    """
+    Routes requests across endpoints by consistent hashing, avoiding unhealthy ones.
+
+    Each routing key (a product ID) has a stable preference order of endpoints
+    from a hash ring with virtual nodes, so a product keeps hitting the same
+    endpoint and its caches. The first endpoint in that order that is not
+    degraded is used. An endpoint is degraded when its EWMA error rate exceeds
+    `max_error_rate` or its EWMA latency exceeds `max_latency_ratio` times the
+    best endpoint's. A degraded endpoint that has not been tried for
+    `probe_interval` seconds gets one probe request, whose outcome replaces
+    its stale statistics, so it can recover.
+    """
+
+    VIRTUAL_NODES = 64
+
+    def __init__(
+        self,
+        endpoints: Sequence[Endpoint],
+        smoothing: float = 0.1,
+        max_error_rate: float = 0.2,
+        max_latency_ratio: float = 2.0,
+        probe_interval: float = 5.0,
+    ):
+        """
+        Args:
+            endpoints: The endpoints to route across.
+            smoothing: The EWMA weight of each new latency or error sample.
+            max_error_rate: The error rate above which an endpoint is avoided.
+            max_latency_ratio: How much slower than the fastest endpoint one may
+                be before it is avoided.
+            probe_interval: Seconds after which an avoided endpoint is retried.
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        self._endpoints = list(endpoints)
+        self._smoothing = smoothing
+        self._max_error_rate = max_error_rate
+        self._max_latency_ratio = max_latency_ratio
+        self._probe_interval = probe_interval
+        ring = sorted(
+            (self._hash(f"{endpoint.base_url}#{replica}".encode()), index)
+            for index, endpoint in enumerate(self._endpoints)
+            for replica in range(self.VIRTUAL_NODES)
+        )
+        self._ring_hashes = [point for point, _ in ring]
+        self._ring_owners = [index for _, index in ring]
+
+    @property
+    def endpoints(self) -> List[Endpoint]:
+        return list(self._endpoints)
+
+    def preference(self, key: Optional[uuid.UUID]) -> Iterator[Endpoint]:
+        """Yields every endpoint once, in the key's consistent-hash preference order."""
+        if key is None:
+            key = uuid.uuid4()
+        start = bisect.bisect(self._ring_hashes, self._hash(key.bytes))
+        seen = set()
+        for offset in range(len(self._ring_owners)):
+            index = self._ring_owners[(start + offset) % len(self._ring_owners)]
+            if index not in seen:
+                seen.add(index)
+                yield self._endpoints[index]
+                if len(seen) == len(self._endpoints):
+                    return
+
+    def pick(self, key: Optional[uuid.UUID] = None) -> Endpoint:
+        """Chooses the endpoint for a request; keyless requests are spread randomly."""
+        now = time.monotonic()
+        best_latency = min(
+            (endpoint.latency for endpoint in self._endpoints if endpoint.latency is not None),
+            default=None,
+        )
+        candidates = list(self.preference(key))
+        for endpoint in candidates:
+            if not self._is_degraded(endpoint, best_latency):
+                return endpoint
+            if now - endpoint.last_observed > self._probe_interval:
+                endpoint.probing = True
+                endpoint.last_observed = now
+                return endpoint
+        return min(candidates, key=lambda endpoint: (endpoint.error_rate, endpoint.latency or 0.0))
+
+    def observe(self, endpoint: Endpoint, latency: float, failed: bool) -> None:
+        """Records the outcome of one request to `endpoint`."""
+        endpoint.last_observed = time.monotonic()
+        if endpoint.probing:
+            # A probe of an avoided endpoint: its old statistics are stale.
+            endpoint.probing = False
+            endpoint.error_rate = float(failed)
+            endpoint.latency = endpoint.latency if failed else latency
+            return
+        endpoint.error_rate += self._smoothing * (float(failed) - endpoint.error_rate)
+        if failed:
+            return
+        if endpoint.latency is None:
+            endpoint.latency = latency
+        else:
+            endpoint.latency += self._smoothing * (latency - endpoint.latency)
+
+    def abandon(self, endpoint: Endpoint) -> None:
+        """
+        Ends a probe of `endpoint` whose request finished without an outcome (e.g. it was cancelled).
+
+        The endpoint stays avoided and is probed again after the probe interval.
+        """
+        endpoint.probing = False
+
+    async def aclose(self) -> None:
+        """Closes every endpoint's transport."""
+        for endpoint in self._endpoints:
+            await endpoint.http_client.aclose()
+
+    def _is_degraded(self, endpoint: Endpoint, best_latency: Optional[float]) -> bool:
+        if endpoint.error_rate > self._max_error_rate:
+            return True
+        return (
+            endpoint.latency is not None
+            and best_latency is not None
+            and endpoint.latency > best_latency * self._max_latency_ratio
+        )
+
+    @staticmethod
+    def _hash(data: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
@@ -0,0 +1,16 @@
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Makes uvloop the event loop of subsequent `asyncio.run` calls, if it is installed.
+
+    Returns:
+        True if uvloop was installed, False if it is not available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
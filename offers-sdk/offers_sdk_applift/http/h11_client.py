@@ -0,0 +1,231 @@
+import asyncio
+import collections
+import json as jsonlib
+import ssl
+from typing import Any, Deque, List, Optional, Tuple
+
+import h11
+import httpx
+from httpx import Response
+
+from offers_sdk_applift.interfaces import AsyncHttpClientInterface
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection and its h11 state machine."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.state = h11.Connection(our_role=h11.CLIENT)
+
+    @property
+    def reusable(self) -> bool:
+        return (
+            self.state.our_state is h11.IDLE
+            and not self.reader.at_eof()
+            and not self.writer.is_closing()
+        )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+# Marks a request that did not pass `timeout`, so the client's default applies (like httpx).
+_USE_CLIENT_DEFAULT: Any = object()
+
+
+class _StaleConnection(Exception):
+    """A reused connection failed before any response bytes arrived; the server had likely closed it."""
+
+
+class H11Client(AsyncHttpClientInterface):
+    """
+    A lean HTTP/1.1 transport on raw asyncio streams and h11, with a keep-alive pool.
+
+    It skips most of what makes a general-purpose client flexible (auth flows,
+    cookies, redirects, event hooks, proxies, HTTP/2) and so spends much less
+    CPU per request than `HttpxClient` at high request rates. Responses are
+    regular `httpx.Response` objects with their request attached, and failures
+    raise the matching `httpx` exceptions (`ConnectError`, `ReadTimeout`,
+    `PoolTimeout`, ...), so callers cannot tell the backends apart.
+
+    Supported request arguments are `headers`, `params`, `json`, `content` and
+    `timeout` (seconds for the whole exchange, including waiting for a
+    connection; the client's 5 second default like httpx's when not given,
+    none when None). Like httpcore, a request that fails on a reused keep-alive
+    connection before any response bytes arrive (the server closed the idle
+    connection) is retried once on a new connection.
+    """
+
+    def __init__(self, base_url: str, max_connections: int = 100, timeout: Optional[float] = 5.0):
+        """
+        Args:
+            base_url: The base URL that request paths are appended to.
+            max_connections: The most connections open at once.
+            timeout: Seconds an exchange may take when a request does not say, or None for no limit.
+        """
+        self._base_url = httpx.URL(base_url)
+        if self._base_url.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {self._base_url.scheme!r}")
+        self._base_path = self._base_url.raw_path.split(b"?")[0].rstrip(b"/")
+        self._host = self._base_url.host
+        self._port = self._base_url.port or (443 if self._base_url.scheme == "https" else 80)
+        default_port = self._base_url.port is None
+        self._host_header = self._host.encode() if default_port else f"{self._host}:{self._port}".encode()
+        self._ssl = ssl.create_default_context() if self._base_url.scheme == "https" else None
+        self._idle: Deque[_Connection] = collections.deque()
+        self._slots = asyncio.Semaphore(max_connections)
+        self._timeout = timeout
+        self._closed = False
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[dict] = None,
+        params: Any = None,
+        json: Any = None,
+        content: Optional[bytes] = None,
+        timeout: Optional[float] = _USE_CLIENT_DEFAULT,
+        **kwargs: Any,
+    ) -> Response:
+        if kwargs:
+            raise TypeError(f"H11Client does not support: {', '.join(sorted(kwargs))}")
+        if self._closed:
+            raise RuntimeError("Cannot send a request, as the client has been closed.")
+        if timeout is _USE_CLIENT_DEFAULT:
+            timeout = self._timeout
+        body = content or b""
+        request_headers = [(b"Host", self._host_header), (b"Accept", b"*/*"), (b"User-Agent", b"offers-sdk")]
+        if json is not None:
+            body = jsonlib.dumps(json, separators=(",", ":")).encode()
+            request_headers.append((b"Content-Type", b"application/json"))
+        request_headers.append((b"Content-Length", str(len(body)).encode()))
+        for name, value in (headers or {}).items():
+            request_headers.append((name.encode(), str(value).encode()))
+        request = httpx.Request(method, self._merge_url(url, params), headers=request_headers, content=body)
+
+        phase = ["pool"]
+        try:
+            status_code, response_headers, response_body = await asyncio.wait_for(
+                self._exchange(method, request, request_headers, body, phase), timeout
+            )
+        except asyncio.TimeoutError as e:
+            exception = {"pool": httpx.PoolTimeout, "connect": httpx.ConnectTimeout, "write": httpx.WriteTimeout}
+            raise exception.get(phase[0], httpx.ReadTimeout)(f"Timed out during {phase[0]}", request=request) from e
+        return Response(status_code, headers=response_headers, content=response_body, request=request)
+
+    async def post(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        self._closed = True
+        while self._idle:
+            self._idle.popleft().close()
+
+    def _merge_url(self, url: str, params: Any) -> httpx.URL:
+        # Like httpx, relative paths are appended to the base URL's path.
+        path = url if url.startswith("/") else f"/{url}"
+        merged = self._base_url.copy_with(raw_path=self._base_path + path.encode())
+        return merged.copy_merge_params(params) if params else merged
+
+    async def _exchange(
+        self,
+        method: str,
+        request: httpx.Request,
+        headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+        phase: List[str],
+    ) -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+        async with self._slots:
+            connection = self._checkout()
+            while True:
+                reused = connection is not None
+                if connection is None:
+                    phase[0] = "connect"
+                    connection = await self._connect(request)
+                try:
+                    return await self._exchange_on(connection, method, request, headers, body, phase, reused)
+                except _StaleConnection:
+                    connection = None
+
+    async def _exchange_on(
+        self,
+        connection: _Connection,
+        method: str,
+        request: httpx.Request,
+        headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+        phase: List[str],
+        reused: bool,
+    ) -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+        reusable = False
+        received_any = False
+        try:
+            phase[0] = "write"
+            target = request.url.raw_path
+            data = connection.state.send(h11.Request(method=method, target=target, headers=headers))
+            if body:
+                data += connection.state.send(h11.Data(data=body))
+            data += connection.state.send(h11.EndOfMessage())
+            connection.writer.write(data)
+            await connection.writer.drain()
+
+            phase[0] = "read"
+            status_code, response_headers, chunks = 0, [], []
+            while True:
+                event = connection.state.next_event()
+                if event is h11.NEED_DATA:
+                    received = await connection.reader.read(65536)
+                    received_any = received_any or bool(received)
+                    connection.state.receive_data(received)
+                    continue
+                if isinstance(event, h11.Response):
+                    status_code, response_headers = event.status_code, list(event.headers)
+                elif isinstance(event, h11.Data):
+                    chunks.append(bytes(event.data))
+                elif isinstance(event, h11.EndOfMessage):
+                    break
+                elif isinstance(event, h11.ConnectionClosed):
+                    raise httpx.RemoteProtocolError("Server disconnected without sending a response.", request=request)
+            if connection.state.our_state is h11.DONE and connection.state.their_state is h11.DONE:
+                connection.state.start_next_cycle()
+                reusable = True
+            return status_code, response_headers, b"".join(chunks)
+        except (h11.RemoteProtocolError, httpx.RemoteProtocolError, OSError) as e:
+            if reused and not received_any:
+                raise _StaleConnection() from e
+            if isinstance(e, h11.RemoteProtocolError):
+                raise httpx.RemoteProtocolError(str(e), request=request) from e
+            if isinstance(e, OSError):
+                error = httpx.WriteError if phase[0] == "write" else httpx.ReadError
+                raise error(str(e) or type(e).__name__, request=request) from e
+            raise
+        finally:
+            # A cancelled or failed exchange leaves the connection mid-message.
+            if reusable and not self._closed:
+                self._idle.append(connection)
+            else:
+                connection.close()
+
+    def _checkout(self) -> Optional[_Connection]:
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.reusable:
+                return connection
+            connection.close()
+        return None
+
+    async def _connect(self, request: httpx.Request) -> _Connection:
+        try:
+            reader, writer = await asyncio.open_connection(
+                self._host, self._port, ssl=self._ssl, server_hostname=self._host if self._ssl else None
+            )
+        except OSError as e:
+            raise httpx.ConnectError(str(e) or type(e).__name__, request=request) from e
+        return _Connection(reader, writer)
@@ -1,12 +1,15 @@
 from typing import Any
-from httpx import Response, AsyncClient
+from httpx import Response, AsyncClient, Limits
 from offers_sdk_applift.interfaces  import AsyncHttpClientInterface
 
 
 class HttpxClient(AsyncHttpClientInterface):
     """Concrete implementation of the HTTP client using httpx."""
-    def __init__(self, base_url: str):
-        self._client = AsyncClient(base_url=base_url)
+    def __init__(self, base_url: str, max_connections: int = 100):
+        self._client = AsyncClient(
+            base_url=base_url,
+            limits=Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
 
     async def request(self, method: str, url: str, **kwargs: Any) -> Response:
         return await self._client.request(method, url, **kwargs)
@@ -0,0 +1,93 @@
+import glob
+import gzip
+import heapq
+import json
+import os
+from typing import Any, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+
+FORMAT_NAME = "offers-sdk-traffic"
+FORMAT_VERSION = 1
+REDACTED = "REDACTED"
+
+
+class RecordedExchange(BaseModel):
+    """One request/response pair captured at the transport layer."""
+    offset: float
+    duration: float
+    method: str
+    url: str
+    request_json: Optional[Any] = None
+    status_code: int
+    content_type: Optional[str] = None
+    body: str = ""
+
+
+def redact(payload: Any) -> Any:
+    """Replaces the values of any token fields in a JSON payload."""
+    if isinstance(payload, dict):
+        return {
+            key: REDACTED if "token" in key.lower() else redact(value)
+            for key, value in payload.items()
+        }
+    if isinstance(payload, list):
+        return [redact(item) for item in payload]
+    return payload
+
+
+def read_exchanges(path: str) -> Iterator[RecordedExchange]:
+    """
+    Reads a recording written by `RecordingHttpClient`.
+
+    Recordings are gzip-compressed JSON lines: a header line followed by one
+    line per exchange, in the order the requests were started.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline() or "{}")
+        if header.get("format") != FORMAT_NAME:
+            raise ValueError(f"{path} is not an offers-sdk traffic recording")
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version: {header.get('version')}")
+        for line in f:
+            if line.strip():
+                yield RecordedExchange.model_validate_json(line)
+
+
+def recording_paths(path: str) -> List[str]:
+    """
+    Resolves a recording path to the files it stands for.
+
+    A router-mode recording is split into one file per endpoint, suffixed
+    with the endpoint index (`traffic.jsonl.gz.0`, `traffic.jsonl.gz.1`, ...);
+    its base path stands for all of them. Glob patterns are expanded too.
+
+    Raises:
+        FileNotFoundError: If no recording matches.
+    """
+    if glob.has_magic(path):
+        paths = sorted(glob.glob(path))
+    else:
+        paths = [path] if os.path.isfile(path) else []
+        suffixed = [
+            candidate for candidate in glob.glob(f"{glob.escape(path)}.*")
+            if candidate.rsplit(".", 1)[1].isdigit()
+        ]
+        paths += sorted(suffixed, key=lambda candidate: int(candidate.rsplit(".", 1)[1]))
+    if not paths:
+        raise FileNotFoundError(f"No traffic recording found at {path}")
+    return paths
+
+
+def read_recording(path: str) -> Iterator[RecordedExchange]:
+    """
+    Reads every file of a (possibly split) recording, merged in order of start offset.
+
+    Args:
+        path: A recording file, the base path of a per-endpoint recording, or a glob pattern.
+    """
+    return heapq.merge(
+        *(read_exchanges(file_path) for file_path in recording_paths(path)),
+        key=lambda exchange: exchange.offset,
+    )
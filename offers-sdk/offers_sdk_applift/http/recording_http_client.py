@@ -0,0 +1,97 @@
+import gzip
+import json
+import time
+from typing import Any, List, Optional
+
+import httpx
+from httpx import Response
+
+from offers_sdk_applift.interfaces import AsyncHttpClientInterface
+
+from .recorded_exchange import FORMAT_NAME, FORMAT_VERSION, RecordedExchange, redact
+
+
+class RecordingHttpClient(AsyncHttpClientInterface):
+    """
+    A transport decorator that records every exchange of the wrapped client.
+
+    Request headers are never recorded, and token fields in request and
+    response bodies are redacted, so recordings can be shared safely.
+    """
+
+    def __init__(self, http_client: AsyncHttpClientInterface, path: str, flush_every: int = 100):
+        """
+        Args:
+            http_client: The transport that actually performs the requests.
+            path: Where to write the gzip-compressed recording.
+            flush_every: The number of exchanges buffered before writing to disk.
+        """
+        self._http_client = http_client
+        self._path = path
+        self._flush_every = flush_every
+        self._buffer: List[RecordedExchange] = []
+        self._file: Optional[gzip.GzipFile] = None
+        self._started_at = time.monotonic()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        started = time.monotonic()
+        try:
+            response = await self._http_client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            self._record(method, url, kwargs, started, status_code=0, body=str(e))
+            raise
+        self._record(
+            method,
+            url,
+            kwargs,
+            started,
+            status_code=response.status_code,
+            content_type=response.headers.get("content-type"),
+            body=self._redacted_body(response),
+        )
+        return response
+
+    async def post(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        self._flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        await self._http_client.aclose()
+
+    def _record(self, method: str, url: str, kwargs: dict, started: float, **response: Any) -> None:
+        self._buffer.append(RecordedExchange(
+            offset=started - self._started_at,
+            duration=time.monotonic() - started,
+            method=method,
+            url=str(url),
+            request_json=redact(kwargs.get("json")),
+            **response,
+        ))
+        if len(self._buffer) >= self._flush_every:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._file = gzip.open(self._path, "wt", encoding="utf-8")
+            self._file.write(json.dumps({"format": FORMAT_NAME, "version": FORMAT_VERSION}) + "\n")
+        self._file.writelines(
+            exchange.model_dump_json(exclude_none=True) + "\n" for exchange in self._buffer
+        )
+        self._buffer.clear()
+
+    @staticmethod
+    def _redacted_body(response: Response) -> str:
+        if "json" not in response.headers.get("content-type", ""):
+            return response.text
+        try:
+            return json.dumps(redact(response.json()), separators=(",", ":"))
+        except json.JSONDecodeError:
+            return response.text
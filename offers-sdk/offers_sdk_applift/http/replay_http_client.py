@@ -0,0 +1,73 @@
+import asyncio
+import re
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import httpx
+from httpx import Response
+
+from offers_sdk_applift.interfaces import AsyncHttpClientInterface
+
+from .recorded_exchange import RecordedExchange, read_recording
+
+
+_UUID = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+
+class ReplayHttpClient(AsyncHttpClientInterface):
+    """
+    A transport that serves responses from a recording instead of the network.
+
+    Requests are matched on method and URL; requests for IDs that were never
+    recorded fall back to a recording of the same endpoint for another ID.
+    Matching exchanges are served round-robin, each after its recorded latency
+    divided by `speed`.
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, base_url: str = "https://replay.invalid"):
+        """
+        Args:
+            path: A recording written by `RecordingHttpClient`, or the base path
+                or a glob pattern of a per-endpoint recording.
+            speed: The latency speed factor (1.0 serves each response after its
+                recorded latency, 10.0 ten times sooner). None or 0 serves every
+                response immediately.
+            base_url: The base URL reported on the responses' requests.
+        """
+        self._speed = speed or None
+        self._base_url = base_url.rstrip("/")
+        self._exact: Dict[Tuple[str, str], Deque[RecordedExchange]] = defaultdict(deque)
+        self._templates: Dict[Tuple[str, str], Deque[RecordedExchange]] = defaultdict(deque)
+        for exchange in read_recording(path):
+            self._exact[(exchange.method, exchange.url)].append(exchange)
+            self._templates[(exchange.method, self._template(exchange.url))].append(exchange)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        method = method.upper()
+        url = str(url)
+        exchanges = self._exact.get((method, url)) or self._templates.get((method, self._template(url)))
+        if not exchanges:
+            raise httpx.ConnectError(f"No recorded exchange for {method} {url}")
+        exchange = exchanges[0]
+        exchanges.rotate(-1)
+
+        if self._speed:
+            await asyncio.sleep(exchange.duration / self._speed)
+        request = httpx.Request(method, f"{self._base_url}{url}")
+        if exchange.status_code == 0:
+            raise httpx.ConnectError(exchange.body, request=request)
+        headers = {"content-type": exchange.content_type} if exchange.content_type else {}
+        return Response(exchange.status_code, headers=headers, content=exchange.body.encode(), request=request)
+
+    async def post(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        pass
+
+    @staticmethod
+    def _template(url: str) -> str:
+        return _UUID.sub("{id}", url)
@@ -0,0 +1,5 @@
+from .bloom_filter import BloomFilter
+from .known_products_index import IndexInUseError, KnownProductsIndex
+
+
+__all__ = ['BloomFilter', 'IndexInUseError', 'KnownProductsIndex']
@@ -0,0 +1,65 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    A fixed-size bloom filter over 16-byte keys, backed by a memory-mapped file.
+
+    Sized for `capacity` keys at `false_positive_rate`; beyond that it keeps
+    working with a rising false-positive rate. Bit positions come from double
+    hashing one blake2b digest, so a lookup hashes once.
+    """
+
+    MAGIC = b"OSDKBLM1"
+    HEADER = struct.Struct("<8sQQ")
+
+    def __init__(self, path: str, capacity: int, false_positive_rate: float = 0.01):
+        """
+        Args:
+            path: The backing file; created if missing or sized for other parameters.
+            capacity: The number of keys the filter is sized for.
+            false_positive_rate: The target false-positive rate at `capacity`.
+        """
+        bits = max(64, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self._bits = (bits + 7) // 8 * 8
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        size = self.HEADER.size + self._bits // 8
+        header = self.HEADER.pack(self.MAGIC, self._bits, self._hashes)
+        self.created = True
+        if os.path.exists(path) and os.path.getsize(path) == size:
+            with open(path, "rb") as f:
+                self.created = f.read(self.HEADER.size) != header
+        if self.created:
+            with open(path, "wb") as f:
+                f.write(header)
+                f.truncate(size)
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    def add(self, key: bytes) -> None:
+        offset = self.HEADER.size
+        for position in self._positions(key):
+            self._map[offset + position // 8] |= 1 << (position % 8)
+
+    def __contains__(self, key: bytes) -> bool:
+        offset = self.HEADER.size
+        return all(self._map[offset + position // 8] & (1 << (position % 8)) for position in self._positions(key))
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def _positions(self, key: bytes) -> Iterator[int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first, second = struct.unpack("<QQ", digest)
+        second |= 1
+        for i in range(self._hashes):
+            yield (first + i * second) % self._bits
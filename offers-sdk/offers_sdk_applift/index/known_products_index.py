@@ -0,0 +1,253 @@
+import asyncio
+import contextlib
+import heapq
+import mmap
+import os
+import uuid
+from typing import Iterable, Iterator, Optional, Set
+
+from filelock import FileLock, Timeout
+
+from .bloom_filter import BloomFilter
+
+
+class IndexInUseError(RuntimeError):
+    """Raised when another process already has the index directory open."""
+
+
+class KnownProductsIndex:
+    """
+    A persistent set of product IDs known to be registered with the API.
+
+    IDs are stored as raw 16-byte UUIDs in two files: a sorted, memory-mapped
+    file searched by bisection, and an append-only log of IDs added since the
+    last compaction, held in memory as a set. A memory-mapped bloom filter
+    answers the common "not known" case without touching either. At ten
+    million IDs the sorted file is 160 MB on disk (paged in on demand) and the
+    bloom filter about 12 MB.
+
+    Membership is exact: bloom-filter false positives are resolved against
+    the stored IDs. Only one process at a time may open a directory: it is
+    locked until `close`, and opening it elsewhere raises `IndexInUseError`.
+    Losing the tail of the log in a crash only costs a redundant registration
+    call.
+
+    Once the log holds `compact_after` IDs it is merged into the sorted file.
+    Inside an event loop the merge runs in a worker thread while lookups and
+    adds continue; IDs already in the sorted file are dropped when the log is
+    loaded, so a crash halfway through compaction never counts an ID twice.
+    """
+
+    BLOOM_FILE = "known_products.bloom"
+    SORTED_FILE = "known_products.ids"
+    LOG_FILE = "known_products.log"
+    LOCK_FILE = "known_products.lock"
+    KEY_SIZE = 16
+
+    def __init__(
+        self,
+        directory: str,
+        capacity: int = 10_000_000,
+        false_positive_rate: float = 0.01,
+        compact_after: int = 100_000,
+    ):
+        """
+        Args:
+            directory: Where the index files live.
+            capacity: The number of IDs the bloom filter is sized for.
+            false_positive_rate: The bloom filter's target false-positive rate.
+            compact_after: Merge the log into the sorted file once it holds this many IDs.
+
+        Raises:
+            IndexInUseError: If another process has `directory` open.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory_lock = FileLock(os.path.join(directory, self.LOCK_FILE))
+        try:
+            self._directory_lock.acquire(timeout=0)
+        except Timeout:
+            raise IndexInUseError(
+                f"{directory} is already open in another process; a known-products index has a single writer."
+            ) from None
+        self._sorted_path = os.path.join(directory, self.SORTED_FILE)
+        self._log_path = os.path.join(directory, self.LOG_FILE)
+        self._compact_after = compact_after
+        self._sorted_file = None
+        self._sorted: Optional[mmap.mmap] = None
+        self._open_sorted()
+        self._recent = self._load_log()
+        self._compacting: Set[bytes] = set()
+        self._compaction: Optional[asyncio.Task] = None
+        self._log = open(self._log_path, "ab", buffering=0)
+        self._bloom = BloomFilter(os.path.join(directory, self.BLOOM_FILE), capacity, false_positive_rate)
+        if self._bloom.created:
+            for key in self._iter_sorted():
+                self._bloom.add(key)
+            for key in self._recent:
+                self._bloom.add(key)
+
+    def __contains__(self, product_id: uuid.UUID) -> bool:
+        key = product_id.bytes
+        if key not in self._bloom:
+            return False
+        return key in self._recent or key in self._compacting or self._in_sorted(key)
+
+    def __len__(self) -> int:
+        return self._sorted_count() + len(self._compacting) + len(self._recent)
+
+    def add(self, product_id: uuid.UUID) -> None:
+        """Records that a product is registered."""
+        if product_id in self:
+            return
+        key = product_id.bytes
+        self._log.write(key)
+        self._recent.add(key)
+        self._bloom.add(key)
+        if len(self._recent) >= self._compact_after and self._compaction is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.compact()
+            else:
+                self._compaction = loop.create_task(self.compact_async())
+                self._compaction.add_done_callback(self._compaction_done)
+
+    def update(self, product_ids: Iterable[uuid.UUID]) -> None:
+        for product_id in product_ids:
+            self.add(product_id)
+
+    def compact(self) -> None:
+        """Merges the log into the sorted file and empties the log."""
+        if not self._recent or self._compacting:
+            return
+        self._compacting, self._recent = self._recent, set()
+        try:
+            tmp_path = self._write_merged(self._compacting)
+            self._install(tmp_path)
+        finally:
+            self._recent |= self._compacting
+            self._compacting = set()
+
+    async def compact_async(self) -> None:
+        """Like `compact`, but merges in a worker thread so the event loop keeps serving."""
+        if not self._recent or self._compacting:
+            return
+        self._compacting, self._recent = self._recent, set()
+        try:
+            tmp_path = await asyncio.to_thread(self._write_merged, self._compacting)
+            self._install(tmp_path)
+        finally:
+            # After a successful install these are in the sorted file; otherwise they stay pending.
+            self._recent |= self._compacting
+            self._compacting = set()
+
+    def _compaction_done(self, task: asyncio.Task) -> None:
+        self._compaction = None
+        if not task.cancelled():
+            # A failed background merge is retried at the next threshold; don't warn.
+            task.exception()
+
+    def close(self) -> None:
+        """Flushes the bloom filter and closes the index files."""
+        if self._compaction is not None:
+            # The thread merges from its own mapping; its output is simply not installed.
+            self._compaction.cancel()
+        self._bloom.flush()
+        self._bloom.close()
+        self._log.close()
+        self._close_sorted()
+        self._directory_lock.release()
+
+    async def aclose(self) -> None:
+        """Waits for a running compaction, then closes the index."""
+        if self._compaction is not None:
+            await asyncio.gather(self._compaction, return_exceptions=True)
+        self.close()
+
+    def _write_merged(self, keys: Set[bytes]) -> str:
+        # Runs in a worker thread: read the sorted file through a private mapping.
+        tmp_path = f"{self._sorted_path}.tmp"
+        with open(tmp_path, "wb") as f, self._map_sorted() as existing:
+            count = len(existing) // self.KEY_SIZE if existing is not None else 0
+            current = (existing[i * self.KEY_SIZE:(i + 1) * self.KEY_SIZE] for i in range(count))
+            previous = None
+            for key in heapq.merge(current, sorted(keys)):
+                if key != previous:
+                    f.write(key)
+                    previous = key
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp_path
+
+    def _install(self, tmp_path: str) -> None:
+        self._close_sorted()
+        os.replace(tmp_path, self._sorted_path)
+        self._open_sorted()
+        self._compacting.clear()
+        # Only drop the merged IDs from the log once the merged file is durable.
+        # IDs added while merging are carried over into the new log.
+        log_tmp_path = f"{self._log_path}.tmp"
+        with open(log_tmp_path, "wb") as f:
+            f.write(b"".join(self._recent))
+            f.flush()
+            os.fsync(f.fileno())
+        self._log.close()
+        os.replace(log_tmp_path, self._log_path)
+        self._log = open(self._log_path, "ab", buffering=0)
+
+    def _in_sorted(self, key: bytes) -> bool:
+        low, high = 0, self._sorted_count()
+        while low < high:
+            middle = (low + high) // 2
+            start = middle * self.KEY_SIZE
+            probe = self._sorted[start:start + self.KEY_SIZE]
+            if probe == key:
+                return True
+            if probe < key:
+                low = middle + 1
+            else:
+                high = middle
+        return False
+
+    def _iter_sorted(self) -> Iterator[bytes]:
+        for index in range(self._sorted_count()):
+            start = index * self.KEY_SIZE
+            yield self._sorted[start:start + self.KEY_SIZE]
+
+    @contextlib.contextmanager
+    def _map_sorted(self) -> Iterator[Optional[mmap.mmap]]:
+        if not os.path.exists(self._sorted_path) or os.path.getsize(self._sorted_path) == 0:
+            yield None
+            return
+        with open(self._sorted_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+    def _sorted_count(self) -> int:
+        return len(self._sorted) // self.KEY_SIZE if self._sorted is not None else 0
+
+    def _open_sorted(self) -> None:
+        if not os.path.exists(self._sorted_path) or os.path.getsize(self._sorted_path) == 0:
+            return
+        self._sorted_file = open(self._sorted_path, "rb")
+        self._sorted = mmap.mmap(self._sorted_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _close_sorted(self) -> None:
+        if self._sorted is not None:
+            self._sorted.close()
+            self._sorted_file.close()
+            self._sorted = None
+            self._sorted_file = None
+
+    def _load_log(self) -> Set[bytes]:
+        if not os.path.exists(self._log_path):
+            return set()
+        with open(self._log_path, "r+b") as f:
+            data = f.read()
+            whole = len(data) - len(data) % self.KEY_SIZE
+            if whole != len(data):
+                # A torn write from a crash: drop the partial ID.
+                f.truncate(whole)
+        keys = {data[start:start + self.KEY_SIZE] for start in range(0, whole, self.KEY_SIZE)}
+        # A crash after compaction replaced the sorted file but before the log
+        # was rewritten leaves merged IDs in the log; they are not recent.
+        return {key for key in keys if not self._in_sorted(key)}
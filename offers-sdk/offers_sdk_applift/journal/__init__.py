@@ -0,0 +1,5 @@
+from .registration_journal import RegistrationJournal
+from .write_behind_registrar import WriteBehindRegistrar
+
+
+__all__ = ['RegistrationJournal', 'WriteBehindRegistrar']
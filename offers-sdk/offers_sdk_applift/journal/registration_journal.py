@@ -0,0 +1,166 @@
+import asyncio
+import json
+import os
+from typing import List, Optional, Set, Tuple
+
+from offers_sdk_applift.models import RegisterProductRequest
+
+
+class RegistrationJournal:
+    """
+    A durable, append-only log of pending product registrations.
+
+    Appends are group-committed: every append waiting within the same
+    `fsync_interval` is written and fsynced together, so throughput does not
+    collapse to one fsync per registration. Completion is tracked separately
+    in a checkpoint file (a low watermark plus the completed sequence numbers
+    above it), which is replaced atomically. On open, entries neither below the
+    watermark nor marked done are recovered for another flush attempt.
+    """
+
+    JOURNAL_FILE = "registrations.jsonl"
+    CHECKPOINT_FILE = "checkpoint.json"
+
+    def __init__(self, directory: str, fsync_interval: float = 0.002, compact_after_bytes: int = 1 << 20):
+        """
+        Args:
+            directory: Where the journal and checkpoint files live.
+            fsync_interval: Seconds to wait for more appends before committing a batch.
+            compact_after_bytes: Truncate the journal once it is fully flushed
+                and larger than this.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._journal_path = os.path.join(directory, self.JOURNAL_FILE)
+        self._checkpoint_path = os.path.join(directory, self.CHECKPOINT_FILE)
+        self._fsync_interval = fsync_interval
+        self._compact_after_bytes = compact_after_bytes
+        self._watermark, self._done = self._load_checkpoint()
+        self._recovered = self._load_journal()
+        last_seq = self._recovered[-1][0] if self._recovered else 0
+        self._next_seq = max(self._watermark, last_seq, *self._done) + 1
+        self._file = open(self._journal_path, "ab")
+        self._batch: List[Tuple[bytes, asyncio.Future]] = []
+        self._committer: Optional[asyncio.Task] = None
+        self._io_lock = asyncio.Lock()
+        self._dirty = False
+
+    @property
+    def recovered(self) -> List[Tuple[int, RegisterProductRequest]]:
+        """Entries that were journaled but not completed before the last shutdown."""
+        return self._recovered
+
+    async def append(self, request: RegisterProductRequest) -> int:
+        """
+        Durably appends a registration.
+
+        If the write fails or the caller is cancelled, the entry is marked
+        done: nobody was told it is durable, so it is not flushed, and its
+        sequence number does not hold back the watermark.
+
+        Returns:
+            The entry's sequence number, once it has been fsynced.
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        line = json.dumps({"seq": seq, **request.model_dump(mode="json")}, separators=(",", ":"))
+        committed = asyncio.get_running_loop().create_future()
+        self._batch.append((line.encode() + b"\n", committed))
+        if self._committer is None or self._committer.done():
+            self._committer = asyncio.create_task(self._commit_batches())
+        try:
+            await committed
+        except BaseException:
+            self._batch = [entry for entry in self._batch if entry[1] is not committed]
+            self.mark_done(seq)
+            raise
+        return seq
+
+    def mark_done(self, seq: int) -> None:
+        """Records that an entry no longer needs flushing."""
+        self._done.add(seq)
+        while self._watermark + 1 in self._done:
+            self._watermark += 1
+            self._done.discard(self._watermark)
+        self._dirty = True
+
+    async def checkpoint(self) -> None:
+        """Persists completion progress, compacting the journal if it is fully flushed."""
+        if not self._dirty:
+            return
+        async with self._io_lock:
+            self._dirty = False
+            state = {"watermark": self._watermark, "done": sorted(self._done)}
+            drained = self._watermark == self._next_seq - 1 and not self._batch
+            await asyncio.to_thread(self._write_checkpoint, state, drained)
+
+    async def aclose(self) -> None:
+        """Commits outstanding appends, writes a final checkpoint and closes the journal."""
+        if self._committer is not None:
+            await self._committer
+        self._dirty = True
+        await self.checkpoint()
+        self._file.close()
+
+    async def _commit_batches(self) -> None:
+        while self._batch:
+            if self._fsync_interval:
+                await asyncio.sleep(self._fsync_interval)
+            batch, self._batch = self._batch, []
+            try:
+                async with self._io_lock:
+                    await asyncio.to_thread(self._write_lines, [line for line, _ in batch])
+            except Exception as e:
+                for _, committed in batch:
+                    if not committed.done():
+                        committed.set_exception(e)
+                continue
+            for _, committed in batch:
+                if not committed.done():
+                    committed.set_result(None)
+
+    def _write_lines(self, lines: List[bytes]) -> None:
+        self._file.writelines(lines)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _write_checkpoint(self, state: dict, drained: bool) -> None:
+        tmp_path = f"{self._checkpoint_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._checkpoint_path)
+        # Only truncate after the checkpoint covering every entry is durable.
+        if drained and self._file.tell() > self._compact_after_bytes:
+            self._file.truncate(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _load_checkpoint(self) -> Tuple[int, Set[int]]:
+        try:
+            with open(self._checkpoint_path, "r") as f:
+                state = json.load(f)
+            return state["watermark"], set(state["done"])
+        except FileNotFoundError:
+            return 0, set()
+
+    def _load_journal(self) -> List[Tuple[int, RegisterProductRequest]]:
+        pending = []
+        if not os.path.exists(self._journal_path):
+            return pending
+        with open(self._journal_path, "r+b") as f:
+            offset = 0
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise json.JSONDecodeError("unterminated entry", line.decode(errors="replace"), len(line))
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn write from a crash: drop it and everything after it.
+                    f.truncate(offset)
+                    break
+                offset += len(line)
+                seq = entry.pop("seq")
+                if seq > self._watermark and seq not in self._done:
+                    pending.append((seq, RegisterProductRequest.model_validate(entry)))
+        return pending
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from offers_sdk_applift.exceptions import APIError, AuthenticationError, ProductAlreadyFoundError
+from offers_sdk_applift.interfaces import OffersClientInterface
+from offers_sdk_applift.models import Product, RegisterProductRequest
+
+from .registration_journal import RegistrationJournal
+
+
+class WriteBehindRegistrar:
+    """
+    Registers products write-behind: journal locally now, call the API later.
+
+    `register_product` returns as soon as the registration is durable in the
+    local journal. Background workers drain the journal through the wrapped
+    client concurrently, retrying transient failures (5xx, 408, 429, timeouts,
+    network errors) with exponential backoff, so registrations survive API
+    outages, rate limiting and process restarts. A 409 counts as success;
+    other 4xx responses and authentication failures are permanent and the
+    entry is moved to `failed.jsonl`.
+    """
+
+    FAILED_FILE = "failed.jsonl"
+    TRANSIENT_STATUS_CODES = frozenset({408, 429})
+
+    def __init__(
+        self,
+        client: OffersClientInterface,
+        journal_dir: str,
+        concurrency: int = 8,
+        retry_interval: float = 1.0,
+        max_retry_interval: float = 60.0,
+        checkpoint_interval: float = 1.0,
+        fsync_interval: float = 0.002,
+    ):
+        """
+        Args:
+            client: The client used to flush registrations to the API.
+            journal_dir: Where the journal, checkpoint and failed files live.
+            concurrency: The number of registrations flushed in parallel.
+            retry_interval: The first delay before retrying a transient failure.
+            max_retry_interval: The longest delay between retries.
+            checkpoint_interval: Seconds between progress checkpoints.
+            fsync_interval: Seconds the journal waits to batch appends into one fsync.
+        """
+        self._client = client
+        self._journal_dir = journal_dir
+        self._concurrency = concurrency
+        self._retry_interval = retry_interval
+        self._max_retry_interval = max_retry_interval
+        self._checkpoint_interval = checkpoint_interval
+        self._fsync_interval = fsync_interval
+        self._journal: Optional[RegistrationJournal] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: Dict[int, float] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._flushed = 0
+        self._failed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of journaled registrations not yet confirmed by the API."""
+        return len(self._pending)
+
+    @property
+    def flush_lag_seconds(self) -> float:
+        """How long the oldest unconfirmed registration has been waiting."""
+        if not self._pending:
+            return 0.0
+        return time.monotonic() - next(iter(self._pending.values()))
+
+    @property
+    def flushed(self) -> int:
+        """Registrations confirmed by the API (including 409s) since start."""
+        return self._flushed
+
+    @property
+    def failed(self) -> int:
+        """Registrations permanently rejected by the API since start."""
+        return self._failed
+
+    async def start(self) -> None:
+        """Opens the journal, re-queues unfinished entries and starts the flusher."""
+        self._journal = RegistrationJournal(self._journal_dir, fsync_interval=self._fsync_interval)
+        self._queue = asyncio.Queue()
+        for seq, request in self._journal.recovered:
+            self._enqueue(seq, request)
+        self._tasks = [asyncio.create_task(self._flush_worker()) for _ in range(self._concurrency)]
+        self._tasks.append(asyncio.create_task(self._checkpoint_loop()))
+
+    async def register_product(self, product_id: uuid.UUID, name: str, description: str) -> Product:
+        """
+        Journals a registration and returns without waiting for the API.
+
+        Returns:
+            The product, as it will be registered.
+
+        Raises:
+            RuntimeError: If the registrar has not been started.
+        """
+        if self._journal is None:
+            raise RuntimeError("WriteBehindRegistrar is not started; call start() or use it as an async context manager")
+        request = RegisterProductRequest(id=product_id, name=name, description=description)
+        seq = await self._journal.append(request)
+        self._enqueue(seq, request)
+        return Product(id=product_id)
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Waits until every journaled registration has been flushed."""
+        await asyncio.wait_for(self._queue.join(), timeout=timeout)
+
+    async def aclose(self) -> None:
+        """
+        Stops the flusher and checkpoints progress.
+
+        Registrations still pending stay in the journal and are flushed after
+        the next `start()`.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._journal is not None:
+            await self._journal.aclose()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _enqueue(self, seq: int, request: RegisterProductRequest) -> None:
+        self._pending[seq] = time.monotonic()
+        self._queue.put_nowait((seq, request))
+
+    async def _flush_worker(self) -> None:
+        while True:
+            seq, request = await self._queue.get()
+            try:
+                await self._flush(seq, request)
+            finally:
+                self._queue.task_done()
+
+    async def _flush(self, seq: int, request: RegisterProductRequest) -> None:
+        delay = self._retry_interval
+        while True:
+            try:
+                await self._client.register_product(
+                    product_id=request.id, name=request.name, description=request.description
+                )
+            except ProductAlreadyFoundError:
+                pass
+            except (AuthenticationError, APIError) as e:
+                # The client reports auth failures as an APIError caused by an
+                # AuthenticationError; retrying cannot fix a rejected token.
+                if isinstance(e, AuthenticationError) or isinstance(e.__cause__, AuthenticationError):
+                    await self._fail(seq, request, 401, str(e))
+                    return
+                if e.status_code >= 500 or e.status_code in self.TRANSIENT_STATUS_CODES:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self._max_retry_interval)
+                    continue
+                await self._fail(seq, request, e.status_code, e.message)
+                return
+            except Exception:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_retry_interval)
+                continue
+            self._flushed += 1
+            self._complete(seq)
+            return
+
+    async def _fail(self, seq: int, request: RegisterProductRequest, status_code: int, message: str) -> None:
+        await asyncio.to_thread(self._record_failure, seq, request, status_code, message)
+        self._failed += 1
+        self._complete(seq)
+
+    def _complete(self, seq: int) -> None:
+        self._pending.pop(seq, None)
+        self._journal.mark_done(seq)
+
+    async def _checkpoint_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._checkpoint_interval)
+            await self._journal.checkpoint()
+
+    def _record_failure(self, seq: int, request: RegisterProductRequest, status_code: int, message: str) -> None:
+        entry = {"seq": seq, **request.model_dump(mode="json"), "status_code": status_code, "error": message}
+        with open(os.path.join(self._journal_dir, self.FAILED_FILE), "a") as f:
+            f.write(json.dumps(entry) + "\n")
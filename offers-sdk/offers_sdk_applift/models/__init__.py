@@ -2,5 +2,6 @@ from .auth_response import AuthResponse
 from .register_product_request import RegisterProductRequest
 from .offer import Offer
 from .product import Product
+from .warmup_report import EndpointWarmup, WarmupReport
 
-__all__ = ['Product', 'Offer', 'RegisterProductRequest', 'AuthResponse']
+__all__ = ['Product', 'Offer', 'RegisterProductRequest', 'AuthResponse', 'EndpointWarmup', 'WarmupReport']
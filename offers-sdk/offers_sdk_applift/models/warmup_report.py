@@ -0,0 +1,38 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class EndpointWarmup(BaseModel):
+    """Warmup timings for one endpoint."""
+    base_url: Optional[str] = None
+    token_seconds: float
+    connect_seconds: float
+    connections_opened: int
+    connections_failed: int
+
+
+class WarmupReport(BaseModel):
+    """Per-phase timings of a client warmup, per endpoint and overall."""
+    total_seconds: float
+    endpoints: List[EndpointWarmup]
+
+    @property
+    def token_seconds(self) -> float:
+        return max(endpoint.token_seconds for endpoint in self.endpoints)
+
+    @property
+    def connect_seconds(self) -> float:
+        return max(endpoint.connect_seconds for endpoint in self.endpoints)
+
+    @property
+    def connections_opened(self) -> int:
+        return sum(endpoint.connections_opened for endpoint in self.endpoints)
+
+    @property
+    def connections_failed(self) -> int:
+        return sum(endpoint.connections_failed for endpoint in self.endpoints)
+
+    @property
+    def ready(self) -> bool:
+        """True when every requested connection was opened."""
+        return self.connections_failed == 0
@@ -0,0 +1,4 @@
+from .traffic_replayer import TrafficReplayer, ReplayReport
+
+
+__all__ = ['TrafficReplayer', 'ReplayReport']
@@ -0,0 +1,111 @@
+import asyncio
+import re
+import time
+import uuid
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.models import RegisterProductRequest
+
+from offers_sdk_applift.http import RecordedExchange, read_recording
+
+
+_OFFERS_URL = re.compile(r"/products/(?P<product_id>[^/]+)/offers$")
+
+
+class ReplayReport(BaseModel):
+    """Summary of a traffic replay run."""
+    requests: int
+    errors: int
+    elapsed_seconds: float
+    requests_per_second: float
+    p50_latency_seconds: float
+    p90_latency_seconds: float
+    p99_latency_seconds: float
+
+
+class TrafficReplayer:
+    """
+    Re-issues the calls of a recording through a client with the original arrival pattern.
+
+    Each recorded `get_offers` and `register_product` call is started at its
+    recorded offset divided by `speed`, so the traffic shape (bursts, idle
+    periods, concurrency) is reproduced against whatever transport the
+    client uses, typically a `ReplayHttpClient` over the same recording.
+    Response latencies are up to the transport: a `ReplayHttpClient` has its
+    own speed factor, so the arrival rate can be scaled while the recorded
+    latency distribution is kept. Token refreshes are not replayed; the
+    client's token manager issues them.
+    """
+
+    def __init__(self, client: HttpxOffersClient, path: str, speed: Optional[float] = 1.0):
+        """
+        Args:
+            client: The client to drive.
+            path: A recording written by `RecordingHttpClient`, or the base path
+                or a glob pattern of a per-endpoint recording.
+            speed: The arrival-rate speed factor. None or 0 starts every call at once.
+        """
+        self._client = client
+        self._path = path
+        self._speed = speed or None
+
+    async def run(self) -> ReplayReport:
+        """Replays the recording and returns latency and throughput figures."""
+        latencies: List[float] = []
+        errors = 0
+        tasks = []
+        started = time.monotonic()
+
+        async def issue(exchange: RecordedExchange) -> None:
+            nonlocal errors
+            call_started = time.monotonic()
+            try:
+                await self._call(exchange)
+            except Exception:
+                errors += 1
+            latencies.append(time.monotonic() - call_started)
+
+        for exchange in read_recording(self._path):
+            if not self._is_replayable(exchange):
+                continue
+            if self._speed:
+                delay = exchange.offset / self._speed - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(issue(exchange)))
+        await asyncio.gather(*tasks)
+
+        elapsed = time.monotonic() - started
+        latencies.sort()
+        return ReplayReport(
+            requests=len(latencies),
+            errors=errors,
+            elapsed_seconds=elapsed,
+            requests_per_second=len(latencies) / elapsed if elapsed else 0.0,
+            p50_latency_seconds=self._percentile(latencies, 0.50),
+            p90_latency_seconds=self._percentile(latencies, 0.90),
+            p99_latency_seconds=self._percentile(latencies, 0.99),
+        )
+
+    async def _call(self, exchange: RecordedExchange) -> None:
+        if exchange.method == "GET":
+            match = _OFFERS_URL.search(exchange.url)
+            await self._client.get_offers(uuid.UUID(match.group("product_id")))
+        else:
+            request = RegisterProductRequest.model_validate(exchange.request_json)
+            await self._client.register_product(request.id, request.name, request.description)
+
+    @staticmethod
+    def _is_replayable(exchange: RecordedExchange) -> bool:
+        if exchange.method == "GET":
+            return _OFFERS_URL.search(exchange.url) is not None
+        return exchange.method == "POST" and exchange.url.endswith("/products/register")
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], fraction: float) -> float:
+        if not sorted_values:
+            return 0.0
+        return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
@@ -0,0 +1,9 @@
+from .priority import Priority
+from .deadline import Deadline
+from .request_scheduler import RequestScheduler
+from .poll_scheduler import PollScheduler
+from .adaptive_concurrency_limiter import AdaptiveConcurrencyLimiter
+from .request_hedger import RequestHedger
+
+
+__all__ = ['Priority', 'Deadline', 'RequestScheduler', 'PollScheduler', 'AdaptiveConcurrencyLimiter', 'RequestHedger']
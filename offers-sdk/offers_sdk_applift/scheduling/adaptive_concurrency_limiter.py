@@ -0,0 +1,160 @@
+import math
+import time
+from typing import Callable, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Derives the in-flight request limit from observed latency and errors.
+
+    Uses a gradient algorithm: the minimum round-trip time approximates the
+    latency without queueing, and a moving average tracks the current latency.
+    When the current latency rises above the minimum (times `tolerance`),
+    requests are queueing upstream and the limit shrinks in proportion;
+    otherwise it grows by a headroom of about sqrt(limit). Errors and timeouts
+    cut the limit multiplicatively (the "MD" of AIMD).
+
+    The minimum is only trusted for `min_rtt_window` seconds. After that the
+    limit briefly drops to a handful of requests (`probe_duration` seconds) to
+    re-measure it, so the baseline follows upstream latency changes in both
+    directions instead of ratcheting.
+    """
+
+    PROBE_LIMIT = 4
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        backoff_ratio: float = 0.9,
+        rtt_smoothing: float = 0.5,
+        min_rtt_window: float = 10.0,
+        probe_duration: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            initial_limit: The limit before any samples are seen.
+            min_limit: The lowest the limit may go.
+            max_limit: The highest the limit may go; usually the connection-pool size.
+            tolerance: How much latency above the minimum is accepted before shrinking.
+            smoothing: The weight of each new limit estimate.
+            backoff_ratio: The factor the limit is multiplied by after a window with errors.
+            rtt_smoothing: The EWMA weight of each window in the current-latency estimate.
+            min_rtt_window: Seconds a measured minimum latency stays valid.
+            probe_duration: Seconds spent at a low limit to re-measure the minimum.
+            clock: Returns the current time in seconds; injectable for tests.
+        """
+        self._estimated_limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._backoff_ratio = backoff_ratio
+        self._rtt_smoothing = rtt_smoothing
+        self._min_rtt_window = min_rtt_window
+        self._probe_duration = probe_duration
+        self._clock = clock
+        self._smoothed_rtt: Optional[float] = None
+        self._min_rtt: Optional[float] = None
+        self._min_rtt_at = 0.0
+        self._probe_until: Optional[float] = None
+        self._probe_min_rtt = math.inf
+        self._window_start = clock()
+        self._window_rtt_total = 0.0
+        self._window_samples = 0
+        self._window_in_flight = 0
+        self._window_dropped = False
+
+    @property
+    def limit(self) -> int:
+        """The current in-flight limit."""
+        if self._probe_until is not None:
+            return max(self._min_limit, min(self.PROBE_LIMIT, int(self._estimated_limit)))
+        return int(self._estimated_limit)
+
+    @property
+    def smoothed_rtt(self) -> Optional[float]:
+        """The current latency estimate, in seconds."""
+        return self._smoothed_rtt
+
+    @property
+    def baseline_rtt(self) -> Optional[float]:
+        """The estimated latency without queueing, in seconds."""
+        return self._min_rtt
+
+    @property
+    def probing(self) -> bool:
+        """Whether the limiter is re-measuring the baseline latency."""
+        return self._probe_until is not None
+
+    def on_sample(self, rtt: float, in_flight: int, dropped: bool = False) -> int:
+        """
+        Feeds one completed request into the estimate.
+
+        Samples are aggregated over windows of roughly one round trip; the
+        limit only moves when a window closes, so it never outruns the latency
+        feedback of its own previous change.
+
+        Args:
+            rtt: The request's round-trip time, in seconds.
+            in_flight: The number of requests in flight when it was sent.
+            dropped: Whether it failed with a timeout, a transport error or an
+                overload status (429 or 5xx).
+
+        Returns:
+            The new limit.
+        """
+        now = self._clock()
+        if dropped:
+            self._window_dropped = True
+        else:
+            if self._smoothed_rtt is None:
+                self._smoothed_rtt = rtt
+            self._track_min_rtt(rtt, in_flight, now)
+            self._window_rtt_total += rtt
+            self._window_samples += 1
+            self._window_in_flight = max(self._window_in_flight, in_flight)
+
+        if now - self._window_start >= (self._smoothed_rtt or 0.0):
+            self._close_window(now)
+        return self.limit
+
+    def _track_min_rtt(self, rtt: float, in_flight: int, now: float) -> None:
+        if self._probe_until is not None:
+            # Only requests sent after in-flight drained measure unqueued latency.
+            if in_flight <= self.limit:
+                self._probe_min_rtt = min(self._probe_min_rtt, rtt)
+            if now >= self._probe_until and self._probe_min_rtt < math.inf:
+                self._min_rtt, self._min_rtt_at = self._probe_min_rtt, now
+                self._probe_until = None
+        elif self._min_rtt is None or rtt <= self._min_rtt:
+            self._min_rtt, self._min_rtt_at = rtt, now
+        elif now - self._min_rtt_at > self._min_rtt_window:
+            self._probe_until = now + self._probe_duration
+            self._probe_min_rtt = math.inf
+
+    def _close_window(self, now: float) -> None:
+        if self._window_dropped:
+            self._estimated_limit = max(self._min_limit, self._estimated_limit * self._backoff_ratio)
+        elif self._window_samples:
+            window_rtt = self._window_rtt_total / self._window_samples
+            self._smoothed_rtt += self._rtt_smoothing * (window_rtt - self._smoothed_rtt)
+            # Without demand near the limit the latency says nothing about it.
+            if self._probe_until is None and self._window_in_flight >= self._estimated_limit / 2:
+                # A coarse clock can measure 0; then there is no queueing to react to.
+                gradient = 1.0
+                if window_rtt > 0:
+                    gradient = max(0.5, min(1.0, self._tolerance * self._min_rtt / window_rtt))
+                new_limit = self._estimated_limit * gradient + math.sqrt(self._estimated_limit)
+                new_limit = (1 - self._smoothing) * self._estimated_limit + self._smoothing * new_limit
+                self._estimated_limit = max(self._min_limit, min(self._max_limit, new_limit))
+
+        self._window_start = now
+        self._window_rtt_total = 0.0
+        self._window_samples = 0
+        self._window_in_flight = 0
+        self._window_dropped = False
@@ -0,0 +1,70 @@
+import asyncio
+import time
+from typing import Awaitable, Optional, TypeVar
+
+from offers_sdk_applift.exceptions import DeadlineExceededError
+
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """
+    An absolute point in time (on the monotonic clock) by which a call must finish.
+
+    A single deadline is created per public call and propagated through every
+    stage of it: queueing for a connection slot, waiting for the access token
+    and the HTTP exchange itself.
+    """
+
+    def __init__(self, expires_at: Optional[float] = None):
+        """
+        Args:
+            expires_at: A `time.monotonic()` timestamp, or None for no deadline.
+        """
+        self._expires_at = expires_at
+
+    @classmethod
+    def after(cls, timeout: Optional[float]) -> "Deadline":
+        """Creates a deadline `timeout` seconds from now (None means unbounded)."""
+        if timeout is None:
+            return cls()
+        return cls(time.monotonic() + timeout)
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        return self._expires_at
+
+    @property
+    def is_bounded(self) -> bool:
+        return self._expires_at is not None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None if it is unbounded."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+
+    def check(self, stage: str) -> None:
+        """Raises DeadlineExceededError if the deadline has already passed."""
+        if self.expired:
+            raise DeadlineExceededError(f"Deadline exceeded {stage}.")
+
+    async def wait_for(self, awaitable: Awaitable[T], stage: str) -> T:
+        """
+        Awaits `awaitable`, cancelling it if the deadline passes first.
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before `awaitable` completes.
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, timeout=remaining)
+        except asyncio.TimeoutError as e:
+            raise DeadlineExceededError(f"Deadline exceeded {stage}.") from e
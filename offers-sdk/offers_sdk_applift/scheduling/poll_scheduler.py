@@ -0,0 +1,202 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from typing import Awaitable, Callable, List, Optional, Set
+
+from offers_sdk_applift.exceptions import APIError, DeadlineExceededError, ProductNotFoundError, is_transient
+
+from .deadline import Deadline
+
+
+class _PollJob:
+    """The state of one poll loop waiting for a non-empty result."""
+    __slots__ = ("fetch", "deadline", "future", "started_at", "interval", "last_latency", "last_error", "polled")
+
+    def __init__(self, fetch: Callable[[], Awaitable[list]], deadline: Deadline, future: asyncio.Future, interval: float):
+        self.fetch = fetch
+        self.deadline = deadline
+        self.future = future
+        self.started_at = time.monotonic()
+        self.interval = interval
+        self.last_latency = 0.0
+        self.last_error: Optional[Exception] = None
+        self.polled = False
+
+
+class PollScheduler:
+    """
+    Drives many "poll until non-empty" loops from a single timer task.
+
+    Instead of one sleeping coroutine per product, every pending poll sits in
+    one heap ordered by its next due time. Intervals grow geometrically (with
+    jitter) up to `max_interval`, and the first poll is delayed by a smoothed
+    estimate of how long results have recently taken to appear, so pipelines
+    neither hammer the API nor oversleep.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.2,
+        smoothing: float = 0.2,
+    ):
+        """
+        Args:
+            initial_interval: The shortest delay between polls, in seconds.
+            max_interval: The longest delay between polls, in seconds.
+            backoff_factor: The factor by which the delay grows after each empty poll.
+            jitter: The relative random spread applied to every delay.
+            smoothing: The weight of the newest sample in the appearance-time estimate.
+        """
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff_factor = backoff_factor
+        self._jitter = jitter
+        self._smoothing = smoothing
+        self._expected_delay: Optional[float] = None
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()
+        self._jobs: Set[_PollJob] = set()
+        self._attempts: Set[asyncio.Task] = set()
+        self._runner: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def pending(self) -> int:
+        """The number of poll loops that have not finished yet."""
+        return len(self._jobs)
+
+    @property
+    def expected_delay(self) -> Optional[float]:
+        """The smoothed time, in seconds, that results have taken to appear."""
+        return self._expected_delay
+
+    async def poll_until_non_empty(
+        self, fetch: Callable[[], Awaitable[list]], deadline: Deadline
+    ) -> list:
+        """
+        Calls `fetch` on a backoff schedule until it returns a non-empty list.
+
+        Not-found and transient errors (5xx, 408, 429) are treated as "not
+        visible yet" and polled through with the usual backoff; any other error
+        is raised immediately.
+
+        Returns:
+            The first non-empty result, or an empty list if the deadline expires.
+
+        Raises:
+            APIError: If polling failed with an error that was never followed by
+                a successful (even if empty) poll before the deadline.
+        """
+        job = _PollJob(fetch, deadline, asyncio.get_running_loop().create_future(), self._initial_interval)
+        self._jobs.add(job)
+        self._schedule(job, time.monotonic() + self._first_delay())
+        try:
+            return await job.future
+        finally:
+            job.future.cancel()
+            self._jobs.discard(job)
+
+    async def aclose(self) -> None:
+        """Cancels the timer task and every poll still in progress."""
+        for job in self._jobs:
+            job.future.cancel()
+        self._heap.clear()
+        tasks = [*self._attempts, *([self._runner] if self._runner else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._runner = None
+
+    def _first_delay(self) -> float:
+        if self._expected_delay is None:
+            return self._initial_interval
+        return min(self._expected_delay * 0.8, self._max_interval)
+
+    def _schedule(self, job: _PollJob, due: float) -> None:
+        if job.deadline.expires_at is not None:
+            latest = job.deadline.expires_at - job.last_latency
+            if due > latest:
+                if latest <= time.monotonic():
+                    self._expire(job)
+                    return
+                due = latest
+        heapq.heappush(self._heap, (due, next(self._counter), job))
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.create_task(self._run())
+        elif self._heap[0][2] is job:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while self._heap:
+            due, _, job = self._heap[0]
+            if job.future.done():
+                heapq.heappop(self._heap)
+                continue
+            delay = due - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._heap)
+            task = asyncio.create_task(self._attempt(job))
+            self._attempts.add(task)
+            task.add_done_callback(self._attempts.discard)
+
+    async def _attempt(self, job: _PollJob) -> None:
+        started = time.monotonic()
+        try:
+            result = await job.fetch()
+        except DeadlineExceededError:
+            self._expire(job)
+            return
+        except APIError as e:
+            if not isinstance(e, ProductNotFoundError) and not is_transient(e):
+                self._fail(job, e)
+                return
+            job.last_error = e
+            result = None
+        except Exception as e:
+            self._fail(job, e)
+            return
+
+        now = time.monotonic()
+        job.last_latency = now - started
+        if job.future.done():
+            return
+        if result:
+            self._observe(now - job.started_at)
+            job.future.set_result(result)
+            return
+        if result is not None:
+            job.polled = True
+        delay = job.interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+        job.interval = min(job.interval * self._backoff_factor, self._max_interval)
+        self._schedule(job, now + delay)
+
+    def _observe(self, elapsed: float) -> None:
+        if self._expected_delay is None:
+            self._expected_delay = elapsed
+        else:
+            self._expected_delay += self._smoothing * (elapsed - self._expected_delay)
+
+    def _expire(self, job: _PollJob) -> None:
+        if job.future.done():
+            return
+        if job.last_error is not None and not job.polled:
+            job.future.set_exception(job.last_error)
+        else:
+            job.future.set_result([])
+
+    @staticmethod
+    def _fail(job: _PollJob, error: Exception) -> None:
+        if not job.future.done():
+            job.future.set_exception(error)
@@ -0,0 +1,13 @@
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """
+    Admission priority of a request. Lower values are admitted first.
+
+    Use `HIGH` for user-facing lookups and `LOW` for background work such as
+    crawlers, so that interactive calls never queue behind bulk traffic.
+    """
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
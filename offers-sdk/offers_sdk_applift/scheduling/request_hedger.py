@@ -0,0 +1,158 @@
+import asyncio
+import collections
+import math
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """
+    Cuts tail latency of idempotent requests by sending a backup ("hedge") request.
+
+    If an attempt has not answered within the `percentile` of recently
+    observed latencies, a second attempt is started and whichever succeeds
+    first wins; the other is cancelled. Only the slowest requests are hedged,
+    so with the default 95th percentile about 5% extra load buys a much lower
+    p99.
+
+    Hedges are paid from a token bucket: every request earns `budget` tokens
+    and a hedge costs one, so hedges never exceed `budget` of traffic over
+    time (plus a burst of `max_burst`). During an incident, when everything is
+    slow, the bucket drains and hedging stops instead of doubling the load.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        max_burst: float = 10.0,
+        window: int = 1000,
+        min_samples: int = 20,
+        min_delay: float = 0.001,
+    ):
+        """
+        Args:
+            percentile: The fraction of recent latencies after which a hedge is sent.
+            budget: The fraction of requests that may be hedged.
+            max_burst: The most hedges that may be sent in a burst.
+            window: The number of recent latencies the percentile is taken over.
+            min_samples: The samples needed before any request is hedged.
+            min_delay: The shortest wait before hedging, in seconds.
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self._percentile = percentile
+        self._budget = budget
+        self._max_burst = max_burst
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._latencies: collections.deque = collections.deque(maxlen=window)
+        self._tokens = max_burst
+        self._delay: Optional[float] = None
+        self._samples_since_update = 0
+        self.requests = 0
+        self.hedged = 0
+        self.wins = 0
+        self.losses = 0
+        self.throttled = 0
+
+    @property
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds after which a request is hedged, or None while too few samples exist."""
+        return self._delay
+
+    @property
+    def win_rate(self) -> float:
+        """The fraction of hedges that answered before the original request."""
+        return self.wins / self.hedged if self.hedged else 0.0
+
+    def record(self, latency: float) -> None:
+        """Adds the latency of an attempt (or how long a cancelled one ran) to the percentile window."""
+        self._latencies.append(latency)
+        self._samples_since_update += 1
+        # Sorting the window on every sample would dominate; refresh periodically.
+        if len(self._latencies) >= self._min_samples and (
+            self._delay is None or self._samples_since_update >= max(1, len(self._latencies) // 20)
+        ):
+            ordered = sorted(self._latencies)
+            index = min(len(ordered) - 1, math.ceil(self._percentile * len(ordered)) - 1)
+            self._delay = max(self._min_delay, ordered[index])
+            self._samples_since_update = 0
+
+    async def run(
+        self,
+        attempt: Callable[[], Awaitable[T]],
+        retryable: Optional[Callable[[BaseException], bool]] = None,
+    ) -> T:
+        """
+        Runs `attempt`, starting a second one if the first is slow and the budget allows.
+
+        Args:
+            attempt: Starts one attempt; called once or twice.
+            retryable: Tells whether an attempt's error may be answered
+                differently by the other attempt. A non-retryable error (e.g.
+                a 404) is raised at once instead of waiting for the other
+                attempt. By default every error is retryable.
+
+        Returns:
+            The result of the first attempt to succeed.
+
+        Raises:
+            The first non-retryable error, or the original attempt's exception
+            if no attempt succeeded.
+        """
+        self.requests += 1
+        self._tokens = min(self._max_burst, self._tokens + self._budget)
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self._timed(attempt))
+        hedge: Optional[asyncio.Future] = None
+        try:
+            delay = self._delay
+            if delay is not None:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+                if not done:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.hedged += 1
+                        hedge = asyncio.ensure_future(self._timed(attempt))
+                    else:
+                        self.throttled += 1
+            if hedge is None:
+                return await primary
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in (primary, hedge):
+                    if future not in done:
+                        continue
+                    error = future.exception()
+                    if error is None:
+                        if future is hedge:
+                            self.wins += 1
+                        else:
+                            self.losses += 1
+                        return future.result()
+                    if retryable is not None and not retryable(error):
+                        self.losses += 1
+                        raise error
+            # Both attempts failed.
+            self.losses += 1
+            return primary.result()
+        finally:
+            if not primary.done():
+                # The original is slower than this, but leaving it out would drop the tail
+                # from the window and drag the hedge delay down over time.
+                self.record(time.monotonic() - started)
+            attempts = [future for future in (primary, hedge) if future is not None]
+            for future in attempts:
+                future.cancel()
+            # Let losers unwind (releasing their connections) and retrieve their errors.
+            await asyncio.gather(*attempts, return_exceptions=True)
+
+    async def _timed(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await attempt()
+        self.record(time.monotonic() - started)
+        return result
@@ -0,0 +1,108 @@
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from .deadline import Deadline
+from .priority import Priority
+
+
+class RequestScheduler:
+    """
+    Admits requests into a bounded number of in-flight slots by priority.
+
+    Requests that find all slots busy wait in a priority queue; when a slot is
+    released it is handed to the highest-priority waiter (FIFO within the same
+    priority). Waiters whose deadline expires leave the queue without ever
+    having been sent.
+    """
+
+    def __init__(self, max_concurrency: int = 100):
+        """
+        Args:
+            max_concurrency: The maximum number of requests in flight at once.
+                This should match the connection-pool limit of the transport.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._waiters: List[list] = []
+        self._counter = itertools.count()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def set_limit(self, limit: int) -> None:
+        """
+        Changes the number of slots. Extra waiters are admitted immediately when
+        it grows; when it shrinks, requests already in flight finish normally.
+        """
+        self._limit = max(1, limit)
+        self._wake()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    async def acquire(
+        self, priority: Priority = Priority.NORMAL, deadline: Optional[Deadline] = None
+    ) -> None:
+        """
+        Waits for a free slot.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes while queued.
+        """
+        deadline = deadline or Deadline()
+        self._prune()
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        deadline.check("while queued for a connection slot")
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, [int(priority), next(self._counter), waiter])
+        try:
+            await deadline.wait_for(waiter, "while queued for a connection slot")
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just as we gave up; pass it on.
+                self.release()
+            else:
+                waiter.cancel()
+            raise
+
+    def release(self) -> None:
+        """Returns a slot and hands it to the next waiter, if any."""
+        self._in_flight -= 1
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: Priority = Priority.NORMAL, deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[None]:
+        """An async context manager that holds a slot for the duration of the block."""
+        await self.acquire(priority, deadline)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _prune(self) -> None:
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self._limit:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
@@ -1,10 +1,15 @@
+import asyncio
+import json
+import re
 import pytest
+import httpx
 from respx import MockRouter
 from pathlib import Path
+from typing import Any, Callable
 
 from offers_sdk_applift.config import get_settings
 from dotenv import load_dotenv
-from offers_sdk_applift.interfaces import TokenManagerInterface, OffersClientInterface
+from offers_sdk_applift.interfaces import TokenManagerInterface, OffersClientInterface, AsyncHttpClientInterface
 from offers_sdk_applift.http import HttpxClient
 from offers_sdk_applift.clients import HttpxOffersClient
 
@@ -37,6 +42,60 @@ class FakeTokenManager(TokenManagerInterface):
         return self.DUMMY_TOKEN
 
 
+class FakeOffersServer(AsyncHttpClientInterface):
+    """
+    A local stand-in for the Offers API that conforms to the transport interface.
+
+    Every product has one offer priced at `price_for(product_id)`. The
+    `latency` callable receives the current number of requests in flight and
+    returns the simulated service time, so tests can model queueing.
+    """
+    OFFERS_URL = re.compile(r"/products/(?P<product_id>[0-9a-f-]+)/offers$")
+
+    def __init__(self, latency: Callable[[int], float] = lambda in_flight: 0.0):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: list = []
+        self.cancelled = 0
+
+    @staticmethod
+    def price_for(product_id: str) -> int:
+        return int(product_id[:4], 16)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.requests.append((method, url))
+        try:
+            await asyncio.sleep(self.latency(self.in_flight))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        request = httpx.Request(method, f"https://api.test.com{url}")
+        match = self.OFFERS_URL.search(url)
+        if method == "GET" and match:
+            product_id = match.group("product_id")
+            offer = {"id": product_id, "price": self.price_for(product_id), "items_in_stock": 1}
+            return httpx.Response(200, json=[offer], request=request)
+        if method == "POST" and url.endswith("/products/register"):
+            return httpx.Response(201, content=json.dumps({"id": kwargs["json"]["id"]}), request=request)
+        if method == "POST" and url.endswith("/auth"):
+            return httpx.Response(201, json={"access_token": "fake-access-token"}, request=request)
+        return httpx.Response(404, request=request)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        pass
+
+
 @pytest.fixture
 def mock_token_manager() -> TokenManagerInterface:
     """Provides a fake TokenManager instance for tests."""
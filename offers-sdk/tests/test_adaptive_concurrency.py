@@ -0,0 +1,82 @@
+import uuid
+import pytest
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.scheduling import AdaptiveConcurrencyLimiter, RequestScheduler
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+def test_limiter_backs_off_multiplicatively_on_errors():
+    """Tests that a window with dropped requests cuts the limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=50)
+
+    limiter.on_sample(0.01, in_flight=50, dropped=True)
+
+    assert limiter.limit == 45
+
+
+def test_limiter_ignores_latency_when_demand_is_low():
+    """Tests that an underused limit neither grows nor shrinks."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=50)
+
+    for _ in range(100):
+        limiter.on_sample(0.01, in_flight=2)
+
+    assert limiter.limit == 50
+    assert limiter.baseline_rtt == pytest.approx(0.01)
+
+
+def test_limiter_tolerates_zero_latency_samples():
+    """Tests that a coarse clock measuring 0s is read as no queueing instead of crashing."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=9, smoothing=1.0, clock=lambda: 0.0)
+
+    assert limiter.on_sample(0.0, in_flight=9) == 12
+
+
+def test_limit_follows_upstream_capacity():
+    """
+    Tests the limiter against a simulated server whose latency grows once more
+    than `capacity` requests are in flight, while the capacity changes.
+
+    Time is simulated: each completion advances a fake clock by the server's
+    service time, so the result does not depend on event-loop scheduling.
+    """
+    now = [0.0]
+    profile = {"capacity": 4}
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=20, max_limit=200, smoothing=0.5, clock=lambda: now[0])
+
+    def serve(requests: int) -> None:
+        for _ in range(requests):
+            in_flight = limiter.limit
+            rtt = 0.005 * max(1.0, in_flight / profile["capacity"])
+            now[0] += rtt / in_flight
+            limiter.on_sample(rtt, in_flight=in_flight)
+
+    limiter.on_sample(0.005, in_flight=1)
+    serve(600)
+    congested_limit = limiter.limit
+
+    profile["capacity"] = 64
+    serve(3000)
+
+    assert 4 <= congested_limit <= 12
+    assert limiter.limit > 64
+    assert limiter.baseline_rtt == pytest.approx(0.005)
+
+
+@pytest.mark.asyncio
+async def test_client_applies_the_adaptive_limit_to_its_scheduler():
+    """Tests that the client feeds the limiter and keeps the scheduler's limit in step."""
+    server = FakeOffersServer(latency=lambda in_flight: 0.002)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=20, max_limit=200)
+    client = HttpxOffersClient(
+        http_client=server,
+        token_manager=FakeTokenManager(),
+        scheduler=RequestScheduler(max_concurrency=200),
+        concurrency_limiter=limiter,
+    )
+
+    await client.get_offers_bulk([uuid.uuid4() for _ in range(100)])
+
+    assert limiter.smoothed_rtt is not None
+    assert client.scheduler.limit == limiter.limit
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import uuid
+import httpx
+import pytest
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.crawl import OfferCrawler, ProductIdFile
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+def write_ids(tmp_path, count):
+    ids = [uuid.uuid4() for _ in range(count)]
+    text_path = tmp_path / "ids.txt"
+    text_path.write_text("\n".join(str(product_id) for product_id in ids) + "\n\n")
+    binary_path = tmp_path / "ids.bin"
+    assert ProductIdFile.convert(str(text_path), str(binary_path)) == count
+    return ids, ProductIdFile(str(binary_path))
+
+
+def read_output(output_dir):
+    lines = []
+    for path in sorted(output_dir.glob("offers-*.jsonl")):
+        lines.extend(json.loads(line) for line in path.read_text().splitlines())
+    return lines
+
+
+def test_product_id_file_round_trips_ids(tmp_path):
+    """Tests that converted IDs are read back in order by position."""
+    ids, product_ids = write_ids(tmp_path, 50)
+
+    assert len(product_ids) == 50
+    assert product_ids[17] == ids[17]
+    assert list(product_ids) == ids
+    product_ids.close()
+
+
+@pytest.mark.asyncio
+async def test_interrupted_crawl_resumes_without_gaps_or_duplicates(tmp_path):
+    """Tests that a cancelled crawl resumes from its checkpoint and each product is written once."""
+    ids, product_ids = write_ids(tmp_path, 400)
+    output = tmp_path / "out"
+    server = FakeOffersServer(latency=lambda in_flight: 0.001)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager())
+
+    first = OfferCrawler(client, product_ids, str(output), concurrency=8, rotate_bytes=4096, checkpoint_interval=0.005)
+    run = asyncio.create_task(first.run())
+    while first.completed < 150:
+        await asyncio.sleep(0.001)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    # Simulate a crash after the checkpoint: output that it does not cover.
+    with open(output / "offers-00099.jsonl", "w") as f:
+        f.write('{"product_id": "stale"}\n')
+
+    requests_before = len(server.requests)
+    second = OfferCrawler(client, product_ids, str(output), concurrency=8, rotate_bytes=4096)
+    assert second.completed >= 150
+    progress = await second.run()
+
+    lines = read_output(output)
+    assert progress.completed == progress.total == 400
+    assert sorted(line["product_id"] for line in lines) == sorted(str(product_id) for product_id in ids)
+    assert all(line["offers"][0]["price"] == FakeOffersServer.price_for(line["product_id"]) for line in lines)
+    assert len(server.requests) - requests_before <= 400 - 150 + 8
+    assert len(list(output.glob("offers-*.jsonl"))) > 1
+    product_ids.close()
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried_on_resume(tmp_path):
+    """Tests that 5xx lookups are not checkpointed as done, while 404s are written as errors."""
+    ids, product_ids = write_ids(tmp_path, 30)
+    output = tmp_path / "out"
+    unavailable, missing = {str(ids[3]), str(ids[20])}, str(ids[7])
+
+    class PartlyFailingServer(FakeOffersServer):
+        async def request(self, method, url, **kwargs):
+            request = httpx.Request(method, f"https://api.test.com{url}")
+            if any(product_id in url for product_id in unavailable):
+                return httpx.Response(503, request=request)
+            if missing in url:
+                return httpx.Response(404, request=request)
+            return await super().request(method, url, **kwargs)
+
+    server = PartlyFailingServer()
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager())
+    progress = await OfferCrawler(client, product_ids, str(output), concurrency=4).run()
+    assert (progress.completed, progress.errors, progress.retry_pending) == (28, 1, 2)
+
+    unavailable.clear()
+    progress = await OfferCrawler(client, product_ids, str(output), concurrency=4).run()
+
+    lines = read_output(output)
+    assert (progress.completed, progress.retry_pending) == (30, 0)
+    assert sorted(line["product_id"] for line in lines) == sorted(str(product_id) for product_id in ids)
+    assert [line["product_id"] for line in lines if "error" in line] == [missing]
+    product_ids.close()
+
+
+@pytest.mark.asyncio
+async def test_watermark_keeps_moving_past_transient_failures(tmp_path):
+    """Tests that a transient failure is kept in the checkpoint's retry list instead of pinning the watermark."""
+    ids, product_ids = write_ids(tmp_path, 2000)
+    output = tmp_path / "out"
+    unavailable = {str(ids[0])}
+
+    class FirstProductUnavailableServer(FakeOffersServer):
+        async def request(self, method, url, **kwargs):
+            if any(product_id in url for product_id in unavailable):
+                return httpx.Response(503, request=httpx.Request(method, f"https://api.test.com{url}"))
+            return await super().request(method, url, **kwargs)
+
+    client = HttpxOffersClient(http_client=FirstProductUnavailableServer(), token_manager=FakeTokenManager())
+    crawler = OfferCrawler(client, product_ids, str(output), concurrency=16)
+    progress = await crawler.run()
+
+    checkpoint = json.loads((output / OfferCrawler.CHECKPOINT_FILE).read_text())
+    assert (progress.completed, progress.retry_pending) == (1999, 1)
+    assert (crawler._watermark, len(crawler._done)) == (2000, 0)
+    assert (checkpoint["watermark"], checkpoint["done"], checkpoint["retry"]) == (2000, [], [0])
+
+    unavailable.clear()
+    progress = await OfferCrawler(client, product_ids, str(output), concurrency=16).run()
+
+    assert (progress.completed, progress.retry_pending) == (2000, 0)
+    assert sorted(line["product_id"] for line in read_output(output)) == sorted(str(product_id) for product_id in ids)
+    product_ids.close()
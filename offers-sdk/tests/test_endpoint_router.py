@@ -0,0 +1,148 @@
+import asyncio
+import uuid
+import httpx
+import pytest
+from typing import Any
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.http import Endpoint, EndpointRouter
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+class UnavailableServer(FakeOffersServer):
+    """A stand-in region that answers every request with 503."""
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        self.requests.append((method, url))
+        return httpx.Response(503, request=httpx.Request(method, f"https://api.test.com{url}"))
+
+
+class RecordingTokenManager(FakeTokenManager):
+    def __init__(self, token: str):
+        self.token = token
+        self.calls = 0
+
+    async def get_access_token(self) -> str:
+        self.calls += 1
+        return self.token
+
+
+def test_consistent_hashing_moves_few_keys_when_an_endpoint_is_added():
+    """Tests that routing is stable per key and adding a region remaps ~1/N of keys."""
+    urls = [f"https://region-{i}.example.com" for i in range(4)]
+    three = EndpointRouter([Endpoint(url, FakeOffersServer()) for url in urls[:3]])
+    four = EndpointRouter([Endpoint(url, FakeOffersServer()) for url in urls])
+    keys = [uuid.uuid4() for _ in range(2000)]
+
+    before = {key: three.pick(key).base_url for key in keys}
+    moved = sum(four.pick(key).base_url != before[key] for key in keys)
+
+    assert all(three.pick(key).base_url == before[key] for key in keys)
+    assert set(before.values()) == set(urls[:3])
+    assert 0.1 * len(keys) < moved < 0.4 * len(keys)
+
+
+@pytest.mark.asyncio
+async def test_client_routes_away_from_a_slow_endpoint():
+    """Tests that a product sticks to its endpoint until that endpoint becomes slow."""
+    fast = FakeOffersServer(latency=lambda in_flight: 0.001)
+    slow = FakeOffersServer(latency=lambda in_flight: 0.001)
+    router = EndpointRouter([Endpoint("https://fast", fast), Endpoint("https://slow", slow)])
+    client = HttpxOffersClient(http_client=fast, token_manager=FakeTokenManager(), router=router)
+    product_id = next(key for key in iter(uuid.uuid4, None) if router.pick(key).base_url == "https://slow")
+
+    await client.get_offers(product_id)
+    assert len(slow.requests) == 1
+
+    slow.latency = lambda in_flight: 0.02
+    for _ in range(20):
+        await client.get_offers(uuid.uuid4())
+    slow.requests.clear()
+    fast.requests.clear()
+    await client.get_offers(product_id)
+
+    assert slow.requests == []
+    assert len(fast.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_endpoint_is_avoided_then_probed():
+    """Tests that an erroring region is skipped and retried after the probe interval."""
+    healthy = FakeOffersServer()
+    failing = UnavailableServer()
+    router = EndpointRouter(
+        [Endpoint("https://healthy", healthy), Endpoint("https://failing", failing)],
+        probe_interval=60.0,
+    )
+    client = HttpxOffersClient(http_client=healthy, token_manager=FakeTokenManager(), router=router)
+
+    failures = 0
+    for _ in range(50):
+        try:
+            await client.get_offers(uuid.uuid4())
+        except Exception:
+            failures += 1
+
+    assert failures <= 3
+    assert router.endpoints[1].error_rate > 0.2
+
+    product_id = next(
+        key for key in iter(uuid.uuid4, None) if next(router.preference(key)).base_url == "https://failing"
+    )
+    router.endpoints[1].last_observed -= 120.0
+    failing_before = len(failing.requests)
+    with pytest.raises(Exception):
+        await client.get_offers(product_id)
+    assert len(failing.requests) == failing_before + 1
+
+
+@pytest.mark.asyncio
+async def test_region_scoped_tokens_are_used_per_endpoint():
+    """Tests that each endpoint authenticates with its own token manager when given one."""
+    eu_tokens = RecordingTokenManager("eu-token")
+    shared_tokens = RecordingTokenManager("shared-token")
+    eu = FakeOffersServer()
+    us = FakeOffersServer()
+    router = EndpointRouter([Endpoint("https://eu", eu, eu_tokens), Endpoint("https://us", us)])
+    client = HttpxOffersClient(http_client=eu, token_manager=shared_tokens, router=router)
+
+    await client.get_offers_bulk([uuid.uuid4() for _ in range(40)])
+
+    assert eu_tokens.calls == len(eu.requests) > 0
+    assert shared_tokens.calls == len(us.requests) > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_leave_the_endpoint_probing():
+    """Tests that a probe cancelled mid-request is ended, so the endpoint can be probed again."""
+    healthy = FakeOffersServer()
+    hanging = FakeOffersServer(latency=lambda in_flight: 10.0)
+    router = EndpointRouter([Endpoint("https://healthy", healthy), Endpoint("https://hanging", hanging)])
+    router.endpoints[1].error_rate = 1.0
+    client = HttpxOffersClient(http_client=healthy, token_manager=FakeTokenManager(), router=router)
+    product_id = next(
+        key for key in iter(uuid.uuid4, None) if next(router.preference(key)).base_url == "https://hanging"
+    )
+
+    probe = asyncio.create_task(client.get_offers(product_id))
+    await asyncio.sleep(0.01)
+    assert router.endpoints[1].probing
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert not router.endpoints[1].probing
+
+
+def test_explicit_base_url_wins_over_configured_endpoint_list(monkeypatch):
+    """Tests that OFFERS_API_BASE_URLS only applies when no base URL is passed."""
+    monkeypatch.setenv("OFFERS_API_BASE_URLS", '["https://eu.example.com", "https://us.example.com"]')
+
+    routed = HttpxOffersClient.from_credentials(refresh_token="dummy-token")
+    single = HttpxOffersClient.from_credentials(refresh_token="dummy-token", base_url="https://only.example.com")
+
+    assert [endpoint.base_url for endpoint in routed.router.endpoints] == [
+        "https://eu.example.com",
+        "https://us.example.com",
+    ]
+    assert single.router is None
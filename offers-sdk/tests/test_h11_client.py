@@ -0,0 +1,179 @@
+import asyncio
+import json
+import uuid
+from typing import Optional
+import h11
+import httpx
+import pytest
+import pytest_asyncio
+
+from offers_sdk_applift.auth import TokenManager
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.exceptions import APIError, ProductNotFoundError
+from offers_sdk_applift.http import H11Client, HttpxClient
+from tests.conftest import FakeTokenManager
+
+pytestmark = pytest.mark.asyncio
+
+
+class LocalServer:
+    """A minimal keep-alive HTTP/1.1 server on localhost, built on h11."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = []
+        self.delay = 0.0
+        self.requests_per_connection: Optional[int] = None
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/api/v1"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        connection = h11.Connection(our_role=h11.SERVER)
+        request, body, served = None, b"", 0
+        try:
+            while True:
+                event = connection.next_event()
+                if event is h11.NEED_DATA:
+                    data = await reader.read(65536)
+                    connection.receive_data(data)
+                    if not data:
+                        return
+                elif isinstance(event, h11.Request):
+                    if served == self.requests_per_connection:
+                        # Close a kept-alive connection just as it is reused.
+                        return
+                    request, body, served = event, b"", served + 1
+                elif isinstance(event, h11.Data):
+                    body += event.data
+                elif isinstance(event, h11.EndOfMessage):
+                    status, payload = self._respond(request, body)
+                    await asyncio.sleep(self.delay)
+                    content = json.dumps(payload).encode()
+                    headers = [("Content-Type", "application/json"), ("Content-Length", str(len(content)))]
+                    writer.write(connection.send(h11.Response(status_code=status, headers=headers)))
+                    writer.write(connection.send(h11.Data(data=content)))
+                    writer.write(connection.send(h11.EndOfMessage()))
+                    await writer.drain()
+                    connection.start_next_cycle()
+                else:
+                    return
+        finally:
+            writer.close()
+
+    def _respond(self, request: h11.Request, body: bytes):
+        target = request.target.decode()
+        headers = {name.decode(): value.decode() for name, value in request.headers}
+        self.requests.append((request.method.decode(), target, headers, body))
+        if target == "/api/v1/auth":
+            return 201, {"access_token": "local-token"}
+        if target.startswith("/api/v1/products/register"):
+            return 201, {"id": json.loads(body)["id"]}
+        if target.endswith("/offers") and headers.get("bearer") == "local-token":
+            return 200, [{"id": str(uuid.uuid4()), "price": 100, "items_in_stock": 3}]
+        return 404, {"detail": "Not found"}
+
+
+@pytest_asyncio.fixture
+async def server():
+    server = LocalServer()
+    server.base_url = await server.start()
+    yield server
+    await server.stop()
+
+
+async def test_h11_client_serves_the_sdk_over_keep_alive_connections(server, tmp_path, monkeypatch):
+    """Tests token refresh, JSON requests and error mapping through H11Client on one connection."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    http_client = H11Client(server.base_url, max_connections=4)
+    token_manager = TokenManager("refresh", http_client, cache_name=f"h11_{uuid.uuid4().hex}")
+    client = HttpxOffersClient(http_client=http_client, token_manager=token_manager)
+    product_id = uuid.uuid4()
+
+    product = await client.register_product(product_id, "name", "description")
+    offers = await client.get_offers(product_id)
+    with pytest.raises(ProductNotFoundError):
+        await client._make_request("GET", "/unknown")
+
+    assert product.id == product_id
+    assert offers[0].price == 100
+    assert server.connections == 1
+    method, target, headers, body = server.requests[1]
+    assert (method, target) == ("POST", "/api/v1/products/register")
+    assert headers["content-type"] == "application/json"
+    assert json.loads(body)["id"] == str(product_id)
+    await client.close()
+
+
+async def test_h11_client_matches_httpx_responses(server):
+    """Tests that both backends return equivalent httpx.Response objects."""
+    responses = []
+    for backend in (HttpxClient(server.base_url), H11Client(server.base_url)):
+        response = await backend.get("/products/x/offers", params={"page": 2})
+        responses.append(response)
+        await backend.aclose()
+
+    for response in responses:
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Not found"}
+        assert response.headers["content-type"] == "application/json"
+        assert str(response.request.url).endswith("/api/v1/products/x/offers?page=2")
+        with pytest.raises(httpx.HTTPStatusError):
+            response.raise_for_status()
+
+
+async def test_h11_client_raises_httpx_transport_errors(server):
+    """Tests that timeouts and refused connections surface as httpx exceptions."""
+    client = H11Client(server.base_url)
+    server.delay = 0.2
+    with pytest.raises(httpx.ReadTimeout):
+        await client.get("/products/x/offers", timeout=0.05)
+    await client.aclose()
+
+    await server.stop()
+    client = H11Client(server.base_url)
+    with pytest.raises(httpx.ConnectError):
+        await client.get("/products/x/offers")
+    offers_client = HttpxOffersClient(http_client=client, token_manager=FakeTokenManager())
+    with pytest.raises(APIError) as error:
+        await offers_client.get_offers(uuid.uuid4())
+    assert error.value.status_code == 500
+
+
+async def test_h11_client_retries_a_request_on_a_connection_the_server_closed(server):
+    """Tests that a stale keep-alive connection is replaced transparently, once."""
+    server.requests_per_connection = 1
+    client = H11Client(server.base_url)
+
+    first = await client.get("/products/x/offers")
+    second = await client.get("/products/x/offers")
+
+    assert first.status_code == second.status_code == 404
+    assert server.connections == 2
+    await client.aclose()
+
+
+async def test_h11_client_times_out_by_default_like_httpx():
+    """Tests that a request without a timeout still fails on a server that never answers."""
+    async def never_answer(reader, writer):
+        await reader.read(65536)
+        await asyncio.sleep(10)
+        writer.close()
+
+    silent = await asyncio.start_server(never_answer, "127.0.0.1", 0)
+    base_url = f"http://127.0.0.1:{silent.sockets[0].getsockname()[1]}"
+    client = H11Client(base_url, timeout=0.1)
+
+    with pytest.raises(httpx.ReadTimeout):
+        await client.get("/auth")
+    assert H11Client(base_url)._timeout == 5.0
+    await client.aclose()
+    silent.close()
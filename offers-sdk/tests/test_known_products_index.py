@@ -0,0 +1,139 @@
+import asyncio
+import json
+import os
+import uuid
+import httpx
+import pytest
+from typing import Any
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.exceptions import ProductAlreadyFoundError
+from offers_sdk_applift.index import IndexInUseError, KnownProductsIndex
+from offers_sdk_applift.models import RegisterProductRequest
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+class RegistryServer(FakeOffersServer):
+    """A stand-in API that answers 409 for products it has already registered."""
+
+    def __init__(self):
+        super().__init__()
+        self.registered = set()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        if method == "POST" and url.endswith("/products/register"):
+            self.requests.append((method, url))
+            product_id = kwargs["json"]["id"]
+            request = httpx.Request(method, f"https://api.test.com{url}")
+            if product_id in self.registered:
+                return httpx.Response(409, json={"detail": "Product already registered"}, request=request)
+            self.registered.add(product_id)
+            return httpx.Response(201, content=json.dumps({"id": product_id}), request=request)
+        return await super().request(method, url, **kwargs)
+
+
+def test_index_persists_across_compaction_and_reopen(tmp_path):
+    """Tests exact membership before and after compaction, a torn log tail and a lost bloom file."""
+    ids = [uuid.uuid4() for _ in range(250)]
+    index = KnownProductsIndex(str(tmp_path), capacity=1000, compact_after=100)
+    index.update(ids)
+    assert len(index) == 250
+    assert os.path.getsize(tmp_path / KnownProductsIndex.SORTED_FILE) == 200 * 16
+    index.close()
+
+    with open(tmp_path / KnownProductsIndex.LOG_FILE, "ab") as f:
+        f.write(b"\x01" * 7)
+    os.remove(tmp_path / KnownProductsIndex.BLOOM_FILE)
+
+    index = KnownProductsIndex(str(tmp_path), capacity=1000, compact_after=100)
+    assert all(product_id in index for product_id in ids)
+    assert sum(uuid.uuid4() in index for _ in range(1000)) == 0
+    assert len(index) == 250
+    index.close()
+
+
+
+def test_index_directory_has_a_single_writer(tmp_path, monkeypatch):
+    """Tests that a second open of the same directory fails clearly and from_credentials runs without it."""
+    index = KnownProductsIndex(str(tmp_path), capacity=1000)
+    with pytest.raises(IndexInUseError):
+        KnownProductsIndex(str(tmp_path), capacity=1000)
+
+    monkeypatch.setenv("KNOWN_PRODUCTS_INDEX_PATH", str(tmp_path))
+    assert HttpxOffersClient.from_credentials(refresh_token="dummy-token").known_products is None
+
+    index.close()
+    reopened = KnownProductsIndex(str(tmp_path), capacity=1000)
+    reopened.close()
+
+@pytest.mark.asyncio
+async def test_registration_short_circuits_for_known_products(tmp_path):
+    """Tests that known products skip the API unless the call is authoritative."""
+    server = RegistryServer()
+    index = KnownProductsIndex(str(tmp_path), capacity=1000)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager(), known_products=index)
+    new_id, remote_id = uuid.uuid4(), uuid.uuid4()
+    server.registered.add(str(remote_id))
+
+    await client.register_product(new_id, "name", "description")
+    with pytest.raises(ProductAlreadyFoundError):
+        await client.register_product(remote_id, "name", "description")
+    assert remote_id in index and new_id in index
+    calls = len(server.requests)
+
+    with pytest.raises(ProductAlreadyFoundError):
+        await client.register_product(new_id, "name", "description")
+    results = await client.register_products_bulk(
+        [
+            RegisterProductRequest(id=product_id, name="name", description="description")
+            for product_id in (new_id, remote_id)
+        ]
+    )
+    assert all(isinstance(result, ProductAlreadyFoundError) for result in results.values())
+    assert len(server.requests) == calls
+
+    with pytest.raises(ProductAlreadyFoundError):
+        await client.register_product(new_id, "name", "description", authoritative=True)
+    assert len(server.requests) == calls + 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_compaction_runs_in_the_background_without_losing_concurrent_adds(tmp_path):
+    """Tests that compaction inside an event loop is offloaded and keeps IDs added meanwhile."""
+    index = KnownProductsIndex(str(tmp_path), capacity=1000, compact_after=100)
+    first = [uuid.uuid4() for _ in range(100)]
+    index.update(first)
+    assert index._compaction is not None
+    await asyncio.sleep(0)
+    during = [uuid.uuid4() for _ in range(10)]
+    index.update(during)
+    assert all(product_id in index for product_id in first + during)
+    assert len(index) == 110
+
+    await index.aclose()
+    assert os.path.getsize(tmp_path / KnownProductsIndex.SORTED_FILE) == 100 * 16
+    assert os.path.getsize(tmp_path / KnownProductsIndex.LOG_FILE) == 10 * 16
+    reopened = KnownProductsIndex(str(tmp_path), capacity=1000, compact_after=100)
+    assert len(reopened) == 110
+    assert all(product_id in reopened for product_id in first + during)
+    reopened.close()
+
+
+def test_log_left_behind_by_an_interrupted_compaction_is_not_counted_twice(tmp_path):
+    """Tests that IDs present in both the sorted file and the log are loaded once."""
+    ids = [uuid.uuid4() for _ in range(20)]
+    index = KnownProductsIndex(str(tmp_path), capacity=1000)
+    index.update(ids)
+    log = (tmp_path / KnownProductsIndex.LOG_FILE).read_bytes()
+    index.compact()
+    index.close()
+    # Simulate a crash after the sorted file was replaced but before the log was rewritten.
+    (tmp_path / KnownProductsIndex.LOG_FILE).write_bytes(log)
+
+    index = KnownProductsIndex(str(tmp_path), capacity=1000)
+    assert len(index) == 20
+    index.update([uuid.uuid4()])
+    index.compact()
+    assert os.path.getsize(tmp_path / KnownProductsIndex.SORTED_FILE) == 21 * 16
+    index.close()
@@ -0,0 +1,112 @@
+import asyncio
+import gzip
+import uuid
+import pytest
+from typer.testing import CliRunner
+
+from offers_sdk_applift.cli import app
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.http import RecordingHttpClient, ReplayHttpClient, read_exchanges, read_recording
+from offers_sdk_applift.recording import TrafficReplayer
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+async def _record_traffic(path: str, product_ids: list) -> None:
+    """Drives some traffic through a recorder in front of the fake server."""
+    recorder = RecordingHttpClient(FakeOffersServer(latency=lambda in_flight: 0.002), path)
+    async with HttpxOffersClient(http_client=recorder, token_manager=FakeTokenManager()) as client:
+        await recorder.post("/auth", headers={"Bearer": "secret-refresh-token"})
+        for product_id in product_ids:
+            await client.register_product(product_id, "Name", "Description")
+            await client.get_offers(product_id)
+
+
+@pytest.mark.asyncio
+async def test_recording_captures_exchanges_without_tokens(tmp_path):
+    """Tests that exchanges are recorded with timing and with every token redacted."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    await _record_traffic(path, [uuid.uuid4() for _ in range(3)])
+
+    exchanges = list(read_exchanges(path))
+    raw = gzip.open(path, "rt").read()
+
+    assert len(exchanges) == 7
+    assert all(exchange.duration >= 0.002 for exchange in exchanges)
+    assert "fake-access-token" not in raw
+    assert "secret-refresh-token" not in raw
+    assert FakeTokenManager.DUMMY_TOKEN not in raw
+
+
+@pytest.mark.asyncio
+async def test_replay_serves_recorded_responses_including_unseen_ids(tmp_path):
+    """Tests that the replay transport answers from the recording, offline."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    recorded_id = uuid.uuid4()
+    await _record_traffic(path, [recorded_id])
+
+    client = HttpxOffersClient(http_client=ReplayHttpClient(path, speed=None), token_manager=FakeTokenManager())
+    recorded_offers = await client.get_offers(recorded_id)
+    unseen_offers = await client.get_offers(uuid.uuid4())
+
+    assert recorded_offers[0].price == FakeOffersServer.price_for(str(recorded_id))
+    assert unseen_offers == recorded_offers
+
+
+@pytest.mark.asyncio
+async def test_replayer_reproduces_traffic_at_speed(tmp_path):
+    """Tests that the replayer re-issues every recorded call with the recorded latency."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    await _record_traffic(path, [uuid.uuid4() for _ in range(5)])
+
+    client = HttpxOffersClient(http_client=ReplayHttpClient(path, speed=1.0), token_manager=FakeTokenManager())
+    report = await TrafficReplayer(client, path, speed=10.0).run()
+
+    assert report.requests == 10
+    assert report.errors == 0
+    assert report.p50_latency_seconds >= 0.002
+
+
+def test_cli_replay_prints_report(tmp_path):
+    """Tests that the replay command runs a recording and prints its figures."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    asyncio.run(_record_traffic(path, [uuid.uuid4()]))
+
+    result = CliRunner().invoke(app, ["replay", path, "--speed", "0"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "Throughput" in result.stdout
+
+
+
+def test_replay_keeps_redacted_tokens_out_of_the_token_cache(tmp_path, monkeypatch):
+    """Tests that replaying a recorded /auth does not overwrite the real cached access token."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    asyncio.run(_record_traffic(path, [uuid.uuid4()]))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    result = CliRunner().invoke(app, ["replay", path, "--speed", "0"])
+
+    cache_dir = tmp_path / "cache" / "offers_sdk"
+    assert result.exit_code == 0, result.stdout
+    assert not (cache_dir / "token_cache.json").exists()
+    assert (cache_dir / "token_cache_replay.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_replay_merges_per_endpoint_recordings_and_keeps_latency(tmp_path):
+    """Tests that a split recording replays as one and that arrival speed leaves latency alone."""
+    path = str(tmp_path / "traffic.jsonl.gz")
+    await _record_traffic(f"{path}.0", [uuid.uuid4() for _ in range(2)])
+    await _record_traffic(f"{path}.1", [uuid.uuid4() for _ in range(3)])
+
+    exchanges = list(read_recording(path))
+    client = HttpxOffersClient(http_client=ReplayHttpClient(path, speed=1.0), token_manager=FakeTokenManager())
+    report = await TrafficReplayer(client, path, speed=None).run()
+
+    assert len(exchanges) == 12
+    assert [exchange.offset for exchange in exchanges] == sorted(exchange.offset for exchange in exchanges)
+    assert report.requests == 10
+    assert report.p50_latency_seconds >= 0.002
+    assert len(list(read_recording(str(tmp_path / "*.gz.*")))) == 12
+    with pytest.raises(FileNotFoundError):
+        list(read_recording(str(tmp_path / "missing.jsonl.gz")))
@@ -0,0 +1,117 @@
+import uuid
+import pytest
+import httpx
+from respx import MockRouter
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.http import HttpxClient
+from offers_sdk_applift.models import RegisterProductRequest
+from offers_sdk_applift.scheduling import PollScheduler
+from tests.conftest import FakeTokenManager
+
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def polling_client() -> HttpxOffersClient:
+    """Provides a client whose poll scheduler uses millisecond intervals."""
+    return HttpxOffersClient(
+        http_client=HttpxClient(base_url="https://api.test.com"),
+        token_manager=FakeTokenManager(),
+        poll_scheduler=PollScheduler(initial_interval=0.001, max_interval=0.01),
+    )
+
+
+def _offers_after(empty_polls: int):
+    """Returns a respx side effect that serves empty lists before the offers appear."""
+    calls = {"count": 0}
+
+    def side_effect(request):
+        calls["count"] += 1
+        if calls["count"] <= empty_polls:
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, json=[{"id": str(uuid.uuid4()), "price": 10, "items_in_stock": 3}])
+
+    return side_effect
+
+
+async def test_register_and_get_offers_polls_until_offers_appear(
+    polling_client: HttpxOffersClient, respx_mock: MockRouter
+):
+    """Tests that the pipeline keeps polling through empty responses."""
+    product_id = uuid.uuid4()
+    respx_mock.post(url__regex=r".*/products/register").respond(201, json={"id": str(product_id)})
+    offers_route = respx_mock.get(f"/products/{product_id}/offers").mock(side_effect=_offers_after(3))
+
+    offers = await polling_client.register_and_get_offers(product_id, "Name", "Description")
+
+    assert len(offers) == 1
+    assert offers_route.call_count == 4
+    assert polling_client._poll_scheduler.expected_delay is not None
+
+
+async def test_register_and_get_offers_backs_off_through_throttling(
+    polling_client: HttpxOffersClient, respx_mock: MockRouter
+):
+    """Tests that 429 and 408 responses are polled through instead of failing the pipeline."""
+    product_id = uuid.uuid4()
+    respx_mock.post(url__regex=r".*/products/register").respond(201, json={"id": str(product_id)})
+    offers_route = respx_mock.get(f"/products/{product_id}/offers").mock(
+        side_effect=[
+            httpx.Response(429, json={"detail": "slow down"}),
+            httpx.Response(408, json={"detail": "timeout"}),
+            httpx.Response(200, json=[{"id": str(uuid.uuid4()), "price": 10, "items_in_stock": 3}]),
+        ]
+    )
+
+    offers = await polling_client.register_and_get_offers(product_id, "Name", "Description")
+
+    assert len(offers) == 1
+    assert offers_route.call_count == 3
+
+async def test_register_and_get_offers_treats_conflict_as_registered(
+    polling_client: HttpxOffersClient, respx_mock: MockRouter
+):
+    """Tests that a 409 on registration does not stop the pipeline."""
+    product_id = uuid.uuid4()
+    respx_mock.post(url__regex=r".*/products/register").respond(409, json={"detail": "exists"})
+    respx_mock.get(f"/products/{product_id}/offers").mock(side_effect=_offers_after(0))
+
+    offers = await polling_client.register_and_get_offers(product_id, "Name", "Description")
+
+    assert len(offers) == 1
+
+
+async def test_register_and_get_offers_returns_empty_list_on_timeout(
+    polling_client: HttpxOffersClient, respx_mock: MockRouter
+):
+    """Tests that the pipeline gives up with no offers once its deadline expires."""
+    product_id = uuid.uuid4()
+    respx_mock.post(url__regex=r".*/products/register").respond(201, json={"id": str(product_id)})
+    respx_mock.get(f"/products/{product_id}/offers").respond(200, json=[])
+
+    offers = await polling_client.register_and_get_offers(
+        product_id, "Name", "Description", timeout=0.05
+    )
+
+    assert offers == []
+    assert polling_client._poll_scheduler.pending == 0
+
+
+async def test_register_and_get_offers_bulk_shares_one_poll_scheduler(
+    polling_client: HttpxOffersClient, respx_mock: MockRouter
+):
+    """Tests that many pipelines complete concurrently on the shared scheduler."""
+    products = [
+        RegisterProductRequest(id=uuid.uuid4(), name="Name", description="Description")
+        for _ in range(50)
+    ]
+    respx_mock.post(url__regex=r".*/products/register").respond(201, json={"id": str(uuid.uuid4())})
+    for product in products:
+        respx_mock.get(f"/products/{product.id}/offers").mock(side_effect=_offers_after(2))
+
+    results = await polling_client.register_and_get_offers_bulk(products)
+
+    assert all(len(offers) == 1 for offers in results.values())
+    assert len(results) == 50
@@ -0,0 +1,103 @@
+import asyncio
+import itertools
+import time
+import uuid
+import httpx
+import pytest
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.exceptions import ProductNotFoundError
+from offers_sdk_applift.scheduling import RequestHedger
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+pytestmark = pytest.mark.asyncio
+
+
+def tail_latency(every: int, slow: float, fast: float = 0.002):
+    """Returns a latency model where every `every`-th request is slow."""
+    counter = itertools.count(1)
+    return lambda in_flight: slow if next(counter) % every == 0 else fast
+
+
+async def test_hedging_cuts_the_tail_and_cancels_losers():
+    """Tests that slow lookups are won by their hedge and the slow original is cancelled."""
+    server = FakeOffersServer(latency=tail_latency(every=25, slow=0.25))
+    hedger = RequestHedger(percentile=0.9, budget=0.1, min_samples=10)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager(), hedger=hedger)
+
+    latencies = []
+    for _ in range(200):
+        started = time.monotonic()
+        offers = await client.get_offers(uuid.uuid4())
+        latencies.append(time.monotonic() - started)
+        assert len(offers) == 1
+
+    assert hedger.wins >= 5
+    # Every race cancels its loser, whichever attempt lost.
+    assert hedger.wins <= server.cancelled <= hedger.hedged
+    assert sorted(latencies)[-3] < 0.1
+    assert client.hedger is hedger
+
+
+async def test_budget_stops_hedging_when_everything_is_slow():
+    """Tests that the hedge budget caps extra load during an incident."""
+    server = FakeOffersServer(latency=lambda in_flight: 0.002)
+    hedger = RequestHedger(percentile=0.5, budget=0.05, max_burst=2, min_samples=10)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager(), hedger=hedger)
+    for _ in range(20):
+        await client.get_offers(uuid.uuid4())
+
+    server.latency = lambda in_flight: 0.02
+    await client.get_offers_bulk([uuid.uuid4() for _ in range(100)])
+
+    assert hedger.hedged <= 2 + 0.05 * hedger.requests
+    assert hedger.throttled > 0
+    assert len(server.requests) == hedger.requests + hedger.hedged
+
+
+async def test_non_retryable_error_is_raised_without_waiting_for_the_hedge():
+    """Tests that a 404 from the original request ends the race at once and the hedge is cleaned up."""
+    server = FakeOffersServer(latency=lambda in_flight: 0.002)
+    hedger = RequestHedger(percentile=0.5, min_samples=10, min_delay=0.01)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager(), hedger=hedger)
+    await client.get_offers_bulk([uuid.uuid4() for _ in range(20)])
+
+    class MissingProductServer(FakeOffersServer):
+        """The original request answers 404 late; any hedge hangs."""
+        calls = 0
+
+        async def request(self, method, url, **kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                await asyncio.sleep(0.05)
+                return httpx.Response(404, request=httpx.Request(method, f"https://api.test.com{url}"))
+            return await super().request(method, url, **kwargs)
+
+    slow = MissingProductServer(latency=lambda in_flight: 10.0)
+    client = HttpxOffersClient(http_client=slow, token_manager=FakeTokenManager(), hedger=hedger)
+    started = time.monotonic()
+    with pytest.raises(ProductNotFoundError):
+        await client.get_offers(uuid.uuid4())
+
+    assert time.monotonic() - started < 1.0
+    assert slow.calls == 2 and slow.cancelled == 1 and slow.in_flight == 0
+
+
+async def test_cancelled_originals_keep_their_latency_in_the_window():
+    """Tests that hedge wins do not drag the hedge delay down to the hedges' own latency."""
+    hedger = RequestHedger(percentile=0.9, budget=1.0, max_burst=100, window=20, min_samples=10)
+    for _ in range(20):
+        hedger.record(0.01)
+    calls = itertools.count()
+
+    async def attempt():
+        # Every original is stuck; every hedge answers at once.
+        if next(calls) % 2 == 0:
+            await asyncio.sleep(1)
+        return "offers"
+
+    for _ in range(30):
+        assert await hedger.run(attempt) == "offers"
+
+    assert hedger.wins == 30
+    assert hedger.hedge_delay >= 0.01
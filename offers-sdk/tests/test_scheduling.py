@@ -0,0 +1,119 @@
+import asyncio
+import uuid
+import pytest
+from respx import MockRouter
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.exceptions import DeadlineExceededError
+from offers_sdk_applift.http import HttpxClient
+from offers_sdk_applift.scheduling import Deadline, Priority, RequestScheduler
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_scheduler_admits_higher_priority_first():
+    """Tests that a freed slot goes to the highest-priority waiter, not the oldest."""
+    scheduler = RequestScheduler(max_concurrency=1)
+    await scheduler.acquire()
+    admitted = []
+
+    async def wait_for_slot(name: str, priority: Priority):
+        async with scheduler.slot(priority):
+            admitted.append(name)
+
+    low = asyncio.create_task(wait_for_slot("crawler", Priority.LOW))
+    await asyncio.sleep(0)
+    high = asyncio.create_task(wait_for_slot("user", Priority.HIGH))
+    await asyncio.sleep(0)
+
+    scheduler.release()
+    await asyncio.gather(low, high)
+
+    assert admitted == ["user", "crawler"]
+    assert scheduler.in_flight == 0
+
+
+async def test_scheduler_drops_waiter_whose_deadline_expires():
+    """Tests that an expired waiter leaves the queue without taking a slot."""
+    scheduler = RequestScheduler(max_concurrency=1)
+    await scheduler.acquire()
+
+    with pytest.raises(DeadlineExceededError):
+        await scheduler.acquire(deadline=Deadline.after(0.01))
+
+    assert scheduler.queued == 0
+    scheduler.release()
+    assert scheduler.in_flight == 0
+
+
+async def test_request_is_not_sent_after_deadline_expires_in_queue(
+    offers_client: HttpxOffersClient, respx_mock: MockRouter
+):
+    """Tests that a request that can no longer finish in time is cancelled instead of sent."""
+    product_id = uuid.uuid4()
+    route = respx_mock.get(f"/products/{product_id}/offers").respond(200, json=[])
+    for _ in range(offers_client.scheduler.limit):
+        await offers_client.scheduler.acquire()
+
+    with pytest.raises(DeadlineExceededError):
+        await offers_client.get_offers(product_id, timeout=0.01)
+
+    assert not route.called
+
+
+async def test_deadline_caps_wait_for_token(respx_mock: MockRouter):
+    """Tests that the deadline also bounds time spent waiting for the access token."""
+
+    class SlowTokenManager(FakeTokenManager):
+        async def get_access_token(self) -> str:
+            await asyncio.sleep(1)
+            return self.DUMMY_TOKEN
+
+    product_id = uuid.uuid4()
+    route = respx_mock.get(f"/products/{product_id}/offers").respond(200, json=[])
+    client = HttpxOffersClient(
+        http_client=HttpxClient(base_url="https://api.test.com"),
+        token_manager=SlowTokenManager(),
+    )
+
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        await client.get_offers(product_id, timeout=0.01)
+
+    assert exc_info.value.status_code == 504
+    assert not route.called
+
+
+async def test_deadline_bounds_the_whole_http_exchange():
+    """Tests that an exchange that keeps each phase under its timeout still ends at the deadline."""
+
+    class TricklingServer(FakeOffersServer):
+        async def request(self, method, url, **kwargs):
+            # Every read makes progress within the per-phase timeout, but there are many of them.
+            for _ in range(10):
+                await asyncio.sleep(kwargs["timeout"] * 0.9)
+            return await super().request(method, url, **kwargs)
+
+    client = HttpxOffersClient(http_client=TricklingServer(), token_manager=FakeTokenManager())
+    started = asyncio.get_running_loop().time()
+
+    with pytest.raises(DeadlineExceededError):
+        await client.get_offers(uuid.uuid4(), timeout=0.1)
+
+    assert asyncio.get_running_loop().time() - started < 0.3
+
+async def test_get_offers_bulk_returns_errors_per_product(
+    offers_client: HttpxOffersClient, respx_mock: MockRouter
+):
+    """Tests that a bulk fetch returns offers or the per-product exception."""
+    found, missing = uuid.uuid4(), uuid.uuid4()
+    respx_mock.get(f"/products/{found}/offers").respond(
+        200, json=[{"id": str(uuid.uuid4()), "price": 5, "items_in_stock": 1}]
+    )
+    respx_mock.get(f"/products/{missing}/offers").respond(404)
+
+    results = await offers_client.get_offers_bulk([found, missing], priority=Priority.LOW)
+
+    assert len(results[found]) == 1
+    assert results[missing].status_code == 404
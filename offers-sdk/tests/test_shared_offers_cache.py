@@ -0,0 +1,186 @@
+import asyncio
+import multiprocessing
+import os
+import time
+import uuid
+import pytest
+
+from offers_sdk_applift.cache import SharedOffersCache
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.exceptions import DeadlineExceededError
+from offers_sdk_applift.models import Offer
+from offers_sdk_applift.scheduling import Deadline
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+def make_offers(count: int):
+    return [Offer(id=uuid.uuid4(), price=100 + i, items_in_stock=i) for i in range(count)]
+
+
+def test_cache_round_trips_offers_with_ttl_and_bounded_size(tmp_path):
+    """Tests binary round trips, expiry, oversized entries and that the file never grows."""
+    path = str(tmp_path / "offers.cache")
+    cache = SharedOffersCache(path, slots=8, slot_size=256, ttl=0.05)
+    product_id, offers = uuid.uuid4(), make_offers(3)
+
+    assert cache.put(product_id, offers)
+    assert SharedOffersCache(path, slots=8, slot_size=256).get(product_id) == offers
+    assert cache.put(uuid.uuid4(), []) and not cache.put(uuid.uuid4(), make_offers(20))
+    size = os.path.getsize(path)
+    for _ in range(100):
+        cache.put(uuid.uuid4(), make_offers(1))
+    assert os.path.getsize(path) == size
+
+    time.sleep(0.06)
+    assert cache.get(product_id) is None
+    with pytest.raises(ValueError):
+        SharedOffersCache(path, slots=16, slot_size=256)
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_client_serves_get_offers_from_cache_with_one_fetch(tmp_path):
+    """Tests that concurrent lookups of a product in one process make a single call."""
+    server = FakeOffersServer(latency=lambda in_flight: 0.01)
+    cache = SharedOffersCache(str(tmp_path / "offers.cache"), slots=64)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager(), offers_cache=cache)
+    product_id = uuid.uuid4()
+
+    results = await asyncio.gather(*(client.get_offers(product_id) for _ in range(20)))
+    again = await client.get_offers(product_id)
+
+    assert len(server.requests) == 1
+    assert all(result == results[0] for result in results) and again == results[0]
+    assert client.offers_cache.fetches == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_and_stream_lookups_are_served_from_cache(tmp_path):
+    """Tests that get_offers_bulk and stream_offers go through the offers cache too."""
+    server = FakeOffersServer(latency=lambda in_flight: 0.001)
+    cache = SharedOffersCache(str(tmp_path / "offers.cache"), slots=64)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager(), offers_cache=cache)
+    product_ids = [uuid.uuid4() for _ in range(5)]
+
+    async def ids():
+        for product_id in product_ids:
+            yield product_id
+
+    bulk = await client.get_offers_bulk(product_ids)
+    streamed = dict([result async for result in client.stream_offers(ids())])
+
+    assert len(server.requests) == len(product_ids)
+    assert streamed == bulk
+    assert cache.hits == len(product_ids)
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_refresh_hands_over_to_waiting_callers(tmp_path):
+    """Tests that cancelling the caller that is fetching does not cancel the ones waiting on it."""
+    cache = SharedOffersCache(str(tmp_path / "offers.cache"), slots=64)
+    product_id, offers = uuid.uuid4(), make_offers(2)
+
+    async def stuck():
+        await asyncio.sleep(10)
+
+    async def fetch():
+        return offers
+
+    leader = asyncio.create_task(cache.get_or_fetch(product_id, stuck))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(cache.get_or_fetch(product_id, fetch))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await asyncio.wait_for(follower, 1) == offers
+    assert leader.cancelled()
+    assert cache.get(product_id) == offers
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_another_process_refresh_honours_deadline(tmp_path):
+    """Tests that a caller waiting on another process's claim gives up at its deadline, not lock_timeout."""
+    path = str(tmp_path / "offers.cache")
+    holder, waiter = SharedOffersCache(path, slots=64), SharedOffersCache(path, slots=64, lock_timeout=5)
+    product_id = uuid.uuid4()
+
+    async def stuck():
+        await asyncio.sleep(10)
+
+    claim = asyncio.create_task(holder.get_or_fetch(product_id, stuck))
+    await asyncio.sleep(0.01)
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        await waiter.get_or_fetch(product_id, stuck, Deadline.after(0.2))
+
+    assert time.monotonic() - started < 1
+    assert waiter.fetches == 0
+    claim.cancel()
+    holder.close()
+    waiter.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_to_a_full_bucket_do_not_evict_a_live_claim(tmp_path):
+    """Tests that other keys written to a full bucket evict cached entries before an in-progress refresh."""
+    path = str(tmp_path / "offers.cache")
+    holder, waiter = SharedOffersCache(path, slots=4), SharedOffersCache(path, slots=4)
+    product_id = uuid.uuid4()
+
+    async def stuck():
+        await asyncio.sleep(10)
+
+    claim = asyncio.create_task(holder.get_or_fetch(product_id, stuck))
+    await asyncio.sleep(0.01)
+    for _ in range(8):
+        assert waiter.put(uuid.uuid4(), make_offers(1))
+
+    with pytest.raises(DeadlineExceededError):
+        await waiter.get_or_fetch(product_id, stuck, Deadline.after(0.05))
+    assert waiter.fetches == 0
+    claim.cancel()
+    holder.close()
+    waiter.close()
+
+
+def _worker(path: str, product_ids, fetch_log: str) -> None:
+    cache = SharedOffersCache(path, slots=1024)
+
+    async def fetch(product_id):
+        with open(fetch_log, "a") as f:
+            f.write(f"{product_id}\n")
+        await asyncio.sleep(0.05)
+        return [Offer(id=product_id, price=FakeOffersServer.price_for(str(product_id)), items_in_stock=1)]
+
+    async def main():
+        results = await asyncio.gather(
+            *(
+                cache.get_or_fetch(product_id, lambda product_id=product_id: fetch(product_id))
+                for product_id in product_ids
+            )
+        )
+        assert all(offers[0].id == product_id for offers, product_id in zip(results, product_ids))
+
+    asyncio.run(main())
+    cache.close()
+
+
+def test_forked_workers_share_one_fetch_per_hot_product(tmp_path):
+    """Tests that N processes looking up the same hot products make about one fetch per product."""
+    path, fetch_log = str(tmp_path / "offers.cache"), str(tmp_path / "fetches.log")
+    SharedOffersCache(path, slots=1024).close()
+    product_ids = [uuid.uuid4() for _ in range(20)]
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_worker, args=(path, product_ids, fetch_log)) for _ in range(6)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    fetched = open(fetch_log).read().split()
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert set(fetched) == {str(product_id) for product_id in product_ids}
+    assert len(fetched) == len(product_ids)
@@ -0,0 +1,60 @@
+import asyncio
+import uuid
+import pytest
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _ids(count: int, pulled: list):
+    """An async source of product IDs that records how many were pulled."""
+    for _ in range(count):
+        product_id = uuid.uuid4()
+        pulled.append(product_id)
+        yield product_id
+
+
+async def test_stream_offers_bounds_in_flight_requests():
+    """Tests that IDs are only pulled as capacity frees up."""
+    server = FakeOffersServer(latency=lambda in_flight: 0.001)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager())
+    pulled = []
+
+    results = [item async for item in client.stream_offers(_ids(200, pulled), concurrency=8)]
+
+    assert len(results) == 200
+    assert server.max_in_flight == 8
+    assert all(len(offers) == 1 for _, offers in results)
+
+
+async def test_stream_offers_preserves_input_order_when_ordered():
+    """Tests that ordered mode yields results in input order despite random latency."""
+    server = FakeOffersServer(latency=lambda in_flight: uuid.uuid4().int % 5 / 1000)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager())
+    pulled = []
+
+    results = [
+        product_id
+        async for product_id, _ in client.stream_offers(_ids(100, pulled), concurrency=10, ordered=True)
+    ]
+
+    assert results == pulled
+
+
+async def test_closing_stream_cancels_in_flight_requests():
+    """Tests that an abandoned stream cancels its requests and stops pulling IDs."""
+    server = FakeOffersServer(latency=lambda in_flight: 0.001 if in_flight == 1 else 10)
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager())
+    pulled = []
+
+    stream = client.stream_offers(_ids(1000, pulled), concurrency=4)
+    await stream.__anext__()
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert server.in_flight == 0
+    assert server.cancelled > 0
+    assert len(pulled) < 10
@@ -1,9 +1,11 @@
+import asyncio
 import uuid
 
 from unittest.mock import AsyncMock
 
 from offers_sdk_applift.clients import SyncOffersClient, HttpxOffersClient
 from offers_sdk_applift.interfaces import OffersClientInterface
+from tests.conftest import FakeOffersServer, FakeTokenManager
 
 
 def test_sync_client_factory_creates_correct_types():
@@ -36,3 +38,27 @@ def test_get_offers_delegates_to_async_client(mocker):
     # 4. Assert: Check that the corresponding ASYNC method on our mock
     #    was called exactly once with the correct arguments.
     mock_async_client.get_offers.assert_awaited_once_with(product_id=product_id)
+
+
+def test_sync_client_runs_every_call_on_one_event_loop():
+    """Tests that connections warmed up by one call are usable by the next."""
+
+    class LoopBoundServer(FakeOffersServer):
+        """Fails like a pooled connection would if used from another event loop."""
+        loop = None
+
+        async def request(self, method, url, **kwargs):
+            loop = asyncio.get_running_loop()
+            if self.loop is not None and loop is not self.loop:
+                raise RuntimeError("Event loop is closed")
+            self.loop = loop
+            return await super().request(method, url, **kwargs)
+
+    server = LoopBoundServer()
+    async_client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager())
+    with SyncOffersClient(async_client=async_client) as sync_client:
+        sync_client.warmup(connections=2)
+        offers = sync_client.get_offers(uuid.uuid4())
+
+    assert len(offers) == 1
+    assert server.loop.is_closed()
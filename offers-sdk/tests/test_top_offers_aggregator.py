@@ -0,0 +1,90 @@
+import asyncio
+import uuid
+import pytest
+
+from offers_sdk_applift.aggregation import TopOffersAggregator
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.models import Offer
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+def _offer(price: int, items_in_stock: int = 1) -> Offer:
+    return Offer(id=uuid.uuid4(), price=price, items_in_stock=items_in_stock)
+
+
+def test_top_applies_stock_and_price_filters():
+    """Tests that out-of-stock and out-of-range offers never enter the ranking."""
+    aggregator = TopOffersAggregator(k=3, min_price=10, max_price=100)
+    product_id = uuid.uuid4()
+
+    aggregator.update(product_id, [_offer(5), _offer(50), _offer(20, items_in_stock=0), _offer(200), _offer(30)])
+
+    assert [ranked.offer.price for ranked in aggregator.top()] == [30, 50]
+
+
+def test_top_matches_full_sort_across_incremental_refreshes():
+    """Tests that incremental updates agree with recomputing from scratch."""
+    aggregator = TopOffersAggregator(k=5)
+    products = {uuid.uuid4(): [_offer(price) for price in range(i, 100, 7)] for i in range(10)}
+    for product_id, offers in products.items():
+        aggregator.update(product_id, offers)
+
+    cheapest_product = next(iter(products))
+    products[cheapest_product] = [_offer(1000)]
+    aggregator.update(cheapest_product, products[cheapest_product])
+    products[uuid.uuid4()] = [_offer(3)]
+    aggregator.update(*list(products.items())[-1])
+
+    expected = sorted(
+        (offer.price for offers in products.values() for offer in offers)
+    )[:5]
+    assert [ranked.offer.price for ranked in aggregator.top()] == expected
+
+
+def test_update_reports_whether_ranking_changed():
+    """Tests that refreshing a product outside the top K is a cheap no-op."""
+    aggregator = TopOffersAggregator(k=1)
+    cheap, expensive = uuid.uuid4(), uuid.uuid4()
+    aggregator.update(cheap, [_offer(1)])
+
+    assert aggregator.update(expensive, [_offer(50)]) is False
+    assert aggregator.update(expensive, [_offer(0)]) is True
+    assert aggregator.top()[0].product_id == expensive
+
+
+def test_improving_a_ranked_product_updates_in_place():
+    """Tests that cheaper offers for a ranked product skip the full merge and stay exact."""
+    aggregator = TopOffersAggregator(k=3)
+    first, second = uuid.uuid4(), uuid.uuid4()
+    aggregator.update(first, [_offer(10), _offer(40)])
+    aggregator.update(second, [_offer(20), _offer(30)])
+    aggregator.top()
+
+    assert aggregator.update(first, [_offer(5), _offer(25)]) is True
+    assert aggregator._top is not None
+    assert [ranked.offer.price for ranked in aggregator.top()] == [5, 20, 25]
+
+    assert aggregator.update(first, [_offer(50)]) is True
+    assert [ranked.offer.price for ranked in aggregator.top()] == [20, 30, 50]
+
+
+@pytest.mark.asyncio
+async def test_refresh_returns_early_without_waiting_for_slow_products():
+    """Tests that a slow product does not hold up the ranking past the timeout."""
+    slow_product = uuid.UUID(int=0)
+    server = FakeOffersServer(latency=lambda in_flight: 0.001)
+    original_request = server.request
+
+    async def request(method, url, **kwargs):
+        if str(slow_product) in url:
+            await asyncio.sleep(10)
+        return await original_request(method, url, **kwargs)
+
+    server.request = request
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager())
+    product_ids = [slow_product, *(uuid.uuid4() for _ in range(20))]
+
+    top = await TopOffersAggregator(k=5).refresh(client, product_ids, concurrency=5, timeout=0.5)
+
+    assert len(top) == 5
+    assert all(ranked.product_id != slow_product for ranked in top)
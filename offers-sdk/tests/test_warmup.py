@@ -0,0 +1,96 @@
+import httpx
+import pytest
+from typing import Any
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.exceptions import AuthenticationError
+from offers_sdk_applift.http import Endpoint, EndpointRouter
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+pytestmark = pytest.mark.asyncio
+
+
+class CountingTokenManager(FakeTokenManager):
+    def __init__(self):
+        self.calls = 0
+
+    async def get_access_token(self) -> str:
+        self.calls += 1
+        return self.DUMMY_TOKEN
+
+
+class UnreachableServer(FakeOffersServer):
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        raise httpx.ConnectError("connection refused")
+
+
+async def test_warmup_fetches_token_and_opens_connections_in_parallel():
+    """Tests that warmup issues all connection requests concurrently and reports timings."""
+    server = FakeOffersServer(latency=lambda in_flight: 0.01)
+    token_manager = CountingTokenManager()
+    client = HttpxOffersClient(http_client=server, token_manager=token_manager)
+
+    report = await client.warmup(connections=8)
+
+    assert token_manager.calls == 1
+    assert server.max_in_flight == 8
+    assert [method for method, _ in server.requests] == ["HEAD"] * 8
+    assert report.ready
+    assert report.connections_opened == 8
+    assert 0.01 <= report.connect_seconds <= report.total_seconds < 0.08
+    assert client.warmup_report is report
+
+
+async def test_warmup_covers_every_routed_endpoint():
+    """Tests that each regional endpoint is warmed with its own token manager."""
+    eu, us = FakeOffersServer(), UnreachableServer()
+    eu_tokens, shared_tokens = CountingTokenManager(), CountingTokenManager()
+    router = EndpointRouter([Endpoint("https://eu", eu, eu_tokens), Endpoint("https://us", us)])
+    client = HttpxOffersClient(http_client=eu, token_manager=shared_tokens, router=router)
+
+    report = await client.warmup(connections=3)
+
+    assert eu_tokens.calls == shared_tokens.calls == 1
+    by_url = {endpoint.base_url: endpoint for endpoint in report.endpoints}
+    assert by_url["https://eu"].connections_opened == 3
+    assert by_url["https://us"].connections_failed == 3
+    assert not report.ready
+
+
+async def test_context_manager_warms_up_when_configured():
+    """Tests that entering the client runs warmup only when warmup_connections is set."""
+    server = FakeOffersServer()
+
+    async with HttpxOffersClient(http_client=server, token_manager=FakeTokenManager()) as client:
+        assert client.warmup_report is None
+
+    async with HttpxOffersClient(
+        http_client=server, token_manager=FakeTokenManager(), warmup_connections=4
+    ) as client:
+        assert client.warmup_report.connections_opened == 4
+
+
+async def test_failed_warmup_closes_the_client_and_zero_connections_is_honoured():
+    """Tests that a warmup error on entry closes the transport, and that 0 opens no connections."""
+
+    class ClosingServer(FakeOffersServer):
+        closed = False
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    class RejectedTokenManager(FakeTokenManager):
+        async def get_access_token(self) -> str:
+            raise AuthenticationError("Failed to refresh token")
+
+    server = ClosingServer()
+    with pytest.raises(AuthenticationError):
+        async with HttpxOffersClient(
+            http_client=server, token_manager=RejectedTokenManager(), warmup_connections=2
+        ):
+            pass
+    assert server.closed
+
+    server = FakeOffersServer()
+    report = await HttpxOffersClient(http_client=server, token_manager=FakeTokenManager()).warmup(connections=0)
+    assert report.connections_opened == 0 and server.requests == []
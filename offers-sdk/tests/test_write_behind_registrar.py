@@ -0,0 +1,155 @@
+import asyncio
+import json
+import uuid
+import httpx
+import pytest
+
+from offers_sdk_applift.clients import HttpxOffersClient
+from offers_sdk_applift.exceptions import AuthenticationError
+from offers_sdk_applift.journal import RegistrationJournal, WriteBehindRegistrar
+from offers_sdk_applift.models import RegisterProductRequest
+from tests.conftest import FakeOffersServer, FakeTokenManager
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class FlakyOffersServer(FakeOffersServer):
+    """A fake server that can be taken down, and that answers 409 for known products."""
+
+    def __init__(self):
+        super().__init__()
+        self.down = False
+        self.rate_limited = 0
+        self.registered = []
+
+    async def request(self, method, url, **kwargs):
+        request = httpx.Request(method, f"https://api.test.com{url}")
+        if self.down:
+            return httpx.Response(503, request=request)
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return httpx.Response(429, request=request)
+        if url.endswith("/products/register"):
+            product_id = kwargs["json"]["id"]
+            if product_id in self.registered:
+                return httpx.Response(409, json={"detail": "exists"}, request=request)
+            self.registered.append(product_id)
+        return await super().request(method, url, **kwargs)
+
+
+def _registrar(server: FakeOffersServer, journal_dir) -> WriteBehindRegistrar:
+    client = HttpxOffersClient(http_client=server, token_manager=FakeTokenManager())
+    return WriteBehindRegistrar(client, str(journal_dir), retry_interval=0.01, checkpoint_interval=0.01)
+
+
+async def test_registrations_are_flushed_in_the_background(tmp_path):
+    """Tests that register_product returns before the API call and is flushed later."""
+    server = FlakyOffersServer()
+    product_ids = [uuid.uuid4() for _ in range(20)]
+
+    async with _registrar(server, tmp_path) as registrar:
+        for product_id in product_ids:
+            product = await registrar.register_product(product_id, "Name", "Description")
+            assert product.id == product_id
+        await registrar.drain(timeout=5)
+
+        assert registrar.queue_depth == 0
+        assert registrar.flush_lag_seconds == 0.0
+        assert registrar.flushed == 20
+    assert sorted(server.registered) == sorted(str(product_id) for product_id in product_ids)
+
+
+async def test_pending_registrations_survive_outage_and_restart_without_duplicates(tmp_path):
+    """Tests that a restart resumes unflushed entries and skips completed ones."""
+    server = FlakyOffersServer()
+    async with _registrar(server, tmp_path) as registrar:
+        await registrar.register_product(uuid.uuid4(), "Flushed", "Before the outage")
+        await registrar.drain(timeout=5)
+        server.down = True
+        for _ in range(5):
+            await registrar.register_product(uuid.uuid4(), "Pending", "During the outage")
+        assert registrar.queue_depth == 5
+        assert registrar.flush_lag_seconds > 0
+
+    server.down = False
+    async with _registrar(server, tmp_path) as registrar:
+        assert registrar.queue_depth == 5
+        await registrar.drain(timeout=5)
+
+    assert len(server.registered) == 6
+    assert len(set(server.registered)) == 6
+
+
+async def test_already_registered_product_counts_as_flushed(tmp_path):
+    """Tests that a 409 completes the entry instead of retrying or failing it."""
+    server = FlakyOffersServer()
+    product_id = uuid.uuid4()
+    server.registered.append(str(product_id))
+
+    async with _registrar(server, tmp_path) as registrar:
+        await registrar.register_product(product_id, "Name", "Description")
+        await registrar.drain(timeout=5)
+
+        assert registrar.flushed == 1
+        assert registrar.failed == 0
+
+
+async def test_rate_limited_registrations_are_retried_and_auth_failures_are_permanent(tmp_path):
+    """Tests that 429s are retried rather than failed, and a rejected token fails without looping."""
+    server = FlakyOffersServer()
+    server.rate_limited = 3
+    async with _registrar(server, tmp_path) as registrar:
+        with pytest.raises(RuntimeError):
+            await WriteBehindRegistrar(registrar._client, str(tmp_path / "unstarted")).register_product(
+                uuid.uuid4(), "Name", "Description"
+            )
+        await registrar.register_product(uuid.uuid4(), "Name", "Description")
+        await registrar.drain(timeout=5)
+        assert (registrar.flushed, registrar.failed) == (1, 0)
+
+    class RejectedTokenManager(FakeTokenManager):
+        async def get_access_token(self) -> str:
+            raise AuthenticationError("Failed to refresh token: invalid refresh token")
+
+    client = HttpxOffersClient(http_client=server, token_manager=RejectedTokenManager())
+    async with WriteBehindRegistrar(client, str(tmp_path), retry_interval=0.01) as registrar:
+        await registrar.register_product(uuid.uuid4(), "Name", "Description")
+        await registrar.drain(timeout=5)
+        assert (registrar.flushed, registrar.failed) == (0, 1)
+    failed = json.loads((tmp_path / WriteBehindRegistrar.FAILED_FILE).read_text())
+    assert failed["status_code"] == 401
+
+
+async def test_cancelled_append_does_not_hold_back_the_watermark(tmp_path):
+    """Tests that an append cancelled before its fsync is dropped and later entries still compact."""
+    journal = RegistrationJournal(str(tmp_path), fsync_interval=0.05)
+    append = asyncio.create_task(
+        journal.append(RegisterProductRequest(id=uuid.uuid4(), name="Name", description="Cancelled"))
+    )
+    await asyncio.sleep(0)
+    append.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await append
+    seq = await journal.append(RegisterProductRequest(id=uuid.uuid4(), name="Name", description="Kept"))
+    journal.mark_done(seq)
+    await journal.aclose()
+
+    reopened = RegistrationJournal(str(tmp_path))
+    assert reopened.recovered == []
+    assert json.loads((tmp_path / RegistrationJournal.CHECKPOINT_FILE).read_text())["watermark"] == seq
+    await reopened.aclose()
+
+
+async def test_journal_recovers_from_torn_last_entry(tmp_path):
+    """Tests that a partially written entry from a crash is discarded on open."""
+    journal = RegistrationJournal(str(tmp_path))
+    await journal.append(RegisterProductRequest(id=uuid.uuid4(), name="Name", description="Description"))
+    await journal.aclose()
+    with open(tmp_path / RegistrationJournal.JOURNAL_FILE, "ab") as f:
+        f.write(json.dumps({"seq": 2, "id": str(uuid.uuid4())}).encode()[:20])
+
+    recovered = RegistrationJournal(str(tmp_path))
+
+    assert [seq for seq, _ in recovered.recovered] == [1]
+    await recovered.aclose()